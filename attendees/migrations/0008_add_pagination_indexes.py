@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("attendees", "0007_convert_ids_to_uuid"),
+        ("events", "0008_add_cfp_fields_to_event"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["created_at", "id"], name="attendance_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("attendees", "0008_add_pagination_indexes"),
+        ("events", "0012_event_start_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(fields=["email"], name="attendance_email_idx"),
+        ),
+    ]
@@ -58,6 +58,16 @@ class Attendance(TimeStampedModel):
     is_verified = models.BooleanField(default=False)
     is_given_feedback = models.BooleanField(default=False)
 
+    class Meta:
+        """Meta options."""
+
+        indexes = [
+            # keyset pagination of the attendance list (base.pagination)
+            models.Index(fields=["created_at", "id"], name="attendance_created_id_idx"),
+            # flagging an attendee's attendances once their feedback is in
+            models.Index(fields=["email"], name="attendance_email_idx"),
+        ]
+
     def __str__(self):
         """Str method."""
         return f"{self.email} attended {self.event}"
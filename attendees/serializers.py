@@ -4,9 +4,10 @@ from drf_writable_nested.serializers import WritableNestedModelSerializer
 from rest_framework import serializers
 
 from attendees.models import Attendance, AttendeeProfile, AttendeeSocialLinks
+from base.middleware import TimedSerializerMixin
 
 
-class AttendeeSocialLinksSerializer(serializers.ModelSerializer):
+class AttendeeSocialLinksSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """attendee social links serializer."""
 
     class Meta:
@@ -16,7 +17,7 @@ class AttendeeSocialLinksSerializer(serializers.ModelSerializer):
         exclude = ["created_at", "updated_at", "attendee"]
 
 
-class AttendeeProfileSerializer(WritableNestedModelSerializer):
+class AttendeeProfileSerializer(TimedSerializerMixin, WritableNestedModelSerializer):
     """attendee serializer."""
 
     social_links = AttendeeSocialLinksSerializer(many=True, read_only=True)
@@ -28,7 +29,7 @@ class AttendeeProfileSerializer(WritableNestedModelSerializer):
         exclude = ["created_at", "updated_at"]
 
 
-class AttendanceSerializer(serializers.ModelSerializer):
+class AttendanceSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """attendance serializer."""
 
     class Meta:
@@ -38,13 +39,13 @@ class AttendanceSerializer(serializers.ModelSerializer):
         fields = ["username", "email", "is_given_feedback"]
 
 
-class VerifyAttendeeSerializer(serializers.Serializer):
+class VerifyAttendeeSerializer(TimedSerializerMixin, serializers.Serializer):
     """verify attendee serializer."""
 
     email = serializers.EmailField(required=True)
 
 
-class FileUploadSerializer(serializers.Serializer):
+class FileUploadSerializer(TimedSerializerMixin, serializers.Serializer):
     """file upload serializer."""
 
     file = serializers.FileField(required=True)
@@ -19,6 +19,7 @@ from attendees.serializers import (
     FileUploadSerializer,
     VerifyAttendeeSerializer,
 )
+from base.pagination import CursorPaginationMixin, cursor_paginated
 from base.permissions import IsOrganizationAdmin, IsOrganizationOrganizer
 from base.utils import FileHandler
 from events.models import Event
@@ -82,16 +83,17 @@ def verify_attendee(request):
     )
 
 
-class CreateAttendanceByFileUploadView(APIView):
+class CreateAttendanceByFileUploadView(CursorPaginationMixin, APIView):
     """Attendee list create view."""
 
     permission_classes = [IsOrganizationAdmin]
 
+    @extend_schema(responses=cursor_paginated(AttendanceSerializer))
     def get(self, request):
-        """Return all attendance objects."""
-        attendance = Attendance.objects.all()
+        """Return attendance objects, newest first, one page at a time."""
+        attendance = self.paginate_queryset(Attendance.objects.all())
         serializer = AttendanceSerializer(attendance, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.get_paginated_response(serializer.data)
 
     @extend_schema(request=AttendanceSerializer, responses=AttendanceSerializer)
     def post(self, request):
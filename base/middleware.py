@@ -0,0 +1,184 @@
+"""base request performance instrumentation.
+
+``RequestPerfMiddleware`` samples a share of requests (``PERF_SAMPLE_RATE``)
+and records, per resolved URL name, the SQL query count, time spent in the
+database, time spent serializing (``TimedSerializerMixin``, shared by the
+project's serializers), time spent rendering the response body
+(``TimedJSONRenderer``, the default DRF JSON renderer) and the wall time.
+Samples are kept in a bounded in-process ring buffer (``recorder``) and
+summarised by the staff-only ``/api/_debug/perf/`` endpoint. Unsampled
+requests only pay for one ``random()`` call per request and one context
+variable lookup per serialized object.
+"""
+
+import random
+import threading
+from collections import deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+from time import perf_counter
+
+import numpy as np
+from django.conf import settings
+from django.db import connections
+from rest_framework.renderers import JSONRenderer
+
+METRICS = ("queries", "db_ms", "serializer_ms", "render_ms", "total_ms")
+PERCENTILES = (50, 90, 99)
+
+_current = ContextVar("request_perf_metrics", default=None)
+
+
+class RequestMetrics:
+    """Counters collected while handling one sampled request."""
+
+    __slots__ = (
+        "queries",
+        "db_time",
+        "serializer_time",
+        "serializer_depth",
+        "render_time",
+    )
+
+    def __init__(self):
+        """Start every counter at zero."""
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        # nesting of timed to_representation calls; only the outermost counts
+        self.serializer_depth = 0
+        self.render_time = 0.0
+
+    def time_query(self, execute, sql, params, many, context):
+        """``execute_wrapper`` hook counting and timing each query."""
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += perf_counter() - start
+            self.queries += 1
+
+
+class PerfRecorder:
+    """Thread-safe ring buffer of request samples for this process."""
+
+    def __init__(self, size: int):
+        """Keep at most ``size`` samples, dropping the oldest."""
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, view: str, method: str, values: tuple) -> None:
+        """Store one sample; ``values`` follow the order of ``METRICS``."""
+        with self._lock:
+            self._samples.append((view, method, values))
+
+    def clear(self) -> None:
+        """Drop every stored sample."""
+        with self._lock:
+            self._samples.clear()
+
+    def report(self) -> list:
+        """Return per-view sample counts and metric percentiles, slowest first."""
+        with self._lock:
+            samples = list(self._samples)
+        grouped = {}
+        for view, method, values in samples:
+            grouped.setdefault((view, method), []).append(values)
+
+        rows = []
+        for (view, method), values in grouped.items():
+            table = np.asarray(values, dtype=float)
+            quantiles = np.percentile(table, PERCENTILES, axis=0)
+            row = {"view": view, "method": method, "count": len(values)}
+            for column, metric in enumerate(METRICS):
+                row[metric] = {
+                    f"p{pct}": round(float(quantiles[index, column]), 2)
+                    for index, pct in enumerate(PERCENTILES)
+                }
+            rows.append(row)
+        rows.sort(key=lambda row: row["total_ms"]["p90"], reverse=True)
+        return rows
+
+
+recorder = PerfRecorder(settings.PERF_BUFFER_SIZE)
+
+
+class TimedSerializerMixin:
+    """Serializer mixin adding ``to_representation`` time to the request's metrics.
+
+    Nested and listed serializers run inside their parent's call, so only the
+    outermost one is timed. Queries run while serializing count towards both
+    ``db_ms`` and ``serializer_ms``.
+    """
+
+    def to_representation(self, instance):
+        """Represent ``instance``, timing it when the request is sampled."""
+        metrics = _current.get()
+        if metrics is None or metrics.serializer_depth:
+            return super().to_representation(instance)
+        metrics.serializer_depth += 1
+        start = perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializer_time += perf_counter() - start
+            metrics.serializer_depth -= 1
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` adding its render time to the sampled request's metrics."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render ``data``, timing it when the request is sampled."""
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        start = perf_counter()
+        try:
+            return super().render(data, accepted_media_type, renderer_context)
+        finally:
+            metrics.render_time += perf_counter() - start
+
+
+class RequestPerfMiddleware:
+    """Sample per-view query counts and timings into ``recorder``."""
+
+    def __init__(self, get_response):
+        """Wrap ``get_response``."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Handle the request, instrumenting it when sampled."""
+        if random.random() >= settings.PERF_SAMPLE_RATE:
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.time_query))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total = perf_counter() - start
+
+        match = request.resolver_match
+        values = (
+            metrics.queries,
+            metrics.db_time * 1000,
+            metrics.serializer_time * 1000,
+            metrics.render_time * 1000,
+            total * 1000,
+        )
+        recorder.record(
+            match.view_name if match else "<unresolved>", request.method, values
+        )
+        if settings.PERF_SERVER_TIMING:
+            response["Server-Timing"] = (
+                f'db;dur={values[1]:.1f};desc="{metrics.queries} queries", '
+                f"serializer;dur={values[2]:.1f}, render;dur={values[3]:.1f}, "
+                f"total;dur={values[4]:.1f}"
+            )
+        return response
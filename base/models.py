@@ -1,8 +1,10 @@
 """base models."""
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils import timezone
 
+from base.slugs import allocate_unique_slug
+
 
 class TimeStampedModel(models.Model):
     """time stamped model."""
@@ -26,3 +28,46 @@ class SocialLinks(TimeStampedModel):
         """meta options."""
 
         abstract = True
+
+
+class UniqueSlugMixin:
+    """Fill an empty ``slug`` with a unique value on first save.
+
+    Models implement ``get_slug_source`` and must have a unique ``slug``
+    field; ``reserved_slugs`` lists slugs that must never be allocated. Slugs are allocated by ``base.slugs.allocate_unique_slug``; when a
+    concurrent save takes the same slug first, a new one is allocated.
+    """
+
+    slug_fallback = "item"
+    reserved_slugs = frozenset()
+    slug_allocation_attempts = 5
+
+    def get_slug_source(self) -> str:
+        """Return the text the slug is built from."""
+        raise NotImplementedError
+
+    def save(self, *args, **kwargs):
+        """Allocate a slug when empty, retrying if another save claims it."""
+        if self.slug:
+            return super().save(*args, **kwargs)
+        empty = self.slug
+        for attempt in range(self.slug_allocation_attempts):
+            self.slug = allocate_unique_slug(
+                type(self),
+                self.get_slug_source(),
+                fallback=self.slug_fallback,
+                exclude_pk=self.pk,
+            )
+            try:
+                with transaction.atomic():
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                slug_taken = (
+                    type(self)
+                    ._default_manager.filter(slug=self.slug)
+                    .exclude(pk=self.pk)
+                    .exists()
+                )
+                if not slug_taken or attempt == self.slug_allocation_attempts - 1:
+                    self.slug = empty
+                    raise
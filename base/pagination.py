@@ -0,0 +1,158 @@
+"""base pagination."""
+
+import base64
+import binascii
+import json
+from functools import cache, reduce
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from drf_spectacular.utils import inline_serializer
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination:
+    """Keyset (seek) pagination over a fixed, unique ordering.
+
+    The cursor encodes the ordering values of the last row on a page, and the
+    next page is fetched with a ``WHERE (a, b) > (x, y)`` style filter instead
+    of an OFFSET, so page cost stays the same however deep the client goes.
+    The last field in ``ordering`` must be unique (usually the primary key).
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor."
+
+    def __init__(self, ordering, page_size=None, max_page_size=None):
+        """Set the ordering and page size limits."""
+        self.ordering = tuple(ordering)
+        self.page_size = page_size or settings.CURSOR_PAGINATION_PAGE_SIZE
+        self.max_page_size = max_page_size or settings.CURSOR_PAGINATION_MAX_PAGE_SIZE
+        self.next_cursor = None
+        self.request = None
+
+    def get_page_size(self, request) -> int:
+        """Return the requested page size, clamped to ``max_page_size``."""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def encode_cursor(self, values) -> str:
+        """Encode the ordering values of a row as an opaque cursor."""
+        payload = json.dumps([str(value) for value in values])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor, model) -> list:
+        """Decode a cursor back into python values for the ordering fields."""
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(raw, list) or len(raw) != len(self.ordering):
+                raise ValueError
+            return [
+                model._meta.get_field(name.lstrip("-")).to_python(value)
+                for name, value in zip(self.ordering, raw, strict=True)
+            ]
+        except (binascii.Error, ValueError, ValidationError, UnicodeDecodeError):
+            raise NotFound(self.invalid_cursor_message) from None
+
+    def _seek_filter(self, values) -> Q:
+        """Build the filter selecting rows that sort after ``values``.
+
+        The leading ``<=``/``>=`` bound on the first field lets the database
+        seek into the composite index before applying the tie-breakers.
+        """
+        clauses = []
+        for i, name in enumerate(self.ordering):
+            field = name.lstrip("-")
+            lookup = "lt" if name.startswith("-") else "gt"
+            equal = {
+                prev.lstrip("-"): value
+                for prev, value in zip(self.ordering[:i], values, strict=False)
+            }
+            clauses.append(Q(**equal, **{f"{field}__{lookup}": values[i]}))
+        first = self.ordering[0]
+        bound = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{bound}": values[0]}) & reduce(
+            lambda a, b: a | b, clauses
+        )
+
+    def paginate_queryset(self, queryset, request) -> list:
+        """Return a single page of ``queryset`` for ``request``."""
+        self.request = request
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, queryset.model)
+            queryset = queryset.filter(self._seek_filter(values))
+
+        # fetch one extra row to learn whether there is a next page
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+        if len(rows) > page_size:
+            last = page[-1]
+            self.next_cursor = self.encode_cursor(
+                getattr(last, name.lstrip("-")) for name in self.ordering
+            )
+        return page
+
+    def get_next_link(self):
+        """Return the absolute URL of the next page, if any."""
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data) -> Response:
+        """Wrap serialized page data with the pagination links."""
+        return Response({"next": self.get_next_link(), "results": data})
+
+
+class CursorPaginationMixin:
+    """Add keyset pagination to an ``APIView`` list.
+
+    Views call ``paginate_queryset`` and return ``get_paginated_response`` with
+    the serialized page. ``cursor_ordering`` defaults to newest first and can
+    be overridden per view; it must end in a unique field.
+    """
+
+    cursor_ordering = ("-created_at", "-id")
+    page_size = None
+
+    @property
+    def paginator(self) -> KeysetPagination:
+        """Return the paginator for this request."""
+        if not hasattr(self, "_paginator"):
+            self._paginator = KeysetPagination(
+                self.cursor_ordering, page_size=self.page_size
+            )
+        return self._paginator
+
+    def paginate_queryset(self, queryset) -> list:
+        """Return one page of ``queryset``."""
+        return self.paginator.paginate_queryset(queryset, self.request)
+
+    def get_paginated_response(self, data) -> Response:
+        """Return the paginated response for serialized ``data``."""
+        return self.paginator.get_paginated_response(data)
+
+
+@cache
+def cursor_paginated(serializer_class):
+    """Return a schema serializer for a cursor-paginated list of ``serializer_class``."""
+    name = serializer_class.__name__.removesuffix("Serializer")
+    return inline_serializer(
+        name=f"CursorPaginated{name}List",
+        fields={
+            "next": serializers.URLField(allow_null=True),
+            "results": serializer_class(many=True),
+        },
+    )
@@ -0,0 +1,252 @@
+"""image renditions.
+
+Uploaded images (event banners, speaker and team avatars, organization
+logos) are served through fixed-size thumbnails rendered with Pillow in a
+background task. Renditions live at a path derived from the original's name
+(``renditions/<original path>/<size>.<format>``) and each one is rendered as
+WebP and JPEG for clients that can't decode WebP. The task records the
+outcome in the model's ``image_renditions`` field, and rendition URLs are
+only handed out once the current image has been rendered; until then, and
+for images that can't be rendered, clients fall back to the original.
+"""
+
+import io
+import logging
+import posixpath
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models.signals import post_init, post_save
+from django_tasks import task
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+RENDITIONS_DIR = "renditions"
+
+# name -> (width, height); images are centre-cropped to fill the box
+RENDITION_SIZES = {
+    "thumb": (160, 160),
+    "medium": (640, 360),
+}
+
+# extension -> (Pillow format, save options)
+RENDITION_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+# refuse decompression bombs well before Pillow's own limit
+MAX_SOURCE_PIXELS = 40_000_000
+
+# model label -> image fields with renditions, filled by ``track_renditions``
+registry: dict[str, tuple[str, ...]] = {}
+
+# JSONField on tracked models mapping each image field to
+# ``{"name": <rendered file name>, "ready": <bool>}``
+STATE_FIELD = "image_renditions"
+
+
+def rendition_name(name: str, size: str, ext: str) -> str:
+    """Return the storage name of one rendition of the file ``name``."""
+    stem, _ = posixpath.splitext(name)
+    return f"{RENDITIONS_DIR}/{stem}/{size}.{ext}"
+
+
+def rendition_state(fieldfile) -> dict:
+    """Return the recorded rendition state of an image field's current file."""
+    states = getattr(fieldfile.instance, STATE_FIELD, None) or {}
+    state = states.get(fieldfile.field.name) or {}
+    return state if state.get("name") == fieldfile.name else {}
+
+
+def rendition_urls(fieldfile) -> dict | None:
+    """Return ``{size: {format: url}}`` for an image field.
+
+    None while the field is empty, its renditions are pending, or its image
+    couldn't be rendered.
+    """
+    if not fieldfile or not rendition_state(fieldfile).get("ready"):
+        return None
+    storage = fieldfile.storage
+    return {
+        size: {
+            ext: storage.url(rendition_name(fieldfile.name, size, ext))
+            for ext in RENDITION_FORMATS
+        }
+        for size in RENDITION_SIZES
+    }
+
+
+def _render(image: Image.Image, box: tuple, fmt: str, options: dict) -> bytes:
+    """Crop ``image`` to ``box`` and encode it as ``fmt``."""
+    thumbnail = ImageOps.fit(image, box, Image.Resampling.LANCZOS)
+    if fmt == "JPEG" and thumbnail.mode != "RGB":
+        # flatten transparency onto white rather than black
+        background = Image.new("RGB", thumbnail.size, (255, 255, 255))
+        rgba = thumbnail.convert("RGBA")
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        thumbnail = background
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def generate_renditions(fieldfile, overwrite: bool = False) -> int | None:
+    """Render and store every rendition of an image field.
+
+    Existing renditions are kept unless ``overwrite`` is set. Returns the
+    number of files written, or None when the image is oversized or can't
+    be read; those are logged and skipped.
+    """
+    if not fieldfile:
+        return 0
+    storage = fieldfile.storage
+    wanted = [
+        (size, ext)
+        for size in RENDITION_SIZES
+        for ext in RENDITION_FORMATS
+        if overwrite or not storage.exists(rendition_name(fieldfile.name, size, ext))
+    ]
+    if not wanted:
+        return 0
+
+    try:
+        with storage.open(fieldfile.name, "rb") as source:
+            image = Image.open(source)
+            if image.width * image.height > MAX_SOURCE_PIXELS:
+                logger.warning("Skipping oversized image %s", fieldfile.name)
+                return None
+            image = ImageOps.exif_transpose(image)
+            image.load()
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        logger.warning("Could not read image %s", fieldfile.name, exc_info=True)
+        return None
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+    for size, ext in wanted:
+        fmt, options = RENDITION_FORMATS[ext]
+        name = rendition_name(fieldfile.name, size, ext)
+        content = _render(image, RENDITION_SIZES[size], fmt, options)
+        # storage.save() renames on conflict, and rendition names are fixed
+        storage.delete(name)
+        storage.save(name, ContentFile(content))
+    return len(wanted)
+
+
+def render_instance(instance, field_name: str, overwrite: bool = False) -> int:
+    """Render an instance's image and record the outcome on the instance.
+
+    Returns the number of files written.
+    """
+    fieldfile = getattr(instance, field_name)
+    if not fieldfile:
+        return 0
+    written = generate_renditions(fieldfile, overwrite=overwrite)
+    states = dict(getattr(instance, STATE_FIELD) or {})
+    states[field_name] = {"name": fieldfile.name, "ready": written is not None}
+    setattr(instance, STATE_FIELD, states)
+    # a save limited to the state leaves the image untouched, so it doesn't
+    # enqueue again, while cache invalidation still sees the change
+    instance.save(update_fields=[STATE_FIELD])
+    return written or 0
+
+
+@task()
+def generate_model_renditions(model_label: str, pk: str, field_name: str) -> int:
+    """Background task rendering the renditions of one stored image.
+
+    ``pk`` is passed as a string since task arguments must be JSON.
+    """
+    model = apps.get_model(model_label)
+    instance = model._default_manager.filter(pk=pk).first()
+    if instance is None:
+        return 0
+    return render_instance(instance, field_name)
+
+
+def _stored_names(instance, field_names) -> dict:
+    """Return the file names the instance's image fields currently hold."""
+    return {
+        # the raw value, so deferred fields aren't loaded
+        name: getattr(value, "name", value)
+        for name in field_names
+        if (value := instance.__dict__.get(name)) is not None
+    }
+
+
+def track_renditions(model, *field_names: str) -> None:
+    """Render renditions of ``model``'s image fields whenever they change.
+
+    ``model`` needs an ``image_renditions`` JSONField. Called from the
+    owning app's ``signals`` module; the registry also drives the
+    ``backfill_renditions`` command.
+    """
+    registry[model._meta.label] = field_names
+
+    def remember_names(sender, instance, **kwargs):
+        instance._rendition_sources = _stored_names(instance, field_names)
+
+    def enqueue_renditions(
+        sender, instance, created=False, raw=False, update_fields=None, **kwargs
+    ):
+        if raw:
+            return
+        previous = getattr(instance, "_rendition_sources", {})
+        current = _stored_names(instance, field_names)
+        instance._rendition_sources = current
+        for field_name in field_names:
+            if update_fields is not None and field_name not in update_fields:
+                continue
+            name = current.get(field_name)
+            if not name or (not created and name == previous.get(field_name)):
+                continue
+            transaction.on_commit(
+                lambda field_name=field_name: generate_model_renditions.enqueue(
+                    model._meta.label, str(instance.pk), field_name
+                )
+            )
+
+    dispatch_uid = f"renditions:{model._meta.label}"
+    post_init.connect(
+        remember_names, sender=model, weak=False, dispatch_uid=dispatch_uid
+    )
+    post_save.connect(
+        enqueue_renditions, sender=model, weak=False, dispatch_uid=dispatch_uid
+    )
+
+
+@extend_schema_field(OpenApiTypes.OBJECT)
+class RenditionsField(serializers.Field):
+    """Read-only URLs of an image field's renditions.
+
+    URLs are absolute when the serializer has a request in its context.
+    """
+
+    def __init__(self, **kwargs):
+        """Make the field read-only."""
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value) -> dict | None:
+        """Return ``{size: {format: url}}`` for the image."""
+        urls = rendition_urls(value)
+        request = self.context.get("request")
+        if urls and request is not None:
+            urls = absolute_rendition_urls(request, urls)
+        return urls
+
+
+def absolute_rendition_urls(request, urls: dict | None) -> dict | None:
+    """Make the URLs of a ``rendition_urls`` mapping absolute."""
+    if not urls:
+        return urls
+    return {
+        size: {ext: request.build_absolute_uri(url) for ext, url in formats.items()}
+        for size, formats in urls.items()
+    }
@@ -0,0 +1,113 @@
+"""base slug allocation."""
+
+import re
+
+from django.db.models import Case, IntegerField, Max, Q, When
+from django.db.models.functions import Cast, Substr
+from django.utils.text import slugify
+
+# longest numeric suffix treated as a counter, e.g. "john-smith-123456789"
+MAX_SUFFIX_DIGITS = 9
+
+
+def allocate_unique_slug(
+    model, value: str, *, fallback: str = "item", exclude_pk=None
+) -> str:
+    """Return a free slug for ``value`` on ``model`` using a single query.
+
+    The lookup fetches, in one aggregate, whether the bare slug is taken and
+    the highest numeric suffix already used for it, and answers
+    ``base-<highest + 1>``. Slugs listed in the model's ``reserved_slugs``
+    count as taken. It doesn't reserve anything: callers must still save
+    under the unique constraint and retry on IntegrityError (see
+    ``base.models.UniqueSlugMixin``).
+    """
+    field = model._meta.get_field("slug")
+    base = (slugify(value) or slugify(fallback))[: field.max_length].strip("-")
+    while True:
+        candidate = _next_free_slug(model, base, exclude_pk)
+        if len(candidate) <= field.max_length:
+            return candidate
+        # leave room for the suffix; the shorter base has its own counter
+        overflow = len(candidate) - field.max_length
+        base = base[:-overflow].rstrip("-")
+
+
+def _next_free_slug(model, base: str, exclude_pk=None) -> str:
+    """Return ``base`` or ``base-N`` after the highest suffix in use."""
+    suffixed = Q(slug__regex=rf"^{base}-[0-9]{{1,{MAX_SUFFIX_DIGITS}}}$")
+    queryset = model._default_manager.filter(slug__startswith=base).filter(
+        Q(slug=base) | suffixed
+    )
+    if exclude_pk is not None:
+        queryset = queryset.exclude(pk=exclude_pk)
+    taken = queryset.aggregate(
+        base_taken=Max(Case(When(slug=base, then=1), default=0)),
+        highest=Max(
+            Case(
+                When(
+                    suffixed,
+                    then=Cast(Substr("slug", len(base) + 2), IntegerField()),
+                ),
+                output_field=IntegerField(),
+            )
+        ),
+    )
+    if not taken["base_taken"] and base not in _reserved(model):
+        return base
+    return f"{base}-{max(taken['highest'] or 1, 1) + 1}"
+
+
+def _reserved(model) -> frozenset:
+    """Return the slugs ``model`` must never be given."""
+    return frozenset(getattr(model, "reserved_slugs", ()))
+
+
+def allocate_unique_slugs(model, values, *, fallback: str = "item") -> list:
+    """Return a free, distinct slug for each of ``values`` using one query.
+
+    The batch counterpart of ``allocate_unique_slug`` for ``bulk_create``:
+    every slug in use that could collide is read at once and suffixes are
+    handed out in Python. As with the single version nothing is reserved,
+    so the insert must still run under the unique constraint.
+    """
+    field = model._meta.get_field("slug")
+    bases = [
+        (slugify(value) or slugify(fallback))[: field.max_length].strip("-")
+        for value in values
+    ]
+    if not bases:
+        return []
+    condition = Q(slug__in=set(bases))
+    for base in set(bases):
+        condition |= Q(slug__startswith=f"{base}-")
+    taken = set(model._default_manager.filter(condition).values_list("slug", flat=True))
+    taken.update(_reserved(model))
+
+    slugs = []
+    highest = {}
+    for base in bases:
+        if base not in taken:
+            slug = base
+        else:
+            if base not in highest:
+                suffix = re.compile(
+                    rf"^{re.escape(base)}-([0-9]{{1,{MAX_SUFFIX_DIGITS}}})$"
+                )
+                counters = [
+                    int(match.group(1))
+                    for match in map(suffix.match, taken)
+                    if match is not None
+                ]
+                highest[base] = max(counters, default=1)
+            # skip counters handed to other titles earlier in the batch
+            slug = base
+            while slug in taken:
+                highest[base] += 1
+                slug = f"{base}-{highest[base]}"
+            if len(slug) > field.max_length:
+                # no room for the counter; let the single version trim the base
+                slug = allocate_unique_slug(model, base, fallback=fallback)
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
@@ -0,0 +1,232 @@
+"""base tests."""
+
+import io
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django_tasks.signals import task_enqueued
+from PIL import Image
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.serializers import BaseSerializer
+from rest_framework.test import APITestCase
+
+from base.middleware import recorder
+from base.renditions import RENDITION_FORMATS, RENDITION_SIZES, rendition_name
+from teams.models import TeamMember
+from teams.serializers import TeamMemberSerializer
+
+
+@override_settings(PERF_SAMPLE_RATE=1.0, PERF_SERVER_TIMING=True)
+class RequestPerfMiddlewareTests(APITestCase):
+    """Tests for the sampled request instrumentation."""
+
+    def setUp(self):
+        """Start from an empty ring buffer."""
+        recorder.clear()
+        self.addCleanup(recorder.clear)
+        User = get_user_model()
+        self.staff = User.objects.create(
+            username="perf_staff", email="perf_staff@example.com", is_staff=True
+        )
+        self.speaker = User.objects.create(
+            username="perf_speaker", email="perf_speaker@example.com"
+        ).speakers_profile_user.first()
+
+    def test_sampled_requests_are_recorded_per_view(self):
+        """A sampled request is recorded under its URL name with its queries."""
+        url = reverse(
+            "speakers:speakers_retrieve_update_delete", args=[self.speaker.slug]
+        )
+        res = self.client.get(url)
+
+        self.assertIn("Server-Timing", res)
+        self.assertIn("serializer;dur=", res["Server-Timing"])
+        self.assertIn("render;dur=", res["Server-Timing"])
+        [row] = recorder.report()
+        self.assertEqual(row["view"], "speakers:speakers_retrieve_update_delete")
+        self.assertEqual(row["method"], "GET")
+        self.assertEqual(row["count"], 1)
+        self.assertGreater(row["queries"]["p50"], 0)
+        self.assertGreaterEqual(row["total_ms"]["p99"], row["db_ms"]["p99"])
+        self.assertGreater(row["serializer_ms"]["p99"], 0)
+        self.assertGreater(row["render_ms"]["p99"], 0)
+
+    def test_list_responses_record_serializer_time(self):
+        """Serializers used with ``many=True`` are timed through their child."""
+        for index in range(3):
+            get_user_model().objects.create(
+                username=f"perf_list_{index}", email=f"perf_list_{index}@example.com"
+            )
+        self.client.get(reverse("speakers:speakers_list_create"))
+
+        [row] = recorder.report()
+        self.assertGreater(row["serializer_ms"]["p99"], 0)
+        self.assertLessEqual(row["serializer_ms"]["p99"], row["total_ms"]["p99"])
+
+    def test_drf_is_left_unpatched(self):
+        """Timing happens in a mixin and the renderer; DRF itself is untouched."""
+        self.client.get(reverse("speakers:speakers_list_create"))
+        self.assertEqual(
+            BaseSerializer.data.fget.__module__, "rest_framework.serializers"
+        )
+        self.assertEqual(
+            BaseSerializer.to_representation.__module__, "rest_framework.serializers"
+        )
+
+    @override_settings(PERF_SAMPLE_RATE=0.0)
+    def test_unsampled_requests_are_not_recorded(self):
+        """With sampling off, nothing is recorded or added to the response."""
+        res = self.client.get(reverse("speakers:speakers_list_create"))
+
+        self.assertNotIn("Server-Timing", res)
+        self.assertEqual(recorder.report(), [])
+
+    def test_report_is_staff_only(self):
+        """Only staff can read or clear the report."""
+        url = reverse("perf_report")
+        self.client.get(reverse("speakers:speakers_list_create"))
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(self.staff)
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn(
+            "speakers:speakers_list_create",
+            [row["view"] for row in res.data["results"]],
+        )
+        self.assertEqual(
+            self.client.delete(url).status_code, status.HTTP_204_NO_CONTENT
+        )
+        # only the DELETE itself is left in the buffer
+        self.assertEqual([row["view"] for row in recorder.report()], ["perf_report"])
+
+
+# ─── Image renditions ─────────────────────────────────────────────────────────
+
+
+def _png(size=(800, 600), mode="RGBA") -> ContentFile:
+    """Return an in-memory PNG upload."""
+    buffer = io.BytesIO()
+    Image.new(mode, size, (200, 40, 40, 128)[: len(mode)]).save(buffer, "PNG")
+    return ContentFile(buffer.getvalue(), name="avatar.png")
+
+
+class RenditionTests(TestCase):
+    """Thumbnails rendered for uploaded images."""
+
+    def setUp(self):
+        """Store uploads in a throwaway media root."""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def _member(self, avatar=None) -> TeamMember:
+        """Create a team member, running the upload's on-commit work."""
+        with self.captureOnCommitCallbacks(execute=True):
+            member = TeamMember.objects.create(
+                name="Ada", role="Engineer", short_bio="Bio", avatar=avatar
+            )
+        member.refresh_from_db()
+        return member
+
+    def _enqueued(self) -> list:
+        """Collect the rendition tasks enqueued from now on."""
+        enqueued = []
+
+        def record(sender, task_result, **kwargs):
+            enqueued.append(task_result.args)
+
+        task_enqueued.connect(record)
+        self.addCleanup(task_enqueued.disconnect, record)
+        return enqueued
+
+    def _stored(self, member) -> dict:
+        """Return the stored renditions of a member's avatar by (size, ext)."""
+        storage = member.avatar.storage
+        found = {}
+        for size in RENDITION_SIZES:
+            for ext in RENDITION_FORMATS:
+                name = rendition_name(member.avatar.name, size, ext)
+                if storage.exists(name):
+                    with storage.open(name, "rb") as stored:
+                        image = Image.open(stored)
+                        found[size, ext] = (image.format, image.size, image.mode)
+        return found
+
+    def test_upload_renders_every_rendition(self):
+        """Each size is stored as WebP and an RGB JPEG of the exact box."""
+        member = self._member(_png())
+        stored = self._stored(member)
+        for size, box in RENDITION_SIZES.items():
+            self.assertEqual(stored[size, "webp"][:2], ("WEBP", box))
+            self.assertEqual(stored[size, "jpg"], ("JPEG", box, "RGB"))
+
+    def test_serializer_exposes_rendition_urls(self):
+        """Serialized members carry the rendition URLs beside the original."""
+        member = self._member(_png())
+        data = TeamMemberSerializer(member).data
+        self.assertEqual(set(data["avatar_renditions"]), set(RENDITION_SIZES))
+        self.assertEqual(
+            data["avatar_renditions"]["thumb"]["webp"],
+            member.avatar.storage.url(
+                rendition_name(member.avatar.name, "thumb", "webp")
+            ),
+        )
+        self.assertIsNone(
+            TeamMemberSerializer(self._member()).data["avatar_renditions"]
+        )
+
+    def test_unreadable_upload_is_skipped(self):
+        """A file Pillow can't decode is stored without renditions."""
+        with self.assertLogs("base.renditions", level="WARNING"):
+            member = self._member(ContentFile(b"not an image", name="avatar.png"))
+        self.assertTrue(member.avatar)
+        self.assertEqual(self._stored(member), {})
+        self.assertIsNone(TeamMemberSerializer(member).data["avatar_renditions"])
+        self.assertFalse(member.image_renditions["avatar"]["ready"])
+
+    def test_urls_wait_for_the_renditions(self):
+        """No rendition URLs are given out before the task has run."""
+        with self.captureOnCommitCallbacks(execute=False):
+            member = TeamMember.objects.create(
+                name="Ada", role="Engineer", short_bio="Bio", avatar=_png()
+            )
+        self.assertIsNone(TeamMemberSerializer(member).data["avatar_renditions"])
+
+    def test_only_new_images_are_rendered(self):
+        """Saves that keep the image enqueue nothing; a new image does."""
+        member = self._member(_png())
+        enqueued = self._enqueued()
+        with self.captureOnCommitCallbacks(execute=True):
+            member.short_bio = "New bio"
+            member.save()
+            TeamMember.objects.get(pk=member.pk).save()
+        self.assertEqual(enqueued, [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            member.avatar = _png(mode="RGB")
+            member.save()
+        self.assertEqual(enqueued, [["teams.TeamMember", str(member.pk), "avatar"]])
+        member.refresh_from_db()
+        self.assertIsNotNone(TeamMemberSerializer(member).data["avatar_renditions"])
+
+    def test_backfill_renders_missing_renditions(self):
+        """The backfill command renders images stored without renditions."""
+        member = self._member(_png(mode="RGB"))
+        storage = member.avatar.storage
+        for size in RENDITION_SIZES:
+            storage.delete(rendition_name(member.avatar.name, size, "jpg"))
+
+        out = io.StringIO()
+        call_command("backfill_renditions", "--model", "teams.TeamMember", stdout=out)
+        self.assertIn(f"Wrote {len(RENDITION_SIZES)} rendition(s)", out.getvalue())
+        self.assertEqual(
+            len(self._stored(member)), len(RENDITION_SIZES) * len(RENDITION_FORMATS)
+        )
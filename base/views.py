@@ -0,0 +1,25 @@
+"""base views."""
+
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from base.middleware import recorder
+
+
+@extend_schema(exclude=True)
+class PerfReportView(APIView):
+    """Per-view latency and query percentiles sampled by this process."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        """Return the percentiles of every view seen in the ring buffer."""
+        return Response({"results": recorder.report()}, status=status.HTTP_200_OK)
+
+    def delete(self, request):
+        """Clear the ring buffer."""
+        recorder.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
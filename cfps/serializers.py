@@ -2,12 +2,13 @@
 
 from rest_framework import serializers
 
+from base.middleware import TimedSerializerMixin
 from cfps.choices import CFPStatusChoices
 from cfps.models import CFPSubmission
 from speakers.models import SpeakerProfile
 
 
-class CoSpeakerSerializer(serializers.ModelSerializer):
+class CoSpeakerSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Minimal read-only representation of a co-speaker."""
 
     name = serializers.SerializerMethodField()
@@ -26,7 +27,7 @@ class CoSpeakerSerializer(serializers.ModelSerializer):
         )
 
 
-class CFPSubmissionSerializer(serializers.ModelSerializer):
+class CFPSubmissionSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for creating and reading CFP submissions."""
 
     co_speakers = serializers.PrimaryKeyRelatedField(
@@ -67,7 +68,7 @@ class CFPSubmissionSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class CFPStatusUpdateSerializer(serializers.ModelSerializer):
+class CFPStatusUpdateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Organizer-only serializer for updating submission status."""
 
     class Meta:
@@ -10,3 +10,7 @@ class EventsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "events"
     verbose_name = _("Events")
+
+    def ready(self):
+        """Connect the app's signal handlers."""
+        from events import signals  # noqa: F401
@@ -0,0 +1,75 @@
+"""events cache.
+
+The public (anonymous) event feed is cached as rendered JSON bytes together
+with its ETag. Entries are keyed on a feed version that ``events.signals``
+bumps whenever an event, tag, location or country changes, so stale pages
+are never served and simply age out.
+"""
+
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import quote_etag
+
+FEED_VERSION_KEY = "events:feed:version"
+
+
+def feed_version() -> int:
+    """Return the current feed version, starting one if none is stored."""
+    version = cache.get(FEED_VERSION_KEY)
+    if version is None:
+        # seed from the clock so a lost counter never revives old entries
+        cache.add(FEED_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(FEED_VERSION_KEY)
+    return version
+
+
+def bump_feed_version() -> None:
+    """Invalidate every cached feed page.
+
+    The version is bumped straight away and again once the surrounding
+    transaction commits, so a page cached from the old rows in between is
+    dropped too.
+    """
+
+    def bump():
+        try:
+            cache.incr(FEED_VERSION_KEY)
+        except ValueError:
+            cache.add(FEED_VERSION_KEY, time.time_ns(), timeout=None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def feed_cache_key(origin: str, params: dict) -> str:
+    """Return the cache key of a feed page.
+
+    ``origin`` is the scheme and host the page's links point to and
+    ``params`` the query parameters that select the page; their order does
+    not matter.
+    """
+    query = urlencode(sorted((name, str(value)) for name, value in params.items()))
+    digest = hashlib.blake2b(f"{origin}?{query}".encode(), digest_size=16)
+    return f"events:feed:v{feed_version()}:{digest.hexdigest()}"
+
+
+def get_cached_feed(key: str):
+    """Return the cached ``(etag, body)`` pair for ``key``, or None on a miss."""
+    return cache.get(key)
+
+
+def feed_entry(body: bytes) -> tuple:
+    """Return the ``(etag, body)`` pair of a rendered feed page."""
+    return (quote_etag(hashlib.blake2b(body, digest_size=16).hexdigest()), body)
+
+
+def set_cached_feed(key: str, body: bytes) -> tuple:
+    """Store a rendered feed page and return its ``(etag, body)`` pair."""
+    entry = feed_entry(body)
+    cache.set(key, entry, timeout=settings.EVENT_FEED_CACHE_TIMEOUT)
+    return entry
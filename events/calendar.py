@@ -0,0 +1,175 @@
+"""events iCalendar feeds.
+
+Feeds are streamed: rows are read with ``.values().iterator()`` and each
+VEVENT is rendered as it is produced, so memory stays flat however many
+events a feed holds. Validators (ETag and Last-Modified) come from a single
+aggregate over the feed's rows, so polls of an unchanged feed cost one query.
+"""
+
+import hashlib
+from datetime import UTC
+
+from django.conf import settings
+from django.db.models import Count, Max
+from rest_framework.renderers import BaseRenderer
+
+ICS_CONTENT_TYPE = "text/calendar; charset=utf-8"
+ICS_CHUNK_SIZE = 500
+
+EVENT_FIELDS = (
+    "id",
+    "slug",
+    "title",
+    "short_description",
+    "start_date_time",
+    "end_date_time",
+    "updated_at",
+    "location__venue",
+    "location__city",
+    "location__country__name",
+)
+
+
+class ICalendarRenderer(BaseRenderer):
+    """Let calendar clients ask for ``text/calendar``; errors render as text."""
+
+    media_type = "text/calendar"
+    format = "ics"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Return error details as plain text; feeds bypass rendering."""
+        if isinstance(data, dict):
+            data = data.get("detail", "")
+        return str(data).encode(self.charset)
+
+
+def _escape(text) -> str:
+    """Escape a TEXT property value."""
+    return (
+        str(text or "")
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets, as RFC 5545 requires."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # don't split a multi-byte character
+        while end < len(encoded) and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start, limit = end, 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _timestamp(value) -> str:
+    """Format a datetime as a UTC DATE-TIME value."""
+    return value.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def feed_validators(queryset, *timestamp_fields) -> tuple:
+    """Return ``(etag, last_modified, count)`` for the rows of a feed.
+
+    ``last_modified`` is the newest of ``timestamp_fields`` over the rows; the
+    row count is part of the ETag so deletions change it too.
+    """
+    aggregates = {f"latest_{i}": Max(field) for i, field in enumerate(timestamp_fields)}
+    result = queryset.aggregate(count=Count("pk"), **aggregates)
+    stamps = [result[key] for key in aggregates if result[key] is not None]
+    last_modified = max(stamps) if stamps else None
+    token = f"{result['count']}:{last_modified.isoformat() if last_modified else ''}"
+    etag = f'"{hashlib.blake2b(token.encode(), digest_size=16).hexdigest()}"'
+    return etag, last_modified, result["count"]
+
+
+def vevent(uid, summary, row, prefix="", description="") -> str:
+    """Render one VEVENT from an event row (see ``EVENT_FIELDS``)."""
+    place = ", ".join(
+        part
+        for part in (
+            row[f"{prefix}location__venue"],
+            row[f"{prefix}location__city"],
+            row[f"{prefix}location__country__name"],
+        )
+        if part
+    )
+    url = f"{settings.FRONTEND_URL.rstrip('/')}/events/{row[f'{prefix}slug']}"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{_timestamp(row['updated_at'])}",
+        f"SUMMARY:{_escape(summary)}",
+        f"URL:{url}",
+    ]
+    if row[f"{prefix}start_date_time"]:
+        lines.append(f"DTSTART:{_timestamp(row[f'{prefix}start_date_time'])}")
+    if row[f"{prefix}end_date_time"]:
+        lines.append(f"DTEND:{_timestamp(row[f'{prefix}end_date_time'])}")
+    if place:
+        lines.append(f"LOCATION:{_escape(place)}")
+    if description:
+        lines.append(f"DESCRIPTION:{_escape(description)}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def _calendar(name: str, vevents):
+    """Wrap streamed VEVENTs in a VCALENDAR."""
+    yield (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        f"PRODID:-//{settings.SITE_NAME}//Events//EN\r\n"
+        "CALSCALE:GREGORIAN\r\n"
+        "METHOD:PUBLISH\r\n"
+    )
+    yield _fold(f"X-WR-CALNAME:{_escape(name)}")
+    yield from vevents
+    yield "END:VCALENDAR\r\n"
+
+
+def stream_events(name: str, events):
+    """Yield the calendar of an ``Event`` queryset, chunk by chunk."""
+    rows = events.values(*EVENT_FIELDS).iterator(chunk_size=ICS_CHUNK_SIZE)
+    return _calendar(
+        name,
+        (
+            vevent(
+                f"event-{row['id']}@speakwise",
+                row["title"],
+                row,
+                description=row["short_description"],
+            )
+            for row in rows
+        ),
+    )
+
+
+def stream_talks(name: str, talks):
+    """Yield the calendar of a ``Talks`` queryset, timed by their events."""
+    fields = ("id", "title", "updated_at", "event__title") + tuple(
+        f"event__{field}" for field in EVENT_FIELDS if field not in ("id", "title")
+    )
+    rows = talks.values(*fields).iterator(chunk_size=ICS_CHUNK_SIZE)
+    return _calendar(
+        name,
+        (
+            vevent(
+                f"talk-{row['id']}@speakwise",
+                f"{row['title']} ({row['event__title']})",
+                row,
+                prefix="event__",
+                description=row["event__short_description"],
+            )
+            for row in rows
+        ),
+    )
@@ -6,7 +6,11 @@ from events.models import Event
 
 
 class EventFilter(filters.FilterSet):
-    """Event filter."""
+    """Event filter.
+
+    Every lookup is an ``icontains`` backed by a trigram index on the
+    upper-cased column (see the ``*_trigram_indexes`` migrations).
+    """
 
     title = filters.CharFilter(field_name="title", lookup_expr="icontains")
     organizer = filters.CharFilter(method="organizer_filter")
@@ -16,7 +20,7 @@ class EventFilter(filters.FilterSet):
     def organizer_filter(self, queryset, name, value):
         """Filter events by organizer name."""
         if value:
-            return queryset.filter(organizer__user_account__username__icontains=value)
+            return queryset.filter(organizer__name__icontains=value)
         return queryset
 
     def country_filter(self, queryset, name, value):
@@ -0,0 +1,79 @@
+"""events geo search.
+
+Nearby events are found in two steps: a bounding-box filter on the indexed
+``Location.latitude``/``longitude`` pair narrows the rows in the database,
+then the exact great-circle distance of those candidates is computed in one
+vectorized haversine pass. Works on any database, no PostGIS needed.
+"""
+
+import math
+
+import numpy as np
+from django.db.models import Q
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Q:
+    """Return a filter on ``location`` coordinates covering the search circle.
+
+    The box is widened to every longitude near the poles and split in two
+    when it crosses the antimeridian.
+    """
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    box = Q(
+        location__latitude__gte=max(lat - delta_lat, -90),
+        location__latitude__lte=min(lat + delta_lat, 90),
+    )
+    if abs(lat) + delta_lat >= 90:
+        return box
+
+    delta_lng = math.degrees(
+        radius_km / (EARTH_RADIUS_KM * math.cos(math.radians(lat)))
+    )
+    if delta_lng >= 180:
+        return box
+    west, east = lng - delta_lng, lng + delta_lng
+    if west < -180:
+        longitudes = Q(location__longitude__gte=west + 360) | Q(
+            location__longitude__lte=east
+        )
+    elif east > 180:
+        longitudes = Q(location__longitude__gte=west) | Q(
+            location__longitude__lte=east - 360
+        )
+    else:
+        longitudes = Q(location__longitude__gte=west, location__longitude__lte=east)
+    return box & longitudes
+
+
+def haversine_km(lat: float, lng: float, lats, lngs) -> np.ndarray:
+    """Return the distances in km from ``(lat, lng)`` to every point given."""
+    lat1, lng1 = np.radians(lat), np.radians(lng)
+    lat2 = np.radians(np.asarray(lats, dtype=float))
+    lng2 = np.radians(np.asarray(lngs, dtype=float))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def nearest(queryset, lat: float, lng: float, radius_km: float, limit: int) -> list:
+    """Return ``(pk, distance_km)`` of the closest events within ``radius_km``.
+
+    Only the candidates inside the bounding box are loaded, and only their
+    primary key and coordinates.
+    """
+    candidates = list(
+        queryset.filter(bounding_box(lat, lng, radius_km)).values_list(
+            "pk", "location__latitude", "location__longitude"
+        )
+    )
+    if not candidates:
+        return []
+    pks, lats, lngs = zip(*candidates, strict=True)
+    distances = haversine_km(lat, lng, lats, lngs)
+    inside = np.flatnonzero(distances <= radius_km)
+    closest = inside[np.argsort(distances[inside], kind="stable")][:limit]
+    return [(pks[i], float(distances[i])) for i in closest]
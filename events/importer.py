@@ -0,0 +1,245 @@
+"""events bulk import.
+
+Imports events from a JSON Lines or CSV stream for one organization. Rows
+are validated one by one, then written in batches: the countries, locations
+and tags of a batch are resolved with a few set-based queries, events are
+inserted with ``bulk_create`` and their tags with a single through-table
+insert, each batch in its own transaction. Invalid rows are reported with
+their row number and never abort the import.
+"""
+
+import codecs
+import csv
+import json
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from base.slugs import allocate_unique_slugs
+from events.cache import bump_feed_version
+from events.models import Country, Event, Location, Tag
+from events.serializers import EventImportRowSerializer
+
+IMPORT_BATCH_SIZE = 500
+
+# CSV rows list their tags in one column, separated by this character
+TAG_SEPARATOR = ";"
+
+
+def detect_format(filename: str) -> str | None:
+    """Guess the import format from a file name."""
+    name = filename.lower()
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if name.endswith(".csv"):
+        return "csv"
+    return None
+
+
+def read_rows(stream, fmt: str):
+    """Yield ``(row_number, data, error)`` for each row of a binary stream."""
+    text = codecs.iterdecode(stream, "utf-8-sig")
+    if fmt == "jsonl":
+        for number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError:
+                yield number, None, "Invalid JSON."
+                continue
+            if not isinstance(data, dict):
+                yield number, None, "Each line must be a JSON object."
+                continue
+            yield number, data, None
+    else:
+        # row 1 is the header
+        for number, row in enumerate(csv.DictReader(text), start=2):
+            data = {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if key and value and value.strip()
+            }
+            if "tags" in data:
+                data["tags"] = [
+                    tag.strip()
+                    for tag in data["tags"].split(TAG_SEPARATOR)
+                    if tag.strip()
+                ]
+            yield number, data, None
+
+
+def import_events(stream, fmt: str, organization, batch_size: int = IMPORT_BATCH_SIZE):
+    """Import the events in ``stream`` for ``organization``.
+
+    Returns ``{"created": <count>, "errors": [{"row": n, "errors": ...}]}``.
+    """
+    report = {"created": 0, "errors": []}
+    batch = []
+    for number, data, error in read_rows(stream, fmt):
+        if error:
+            report["errors"].append(
+                {"row": number, "errors": {"non_field_errors": [error]}}
+            )
+            continue
+        serializer = EventImportRowSerializer(data=data)
+        if not serializer.is_valid():
+            report["errors"].append({"row": number, "errors": serializer.errors})
+            continue
+        batch.append((number, serializer.validated_data))
+        if len(batch) >= batch_size:
+            _import_batch(batch, organization, report)
+            batch = []
+    if batch:
+        _import_batch(batch, organization, report)
+
+    report["errors"].sort(key=lambda error: error["row"])
+    if report["created"]:
+        # bulk inserts skip the model signals that normally do this
+        bump_feed_version()
+    return report
+
+
+def _import_batch(rows, organization, report) -> None:
+    """Insert one batch, retrying row by row if the batch hits a conflict."""
+    rows = _drop_taken_titles(rows, report)
+    if not rows:
+        return
+    try:
+        with transaction.atomic():
+            report["created"] += _insert(rows, organization)
+        return
+    except IntegrityError:
+        pass
+    # a concurrent write took a title or slug; find the offending rows
+    for number, data in rows:
+        try:
+            with transaction.atomic():
+                report["created"] += _insert([(number, data)], organization)
+        except IntegrityError:
+            report["errors"].append(
+                {
+                    "row": number,
+                    "errors": {"title": ["Conflicts with an existing event."]},
+                }
+            )
+
+
+def _drop_taken_titles(rows, report) -> list:
+    """Report and drop rows whose title exists or repeats an earlier row."""
+    titles = {data["title"] for _, data in rows}
+    seen = set(Event.objects.filter(title__in=titles).values_list("title", flat=True))
+    kept = []
+    for number, data in rows:
+        if data["title"] in seen:
+            report["errors"].append(
+                {
+                    "row": number,
+                    "errors": {"title": ["An event with this title already exists."]},
+                }
+            )
+            continue
+        seen.add(data["title"])
+        kept.append((number, data))
+    return kept
+
+
+def _insert(rows, organization) -> int:
+    """Write a batch of validated rows and return the number of events."""
+    countries = _resolve_named(
+        Country, {data["country"] for _, data in rows if data.get("country")}
+    )
+    locations = _resolve_locations(rows, countries)
+    tags = _resolve_named(Tag, {name for _, data in rows for name in data["tags"]})
+    slugs = allocate_unique_slugs(
+        Event, [data["title"] for _, data in rows], fallback=Event.slug_fallback
+    )
+
+    events = []
+    links = []
+    for (_, data), slug in zip(rows, slugs, strict=True):
+        event = Event(
+            title=data["title"],
+            slug=slug,
+            short_description=data["short_description"],
+            description=data["description"],
+            website=data.get("website") or None,
+            is_active=data["is_active"],
+            location=locations.get(_location_key(data, countries)),
+            organizer=organization,
+        )
+        for field in ("start_date_time", "end_date_time"):
+            if field in data:
+                setattr(event, field, data[field])
+        events.append(event)
+        links.extend(
+            Event.tags.through(event_id=event.pk, tag_id=tags[name].pk)
+            for name in set(data["tags"])
+        )
+    Event.objects.bulk_create(events)
+    Event.tags.through.objects.bulk_create(links)
+    return len(events)
+
+
+def _resolve_named(model, names: set) -> dict:
+    """Return ``model`` rows keyed by their unique ``name``, creating missing ones."""
+    if not names:
+        return {}
+    found = {obj.name: obj for obj in model.objects.filter(name__in=names)}
+    missing = names - found.keys()
+    if missing:
+        model.objects.bulk_create(
+            [model(name=name) for name in missing], ignore_conflicts=True
+        )
+        found.update((obj.name, obj) for obj in model.objects.filter(name__in=missing))
+    return found
+
+
+def _location_key(data, countries) -> tuple | None:
+    """Return the ``(country, city, venue)`` key of a row's location."""
+    if "venue" not in data:
+        return None
+    country = countries.get(data.get("country"))
+    return (country.pk if country else None, data["city"], data["venue"])
+
+
+def _resolve_locations(rows, countries) -> dict:
+    """Return the batch's locations by key, creating the missing ones.
+
+    Existing locations are matched on ``(country, city, venue)`` and left
+    untouched; new ones take the first row's address and coordinates.
+    """
+    wanted = {}
+    for _, data in rows:
+        key = _location_key(data, countries)
+        if key is not None:
+            wanted.setdefault(key, data)
+    if not wanted:
+        return {}
+
+    found = {}
+    candidates = Location.objects.filter(
+        Q(venue__in={venue for _, _, venue in wanted}),
+        Q(city__in={city for _, city, _ in wanted}),
+    ).order_by("pk")
+    for location in candidates:
+        key = (location.country_id, location.city, location.venue)
+        if key in wanted:
+            found.setdefault(key, location)
+
+    new = [
+        Location(
+            country_id=key[0],
+            city=key[1],
+            venue=key[2],
+            address=data["address"],
+            postal_code=data["postal_code"],
+            latitude=data.get("latitude"),
+            longitude=data.get("longitude"),
+        )
+        for key, data in wanted.items()
+        if key not in found
+    ]
+    Location.objects.bulk_create(new)
+    found.update(((loc.country_id, loc.city, loc.venue), loc) for loc in new)
+    return found
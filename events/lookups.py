@@ -0,0 +1,144 @@
+"""events lookups.
+
+Countries and locations are tiny, rarely changing tables that every event
+write resolves. This module keeps bounded, per-process LRU caches of them:
+``Country`` by name or code and ``Location`` by ``(country, city, venue)``.
+Only committed rows are cached, entries expire after ``LOOKUP_CACHE_TTL``
+seconds to bound staleness across processes, and ``events.signals`` drops
+entries of rows saved or deleted in this process.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.db import transaction
+
+from events.models import Country, Location
+
+LOOKUP_CACHE_SIZE = 1024
+LOOKUP_CACHE_TTL = 300
+
+
+class LRUCache:
+    """Thread-safe, size-bounded mapping whose entries expire after ``ttl``."""
+
+    def __init__(self, maxsize: int = LOOKUP_CACHE_SIZE, ttl: float = LOOKUP_CACHE_TTL):
+        """Keep at most ``maxsize`` entries for ``ttl`` seconds each."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the live value for ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        """Store ``value``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_pk(self, pk) -> None:
+        """Drop every entry holding the row with primary key ``pk``."""
+        with self._lock:
+            stale = [key for key, (_, value) in self._entries.items() if value.pk == pk]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+countries = LRUCache()
+locations = LRUCache()
+
+
+def _remember(cache: LRUCache, key, instance) -> None:
+    """Cache ``instance`` once the current transaction commits."""
+    transaction.on_commit(lambda: cache.set(key, instance))
+
+
+def resolve_country(country_data: dict | None) -> Country | None:
+    """Return the country named (or, failing a name, coded) in ``country_data``.
+
+    Unknown countries are created.
+    """
+    if not country_data:
+        return None
+    name = country_data.get("name")
+    code = country_data.get("code")
+    if name:
+        key, lookup = ("name", name), {"name": name}
+    elif code:
+        key, lookup = ("code", code), {"code": code}
+    else:
+        return None
+
+    country = countries.get(key)
+    if country is None:
+        country, _ = Country.objects.get_or_create(**lookup, defaults=country_data)
+        _remember(countries, key, country)
+    return country
+
+
+def resolve_location(country: Country | None, fields: dict) -> Location:
+    """Return the location at ``(country, city, venue)``, creating it if needed.
+
+    ``postal_code`` and ``address`` in ``fields`` are written back only when
+    they differ from the stored row.
+    """
+    city = fields.get("city", "")
+    venue = fields.get("venue", "")
+    postal_code = fields.get("postal_code", "")
+    address = fields.get("address", "")
+    key = (country.pk if country else None, city, venue)
+
+    location = locations.get(key)
+    if location is None:
+        location = Location.objects.filter(
+            country=country, city=city, venue=venue
+        ).first()
+        if location is None:
+            location = Location.objects.create(
+                country=country,
+                city=city,
+                venue=venue,
+                postal_code=postal_code,
+                address=address,
+            )
+        _remember(locations, key, location)
+
+    if (location.postal_code, location.address) != (postal_code, address):
+        # cached instances are shared between requests, so never mutate one
+        location = copy.copy(location)
+        location.postal_code = postal_code
+        location.address = address
+        location.save(update_fields=["postal_code", "address"])
+        _remember(locations, key, location)
+    return location
+
+
+def forget_country(country: Country) -> None:
+    """Drop a changed or deleted country from the cache."""
+    countries.discard_pk(country.pk)
+
+
+def forget_location(location: Location) -> None:
+    """Drop a changed or deleted location from the cache."""
+    locations.discard_pk(location.pk)
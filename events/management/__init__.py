@@ -0,0 +1 @@
+"""events management."""
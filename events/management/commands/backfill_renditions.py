@@ -0,0 +1,50 @@
+"""Render missing thumbnails and record the rendition state of stored images."""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from base.renditions import STATE_FIELD, registry, render_instance
+
+
+class Command(BaseCommand):
+    """Generate missing image renditions for every tracked image field."""
+
+    help = "Generate missing thumbnails for stored event, speaker, team and organization images."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Only backfill this model label (e.g. events.Event); repeatable.",
+        )
+        parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Re-render renditions that already exist.",
+        )
+
+    def handle(self, *args, **options):
+        """Render the renditions of each stored image."""
+        labels = options["models"] or list(registry)
+        unknown = set(labels) - registry.keys()
+        if unknown:
+            raise CommandError(f"No renditions for: {', '.join(sorted(unknown))}")
+
+        images = written = 0
+        for label in labels:
+            model = apps.get_model(label)
+            for field_name in registry[label]:
+                stored = model._default_manager.exclude(
+                    Q(**{field_name: ""}) | Q(**{f"{field_name}__isnull": True})
+                ).only("pk", field_name, STATE_FIELD)
+                for instance in stored.iterator():
+                    images += 1
+                    written += render_instance(
+                        instance, field_name, overwrite=options["overwrite"]
+                    )
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {written} rendition(s) for {images} image(s).")
+        )
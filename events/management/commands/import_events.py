@@ -0,0 +1,59 @@
+"""Import events from a JSON Lines or CSV file."""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from events.importer import IMPORT_BATCH_SIZE, detect_format, import_events
+from organizations.models import Organization
+
+
+class Command(BaseCommand):
+    """Bulk import an organization's events, reporting rejected rows."""
+
+    help = "Import events for an organization from a .jsonl or .csv file."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument("path", help="File to import.")
+        parser.add_argument(
+            "--organization",
+            required=True,
+            help="Slug of the organization that owns the events.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["jsonl", "csv"],
+            help="File format; guessed from the extension by default.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="Number of rows written per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the import and print the per-row errors."""
+        try:
+            organization = Organization.objects.get(slug=options["organization"])
+        except Organization.DoesNotExist as err:
+            raise CommandError(
+                f"Organization {options['organization']!r} does not exist."
+            ) from err
+        fmt = options["format"] or detect_format(options["path"])
+        if fmt is None:
+            raise CommandError("Cannot tell the file format; pass --format.")
+
+        with open(options["path"], "rb") as stream:
+            report = import_events(
+                stream, fmt, organization, batch_size=options["batch_size"]
+            )
+        for error in report["errors"]:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report['created']} event(s), "
+                f"rejected {len(report['errors'])} row(s)."
+            )
+        )
@@ -0,0 +1,43 @@
+"""events managers."""
+
+from django.db import models
+from django.db.models import Prefetch
+
+
+class EventQuerySet(models.QuerySet):
+    """Query set for events."""
+
+    def for_listing(self):
+        """Load everything ``EventSerializer`` renders in a fixed number of queries.
+
+        The location and its country are joined in, and the tags come from a
+        single prefetch query, whatever the number of events.
+        """
+        return self.select_related("location__country").prefetch_related("tags")
+
+    def with_guest_speakers(self, viewer=None):
+        """Load what ``EventWithGuestSpeakersSerializer`` renders.
+
+        On top of ``for_listing()``, the speakers (with their user accounts
+        and whether ``viewer`` follows them) and the public talks (with their
+        speakers and sessions) each come from one prefetch query, so the
+        query count doesn't grow with the number of speakers or talks.
+        """
+        from speakers.models import SpeakerProfile
+        from talks.models import Talks
+
+        speakers = (
+            SpeakerProfile.objects.select_related("user_account")
+            .with_social_stats(viewer)
+            .order_by("user_account__first_name", "user_account__last_name", "pk")
+        )
+        talks = (
+            Talks.objects.filter(is_public=True)
+            .select_related("speaker")
+            .prefetch_related("talk_sessions")
+            .order_by("title", "pk")
+        )
+        return self.for_listing().prefetch_related(
+            Prefetch("speakers", queryset=speakers),
+            Prefetch("talk_event", queryset=talks, to_attr="public_talks"),
+        )
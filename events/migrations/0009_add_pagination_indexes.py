@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0008_add_cfp_fields_to_event"),
+        ("organizations", "0005_merge_20260509_1654"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["is_active", "created_at", "id"],
+                name="events_active_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["organizer", "created_at", "id"], name="events_org_created_idx"
+            ),
+        ),
+    ]
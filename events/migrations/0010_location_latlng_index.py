@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0009_add_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="location",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="events_location_latlng_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:53
+
+from django.db import migrations
+
+
+# icontains compiles to UPPER(col::text) LIKE UPPER(%s) on PostgreSQL, so
+# the trigram indexes are built on that expression for the planner to use.
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0010_location_latlng_index"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE EXTENSION IF NOT EXISTS "pg_trgm";',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX events_event_title_trgm_idx ON events_event "
+                "USING gin ((UPPER(title::text)) gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS events_event_title_trgm_idx;",
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX events_location_venue_trgm_idx ON events_location "
+                "USING gin ((UPPER(venue::text)) gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS events_location_venue_trgm_idx;",
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX events_country_name_trgm_idx ON events_country "
+                "USING gin ((UPPER(name::text)) gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS events_country_name_trgm_idx;",
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0011_trigram_indexes"),
+        ("organizations", "0006_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["start_date_time", "id"],
+                name="events_active_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["organizer", "start_date_time", "id"],
+                name="events_org_start_idx",
+            ),
+        ),
+    ]
@@ -4,9 +4,9 @@ import uuid
 
 from django.db import models
 from django.utils import timezone
-from django.utils.text import slugify
 
-from base.models import TimeStampedModel
+from base.models import TimeStampedModel, UniqueSlugMixin
+from events.managers import EventQuerySet
 
 EVENT_IMAGE_UPLOAD = "event_images/"
 
@@ -23,7 +23,7 @@ class Tag(TimeStampedModel):
         return self.name
 
 
-class Event(TimeStampedModel):
+class Event(UniqueSlugMixin, TimeStampedModel):
     """A model for events in the SpeakWise application."""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -32,6 +32,12 @@ class Event(TimeStampedModel):
     event_image = models.ImageField(
         "image", upload_to=EVENT_IMAGE_UPLOAD, null=True, blank=True
     )
+    image_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Rendered thumbnails of the image, kept by base.renditions.",
+    )
     short_description = models.CharField(
         max_length=255,
         blank=True,
@@ -94,15 +100,46 @@ class Event(TimeStampedModel):
         help_text="The organizer who created this event",
     )
 
+    objects = EventQuerySet.as_manager()
+
+    slug_fallback = "event"
+    # collection routes matched before events/<slug>/ in events/urls.py
+    reserved_slugs = frozenset({"tags", "upcoming", "past", "import", "nearby"})
+
+    class Meta:
+        """Meta options for the Event model."""
+
+        indexes = [
+            # keyset pagination of the public and per-organizer event lists
+            models.Index(
+                fields=["is_active", "created_at", "id"],
+                name="events_active_created_idx",
+            ),
+            models.Index(
+                fields=["organizer", "created_at", "id"],
+                name="events_org_created_idx",
+            ),
+            # keyset pagination of the upcoming/past lists, scanned in either
+            # direction from "now"
+            models.Index(
+                fields=["start_date_time", "id"],
+                condition=models.Q(is_active=True),
+                name="events_active_start_idx",
+            ),
+            # an organization's events in date order (calendar feeds)
+            models.Index(
+                fields=["organizer", "start_date_time", "id"],
+                name="events_org_start_idx",
+            ),
+        ]
+
     def get_absolute_url(self):
         """Return the URL to access a particular event instance."""
         return f"/events/{self.slug}/"
 
-    def save(self, *args, **kwargs):
-        """Create slug before saving the event."""
-        if not self.slug:
-            self.slug = slugify(self.title)
-        return super().save(*args, **kwargs)
+    def get_slug_source(self) -> str:
+        """Build the slug from the event title."""
+        return self.title
 
     def __str__(self):
         """Return a string representation of the model."""
@@ -128,6 +165,16 @@ class Location(TimeStampedModel):
         related_name="location_country",
     )
 
+    class Meta:
+        """Meta options for the Location model."""
+
+        indexes = [
+            # bounding-box prefilter of the nearby events search (events.geo)
+            models.Index(
+                fields=["latitude", "longitude"], name="events_location_latlng_idx"
+            ),
+        ]
+
     def __str__(self):
         """Return a string representation of the model."""
         return self.venue
@@ -1,13 +1,19 @@
 """Serializers for the events app."""
 
+from drf_spectacular.utils import extend_schema_field
 from drf_writable_nested import WritableNestedModelSerializer
 from rest_framework import serializers
 
+from base.middleware import TimedSerializerMixin
+from base.renditions import RenditionsField
+from events.lookups import resolve_country, resolve_location
 from events.models import Country, Event, Location, Tag
-from speakers.serializers import SpeakerProfileSerializer
+from speakers.serializers import SpeakerCardSerializer
+from talks.models import Talks
+from talks.serializers import SessionSerializer
 
 
-class CountrySerializer(serializers.ModelSerializer):
+class CountrySerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for the Country model."""
 
     class Meta:
@@ -49,7 +55,7 @@ class CountrySerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class LocationSerializer(WritableNestedModelSerializer):
+class LocationSerializer(TimedSerializerMixin, WritableNestedModelSerializer):
     """Serializer for the Region model."""
 
     country = CountrySerializer(required=False)
@@ -61,7 +67,7 @@ class LocationSerializer(WritableNestedModelSerializer):
         exclude = ("created_at", "updated_at")
 
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for the Tag model."""
 
     class Meta:
@@ -74,55 +80,21 @@ class TagSerializer(serializers.ModelSerializer):
 def _resolve_location(location_data: dict | None) -> Location | None:
     """Handles the Country nested inside location using get_or_create so that
     picking an already-existing country never raises a unique-constraint error.
+
+    Both lookups go through the in-process caches in ``events.lookups``.
     """
     if not location_data:
         return None
 
-    country_data = location_data.pop("country", None)
-    country = None
+    country = resolve_country(location_data.pop("country", None))
+    return resolve_location(country, location_data)
 
-    if country_data:
-        name = country_data.get("name")
-        code = country_data.get("code")
-        lookup = {}
-        if name:
-            lookup["name"] = name
-        elif code:
-            lookup["code"] = code
 
-        if lookup:
-            country, _ = Country.objects.get_or_create(**lookup, defaults=country_data)
-
-    # Build location lookup fields (everything except country and the PK)
-    city = location_data.get("city", "")
-    venue = location_data.get("venue", "")
-    postal_code = location_data.get("postal_code", "")
-    address = location_data.get("address", "")
-
-    # Try to find an existing location that matches country + city + venue
-    existing_qs = Location.objects.filter(country=country, city=city, venue=venue)
-    if existing_qs.exists():
-        location = existing_qs.first()
-        # Update mutable fields in case they changed
-        location.postal_code = postal_code
-        location.address = address
-        location.save(update_fields=["postal_code", "address"])
-        return location
-
-    # Create a new location
-    return Location.objects.create(
-        country=country,
-        city=city,
-        venue=venue,
-        postal_code=postal_code,
-        address=address,
-    )
-
-
-class EventSerializer(WritableNestedModelSerializer):
+class EventSerializer(TimedSerializerMixin, WritableNestedModelSerializer):
     """Serializer for the Event model."""
 
     event_image = serializers.ImageField(required=False, allow_null=True)
+    event_image_renditions = RenditionsField(source="event_image")
     tags = serializers.PrimaryKeyRelatedField(
         many=True, queryset=Tag.objects.all(), required=False
     )
@@ -143,7 +115,7 @@ class EventSerializer(WritableNestedModelSerializer):
         """Meta class for the EventSerializer."""
 
         model = Event
-        exclude = ["created_at", "updated_at"]
+        exclude = ["created_at", "updated_at", "image_renditions"]
 
     # ------------------------------------------------------------------
     # Override create/update to resolve location → country via get_or_create
@@ -152,7 +124,11 @@ class EventSerializer(WritableNestedModelSerializer):
     # ------------------------------------------------------------------
 
     def to_representation(self, instance):
-        """Return full tag objects instead of plain UUIDs."""
+        """Return full tag objects instead of plain UUIDs.
+
+        ``tags.all()`` is served from the prefetch cache when the event comes
+        from ``Event.objects.for_listing()``.
+        """
         data = super().to_representation(instance)
         data["tags"] = TagSerializer(instance.tags.all(), many=True).data
         return data
@@ -215,13 +191,110 @@ class EventSerializer(WritableNestedModelSerializer):
         }
 
 
+class EventTalkSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    """A public talk of an event with its sessions."""
+
+    speaker = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    sessions = SessionSerializer(source="talk_sessions", many=True, read_only=True)
+
+    class Meta:
+        """Meta class for the EventTalkSerializer."""
+
+        model = Talks
+        fields = ["id", "slug", "title", "category", "duration", "speaker", "sessions"]
+
+
 class EventWithGuestSpeakersSerializer(EventSerializer):
-    """Extended Event serializer that includes full speaker profile data."""
+    """Extended Event serializer with the event's speakers and talks.
+
+    Serialize events from ``Event.objects.with_guest_speakers()`` to keep the
+    query count flat.
+    """
 
     speaker_profiles = serializers.SerializerMethodField()
     event_sessions = serializers.SerializerMethodField()
 
+    @extend_schema_field(SpeakerCardSerializer(many=True))
     def get_speaker_profiles(self, obj) -> list[dict]:
-        """Get detailed speaker profiles for this event."""
-        speakers = obj.speakers.all()
-        return SpeakerProfileSerializer(speakers, many=True).data
+        """Return a card for each of the event's speakers."""
+        return SpeakerCardSerializer(
+            obj.speakers.all(), many=True, context=self.context
+        ).data
+
+    @extend_schema_field(EventTalkSerializer(many=True))
+    def get_event_sessions(self, obj) -> list[dict]:
+        """Return the event's public talks with their sessions."""
+        talks = getattr(obj, "public_talks", None)
+        if talks is None:
+            talks = (
+                obj.talk_event.filter(is_public=True)
+                .select_related("speaker")
+                .prefetch_related("talk_sessions")
+                .order_by("title", "pk")
+            )
+        return EventTalkSerializer(talks, many=True, context=self.context).data
+
+
+class EventNearbyQuerySerializer(TimedSerializerMixin, serializers.Serializer):
+    """Query parameters of the nearby events search."""
+
+    lat = serializers.FloatField(min_value=-90, max_value=90)
+    lng = serializers.FloatField(min_value=-180, max_value=180)
+    radius_km = serializers.FloatField(
+        min_value=0.1, max_value=1000, required=False, default=25
+    )
+    limit = serializers.IntegerField(
+        min_value=1, max_value=100, required=False, default=50
+    )
+
+
+class EventDistanceSerializer(EventSerializer):
+    """Event serializer adding the distance from the searched point."""
+
+    distance_km = serializers.FloatField(read_only=True)
+
+
+class EventImportRowSerializer(TimedSerializerMixin, serializers.Serializer):
+    """One row of a bulk event import (see ``events.importer``)."""
+
+    title = serializers.CharField(max_length=255)
+    short_description = serializers.CharField(
+        max_length=255, required=False, allow_blank=True, default=""
+    )
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+    website = serializers.URLField(
+        max_length=255, required=False, allow_blank=True, allow_null=True
+    )
+    start_date_time = serializers.DateTimeField(required=False, allow_null=True)
+    end_date_time = serializers.DateTimeField(required=False, allow_null=True)
+    is_active = serializers.BooleanField(required=False, default=False)
+    venue = serializers.CharField(max_length=255, required=False)
+    city = serializers.CharField(max_length=255, required=False, default="")
+    address = serializers.CharField(max_length=255, required=False, default="")
+    postal_code = serializers.CharField(max_length=255, required=False, default="")
+    country = serializers.CharField(max_length=255, required=False)
+    latitude = serializers.DecimalField(
+        max_digits=9, decimal_places=6, required=False, allow_null=True
+    )
+    longitude = serializers.DecimalField(
+        max_digits=9, decimal_places=6, required=False, allow_null=True
+    )
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=100), required=False, default=list
+    )
+
+    def validate(self, attrs):
+        """Require a venue whenever other location details are given."""
+        location_fields = ("city", "address", "postal_code", "country", "latitude")
+        if "venue" not in attrs and any(attrs.get(name) for name in location_fields):
+            raise serializers.ValidationError(
+                {"venue": "A venue is required when a location is given."}
+            )
+        return attrs
+
+
+class EventImportFileSerializer(TimedSerializerMixin, serializers.Serializer):
+    """Upload of a JSON Lines or CSV file of events to import."""
+
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=["jsonl", "csv"], required=False)
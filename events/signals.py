@@ -0,0 +1,48 @@
+"""events signals."""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from base.renditions import track_renditions
+from events import lookups
+from events.cache import bump_feed_version
+from events.models import Country, Event, Location, Tag
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def invalidate_event_feed(sender, instance, raw=False, **kwargs):
+    """Drop the cached public feed when anything it renders changes."""
+    if raw:
+        return
+    bump_feed_version()
+
+
+@receiver(m2m_changed, sender=Event.tags.through)
+def invalidate_event_feed_tags(sender, action, **kwargs):
+    """Drop the cached public feed when an event's tags change."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_feed_version()
+
+
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def forget_cached_country(sender, instance, **kwargs):
+    """Drop a changed country from the in-process lookup cache."""
+    lookups.forget_country(instance)
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def forget_cached_location(sender, instance, **kwargs):
+    """Drop a changed location from the in-process lookup cache."""
+    lookups.forget_location(instance)
+
+
+track_renditions(Event, "event_image")
@@ -1,11 +1,17 @@
 """evetns tests."""
 
+import io
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from events.models import Event
+from base.slugs import allocate_unique_slugs
+from events.models import Country, Event, Location, Tag
 from organizations.choices import OrganizationRole
 from organizations.models import Organization, OrganizationMembership
 from users.models import User
@@ -49,13 +55,29 @@ class EventAPITestCase(TestCase):
         self.client.force_authenticate(user=self.user)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
         # Anonymous (sees active events)
         self.client.force_authenticate(user=None)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_titles_with_the_same_slug_are_deduplicated(self):
+        """Events whose titles slugify alike get numbered slugs."""
+        again = Event.objects.create(title="Test Event!", organizer=self.organization)
+        self.assertEqual(self.event.slug, "test-event")
+        self.assertEqual(again.slug, "test-event-2")
+
+    def test_collection_routes_are_never_event_slugs(self):
+        """Titles that slugify to a collection route get a numbered slug."""
+        event = Event.objects.create(title="Upcoming", organizer=self.organization)
+        self.assertEqual(event.slug, "upcoming-2")
+        url = reverse("events:event-detail", kwargs={"slug": event.slug})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            allocate_unique_slugs(Event, ["Past", "Nearby"]), ["past-2", "nearby-2"]
+        )
 
     def test_create_event(self):
         """Test creating a new event."""
@@ -117,3 +139,708 @@ class EventAPITestCase(TestCase):
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertTrue(Event.objects.filter(id=self.event.id).exists())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Query counts of the event endpoints
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class EventQueryCountTests(TestCase):
+    """The event list and detail run a fixed number of queries."""
+
+    def setUp(self):
+        """Create events, each with a location, a country and tags."""
+        cache.clear()
+        self.client = APIClient()
+        self.country = Country.objects.create(name="Ghana", code="GH")
+        self.tags = [Tag.objects.create(name=f"tag-{i}") for i in range(3)]
+
+    def _create_events(self, count):
+        """Create ``count`` active events."""
+        start = Event.objects.count()
+        for i in range(start, start + count):
+            location = Location.objects.create(venue=f"Venue {i}", country=self.country)
+            event = Event.objects.create(
+                title=f"Counted Event {i}", is_active=True, location=location
+            )
+            event.tags.set(self.tags)
+
+    def test_list_query_count_does_not_grow_with_events(self):
+        """Listing events costs the same queries for 2 or 15 events."""
+        url = reverse("events:event-list-create")
+        for count in (2, 13):
+            self._create_events(count)
+            with self.assertNumQueries(2):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        first = response.json()["results"][0]
+        self.assertEqual(first["location"]["country"]["name"], "Ghana")
+        self.assertEqual(len(first["tags"]), 3)
+
+    def test_detail_query_count(self):
+        """The detail view loads the event, location, country and tags in 2 queries."""
+        self._create_events(1)
+        event = Event.objects.get()
+        url = reverse("events:event-detail", kwargs={"slug": event.slug})
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data["tags"]), 3)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cached public event feed
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class PublicEventFeedCacheTests(TestCase):
+    """Anonymous event lists are served from the rendered-JSON cache."""
+
+    def setUp(self):
+        """Start from an empty cache with one active event."""
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("events:event-list-create")
+        self.event = Event.objects.create(title="Cached Conf", is_active=True)
+
+    def test_repeat_requests_skip_the_database(self):
+        """A second anonymous request is answered from the cache."""
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(second.json()["results"][0]["title"], "Cached Conf")
+
+    def test_matching_etag_gets_not_modified(self):
+        """A request carrying the current ETag gets an empty 304."""
+        etag = self.client.get(self.url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_changes_invalidate_the_feed(self):
+        """Saving an event, tag or location changes the served page."""
+        etag = self.client.get(self.url)["ETag"]
+
+        self.event.tags.add(Tag.objects.create(name="cache-tag"))
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"][0]["tags"][0]["name"], "cache-tag")
+
+        etag = response["ETag"]
+        self.event.location = Location.objects.create(venue="New Hall")
+        self.event.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.json()["results"][0]["location"]["venue"], "New Hall")
+
+    def test_unknown_and_reordered_params_share_the_entry(self):
+        """Only whitelisted parameters count toward the cache key."""
+        Event.objects.create(title="Other Conf", is_active=True)
+        clean = self.client.get(self.url, {"title": "cached", "page_size": 5})
+        with self.assertNumQueries(0):
+            noisy = self.client.get(f"{self.url}?x=1&page_size=5&title=cached")
+
+        self.assertEqual(noisy.content, clean.content)
+        self.assertEqual(len(noisy.json()["results"]), 1)
+
+    def test_unknown_params_do_not_fill_the_cache(self):
+        """A page rendered for junk parameters is served but not stored."""
+        junk = self.client.get(self.url, {"x": 1})
+        self.assertEqual(junk.json()["results"][0]["title"], "Cached Conf")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertGreater(len(queries), 0)
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {"x": 2})
+
+    def test_pages_are_cached_separately(self):
+        """Each cursor page has its own cache entry."""
+        for i in range(2):
+            Event.objects.create(title=f"Paged Conf {i}", is_active=True)
+        first = self.client.get(self.url, {"page_size": 2}).json()
+        second = self.client.get(first["next"]).json()
+
+        self.assertEqual(len(first["results"]), 2)
+        self.assertEqual(len(second["results"]), 1)
+        self.assertIsNone(second["next"])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Nearby events  —  GET /events/nearby/
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class EventNearbyTests(TestCase):
+    """Tests for the nearby events search."""
+
+    def setUp(self):
+        """Create active events around Accra, one far away and one inactive."""
+        self.client = APIClient()
+        self.url = reverse("events:event-nearby")
+        self.events = {}
+        for title, lat, lng, active in (
+            ("Accra Central", "5.603717", "-0.186964", True),
+            ("Tema Harbour", "5.669000", "-0.016600", True),
+            ("Kumasi", "6.688500", "-1.624400", True),
+            ("Accra Closed", "5.600000", "-0.190000", False),
+        ):
+            location = Location.objects.create(venue=title, latitude=lat, longitude=lng)
+            self.events[title] = Event.objects.create(
+                title=title, is_active=active, location=location
+            )
+
+    def test_returns_events_inside_radius_closest_first(self):
+        """Only active events inside the radius come back, by distance."""
+        response = self.client.get(
+            self.url, {"lat": 5.6037, "lng": -0.187, "radius_km": 30}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(
+            [row["title"] for row in results], ["Accra Central", "Tema Harbour"]
+        )
+        self.assertLess(results[0]["distance_km"], 0.1)
+        self.assertAlmostEqual(results[1]["distance_km"], 20.3, delta=0.5)
+
+    def test_wider_radius_includes_further_events(self):
+        """Kumasi, about 200 km away, shows up with a larger radius."""
+        response = self.client.get(
+            self.url, {"lat": 5.6037, "lng": -0.187, "radius_km": 250, "limit": 2}
+        )
+        self.assertEqual(len(response.data["results"]), 2)
+
+        response = self.client.get(
+            self.url, {"lat": 5.6037, "lng": -0.187, "radius_km": 250}
+        )
+        self.assertEqual(response.data["results"][-1]["title"], "Kumasi")
+
+    def test_search_across_the_antimeridian(self):
+        """The bounding box wraps around longitude 180."""
+        location = Location.objects.create(
+            venue="Fiji", latitude="-17.713400", longitude="178.065000"
+        )
+        Event.objects.create(title="Suva", is_active=True, location=location)
+        response = self.client.get(
+            self.url, {"lat": -17.7, "lng": -179.9, "radius_km": 300}
+        )
+        self.assertEqual([row["title"] for row in response.data["results"]], ["Suva"])
+
+    def test_invalid_coordinates_are_rejected(self):
+        """Missing or out of range coordinates are a 400."""
+        self.assertEqual(
+            self.client.get(self.url, {"lat": 5.6}).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertEqual(
+            self.client.get(self.url, {"lat": 95, "lng": 0}).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# iCalendar feeds
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class CalendarFeedTests(TestCase):
+    """Tests for the streamed iCalendar feeds."""
+
+    def setUp(self):
+        """Create an organization's events and a speaker's talks."""
+        from speakers.models import SpeakerProfile
+        from talks.models import Talks
+
+        self.client = APIClient()
+        self.owner = User.objects.create(username="ics_owner", email="ics@mail.com")
+        self.organization = Organization.objects.create(
+            name="ICS Org", email="ics@org.com", created_by=self.owner
+        )
+        location = Location.objects.create(
+            venue="Main Hall",
+            city="Accra",
+            country=Country.objects.create(name="Ghana"),
+        )
+        self.event = Event.objects.create(
+            title="Calendar Conf, 2026",
+            short_description="Talks; workshops",
+            is_active=True,
+            location=location,
+            organizer=self.organization,
+        )
+        Event.objects.create(title="Hidden Conf", is_active=False)
+        self.speaker = SpeakerProfile.objects.get(user_account=self.owner)
+        Talks.objects.create(
+            title="Streaming Django",
+            description="d",
+            speaker=self.speaker,
+            duration=30,
+            category="ai and ml",
+            event=self.event,
+            is_public=True,
+        )
+
+    def _body(self, response):
+        """Return the streamed body as text."""
+        return b"".join(response.streaming_content).decode()
+
+    def test_event_feed_streams_active_events(self):
+        """The feed is a streamed VCALENDAR of the active events."""
+        response = self.client.get(reverse("events:event-calendar"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        body = self._body(response)
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertIn("SUMMARY:Calendar Conf\\, 2026\r\n", body)
+        self.assertIn("DESCRIPTION:Talks\\; workshops\r\n", body)
+        self.assertIn("LOCATION:Main Hall\\, Accra\\, Ghana\r\n", body)
+        self.assertNotIn("Hidden Conf", body)
+
+    def test_unchanged_feed_costs_one_query(self):
+        """Matching validators get a 304 after a single aggregate query."""
+        url = reverse("events:event-calendar")
+        first = self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.event.title = "Calendar Conf Renamed"
+        self.event.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_organization_and_speaker_feeds(self):
+        """Per-organization and per-speaker feeds hold their own entries."""
+        response = self.client.get(
+            reverse(
+                "events:organization-event-calendar",
+                kwargs={"slug": self.organization.slug},
+            )
+        )
+        self.assertIn("SUMMARY:Calendar Conf\\, 2026", self._body(response))
+
+        response = self.client.get(
+            reverse("events:speaker-talk-calendar", kwargs={"slug": self.speaker.slug})
+        )
+        body = self._body(response)
+        self.assertIn("SUMMARY:Streaming Django (Calendar Conf\\, 2026)", body)
+        self.assertIn("UID:talk-", body)
+
+    def test_unknown_owner_is_not_found(self):
+        """A feed for an unknown slug is a 404, even for calendar clients."""
+        response = self.client.get(
+            reverse("events:speaker-talk-calendar", kwargs={"slug": "nobody"}),
+            HTTP_ACCEPT="text/calendar",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Country / location lookup cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class LocationLookupCacheTests(TestCase):
+    """Tests for the in-process country and location caches."""
+
+    def setUp(self):
+        """Start every test with empty caches."""
+        from events import lookups
+
+        self.lookups = lookups
+        for cache_ in (lookups.countries, lookups.locations):
+            cache_.clear()
+            self.addCleanup(cache_.clear)
+        self.data = {"venue": "Hall A", "city": "Accra", "country": {"name": "Ghana"}}
+
+    def _resolve(self, data):
+        """Resolve ``data`` as an event write does, committing the caches."""
+        from events.serializers import _resolve_location
+
+        with self.captureOnCommitCallbacks(execute=True):
+            return _resolve_location({**data, "country": dict(data["country"])})
+
+    def test_repeat_resolution_skips_the_database(self):
+        """Once committed, the same country and location cost no queries."""
+        first = self._resolve(self.data)
+        with self.assertNumQueries(0):
+            second = self._resolve(self.data)
+        self.assertEqual(second.pk, first.pk)
+        self.assertEqual(second.country.name, "Ghana")
+
+    def test_existing_location_is_found_with_one_query(self):
+        """An uncached location is looked up once, not exists() then first()."""
+        country = Country.objects.create(name="Ghana")
+        location = Location.objects.create(
+            venue="Hall A", city="Accra", country=country
+        )
+        self.lookups.countries.set(("name", "Ghana"), country)
+
+        with self.assertNumQueries(1):
+            resolved = self._resolve(self.data)
+        self.assertEqual(resolved.pk, location.pk)
+
+    def test_changed_address_is_saved_without_touching_the_cached_row(self):
+        """New postal details are written to a copy of the cached location."""
+        cached = self._resolve(self.data)
+        updated = self._resolve({**self.data, "postal_code": "GA-123"})
+
+        self.assertEqual(cached.postal_code, "")
+        self.assertEqual(updated.pk, cached.pk)
+        self.assertEqual(Location.objects.get(pk=cached.pk).postal_code, "GA-123")
+        self.assertEqual(self._resolve(self.data).postal_code, "")
+
+    def test_deleted_rows_are_forgotten(self):
+        """Deleting a location or country drops it from the cache."""
+        location = self._resolve(self.data)
+        location.country.delete()
+
+        recreated = self._resolve(self.data)
+        self.assertNotEqual(recreated.pk, location.pk)
+        self.assertTrue(Location.objects.filter(pk=recreated.pk).exists())
+
+    def test_uncommitted_rows_are_not_cached(self):
+        """Rows from a transaction that never committed are not remembered."""
+        from events.serializers import _resolve_location
+
+        _resolve_location({**self.data, "country": {"name": "Ghana"}})
+        self.assertIsNone(self.lookups.countries.get(("name", "Ghana")))
+        self.assertIsNone(self.lookups.locations.get((None, "Accra", "Hall A")))
+
+    def test_lru_cache_is_bounded(self):
+        """The least recently used entry is evicted past ``maxsize``."""
+        cache_ = self.lookups.LRUCache(maxsize=2)
+        for key in ("a", "b"):
+            cache_.set(key, key)
+        cache_.get("a")
+        cache_.set("c", "c")
+        self.assertIsNone(cache_.get("b"))
+        self.assertEqual(cache_.get("a"), "a")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Bulk event import
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class EventImportTests(TestCase):
+    """Tests for the bulk event import endpoint and command."""
+
+    def setUp(self):
+        """Create an organization admin and an existing event."""
+        self.client = APIClient()
+        self.url = reverse("events:event-import")
+        self.user = User.objects.create(username="importer", email="imp@mail.com")
+        self.organization = Organization.objects.create(
+            name="Import Org", email="import@org.com", created_by=self.user
+        )
+        OrganizationMembership.objects.create(
+            user=self.user,
+            organization=self.organization,
+            role=OrganizationRole.ADMIN.value,
+        )
+        self.country = Country.objects.create(name="Ghana")
+        self.location = Location.objects.create(
+            venue="Main Hall", city="Accra", country=self.country
+        )
+        Event.objects.create(title="Existing Conf")
+
+    def _upload(self, name, content, **extra):
+        """POST ``content`` as an uploaded file called ``name``."""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        self.client.force_authenticate(self.user)
+        return self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile(name, content.encode()), **extra},
+            format="multipart",
+        )
+
+    def test_jsonl_import_reports_bad_rows_and_keeps_the_rest(self):
+        """Valid rows are imported with their location and tags; bad rows are listed."""
+        lines = [
+            '{"title": "Past Conf 2019", "venue": "Main Hall", "city": "Accra", '
+            '"country": "Ghana", "tags": ["python", "web"], "is_active": true, '
+            '"start_date_time": "2019-05-01T09:00:00Z"}',
+            '{"title": "Past Conf 2020", "venue": "Annex", "city": "Kumasi", '
+            '"country": "Ghana", "tags": ["python"]}',
+            "not json",
+            '{"title": "Existing Conf"}',
+            '{"title": "Past Conf 2019"}',
+            '{"city": "Accra"}',
+        ]
+        response = self._upload("events.jsonl", "\n".join(lines))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(
+            [error["row"] for error in response.data["errors"]], [3, 4, 5, 6]
+        )
+
+        event = Event.objects.get(title="Past Conf 2019")
+        self.assertEqual(event.location, self.location)
+        self.assertEqual(event.organizer, self.organization)
+        self.assertEqual(event.slug, "past-conf-2019")
+        self.assertEqual({tag.name for tag in event.tags.all()}, {"python", "web"})
+        self.assertEqual(
+            Event.objects.get(title="Past Conf 2020").location.city, "Kumasi"
+        )
+        self.assertEqual(Country.objects.count(), 1)
+
+    def test_csv_import(self):
+        """CSV rows are imported, with tags separated by semicolons."""
+        content = (
+            "title,venue,city,country,tags,is_active\n"
+            "CSV Conf,Main Hall,Accra,Ghana,python; data,true\n"
+            "CSV Meetup,,,,,\n"
+        )
+        response = self._upload("events.csv", content)
+
+        self.assertEqual(response.data, {"created": 2, "errors": []})
+        event = Event.objects.get(title="CSV Conf")
+        self.assertTrue(event.is_active)
+        self.assertEqual(event.tags.count(), 2)
+        self.assertIsNone(Event.objects.get(title="CSV Meetup").location)
+
+    def test_batches_are_written_with_a_fixed_number_of_queries(self):
+        """A batch costs the same queries for 3 or 30 rows."""
+        from events.importer import import_events
+
+        def run(count, prefix):
+            rows = "\n".join(
+                f'{{"title": "{prefix} {i}", "venue": "Hall {i}", "country": "Ghana", '
+                f'"tags": ["t{i}"]}}'
+                for i in range(count)
+            )
+            with CaptureQueriesContext(connection) as queries:
+                report = import_events(
+                    io.BytesIO(rows.encode()), "jsonl", self.organization
+                )
+            self.assertEqual(report["created"], count)
+            return len(queries)
+
+        self.assertEqual(run(3, "Small"), run(30, "Large"))
+
+    def test_unknown_format_is_rejected(self):
+        """Files that are neither JSON Lines nor CSV need an explicit format."""
+        response = self._upload("events.txt", '{"title": "X"}')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self._upload("events.txt", '{"title": "X"}', format="jsonl")
+        self.assertEqual(response.data, {"created": 1, "errors": []})
+
+    def test_management_command(self):
+        """The command imports a file for the given organization."""
+        import tempfile
+
+        from django.core.management import call_command
+
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl") as handle:
+            handle.write('{"title": "Command Conf"}\n')
+            handle.flush()
+            out = io.StringIO()
+            call_command(
+                "import_events",
+                handle.name,
+                organization=self.organization.slug,
+                stdout=out,
+            )
+        self.assertIn("Imported 1 event(s)", out.getvalue())
+        self.assertEqual(
+            Event.objects.get(title="Command Conf").organizer, self.organization
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Event list filters
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class EventFilterTests(TestCase):
+    """The event list honours the ``EventFilter`` query parameters."""
+
+    def setUp(self):
+        """Create active events from two organizations."""
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("events:event-list-create")
+        owner = User.objects.create(username="filter_owner", email="f@mail.com")
+        pycon = Organization.objects.create(
+            name="Python Ghana", email="py@org.com", created_by=owner
+        )
+        devfest = Organization.objects.create(
+            name="GDG Accra", email="gdg@org.com", created_by=owner
+        )
+        location = Location.objects.create(
+            venue="Kempinski Hotel", country=Country.objects.create(name="Ghana")
+        )
+        Event.objects.create(
+            title="PyCon Ghana", is_active=True, organizer=pycon, location=location
+        )
+        Event.objects.create(title="DevFest Accra", is_active=True, organizer=devfest)
+
+    def _titles(self, **params):
+        """Return the titles listed for ``params``."""
+        return [
+            row["title"] for row in self.client.get(self.url, params).json()["results"]
+        ]
+
+    def test_filters_by_organizer_name(self):
+        """``organizer`` matches the organization name, case-insensitively."""
+        self.assertEqual(self._titles(organizer="python gh"), ["PyCon Ghana"])
+
+    def test_filters_by_title_venue_and_country(self):
+        """The other filters match their fields case-insensitively."""
+        self.assertEqual(self._titles(title="devfest"), ["DevFest Accra"])
+        self.assertEqual(self._titles(venue="kempinski"), ["PyCon Ghana"])
+        self.assertEqual(self._titles(country="GHANA"), ["PyCon Ghana"])
+        self.assertEqual(len(self._titles()), 2)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Upcoming / past events
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class EventTimelineTests(TestCase):
+    """Tests for the upcoming and past event lists."""
+
+    def setUp(self):
+        """Create active events on both sides of now, plus an inactive one."""
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        self.client = APIClient()
+        now = timezone.now()
+        for days in (-3, -1, 1, 2, 5):
+            Event.objects.create(
+                title=f"Day {days}",
+                is_active=True,
+                start_date_time=now + timedelta(days=days),
+            )
+        Event.objects.create(
+            title="Hidden", is_active=False, start_date_time=now + timedelta(days=1)
+        )
+
+    def _walk(self, name):
+        """Follow the cursor through every page of size 2."""
+        titles = []
+        url = reverse(name) + "?page_size=2"
+        while url:
+            page = self.client.get(url).data
+            titles += [row["title"] for row in page["results"]]
+            url = page["next"]
+        return titles
+
+    def test_upcoming_events_soonest_first(self):
+        """Upcoming events page forward in start order."""
+        self.assertEqual(
+            self._walk("events:event-upcoming"), ["Day 1", "Day 2", "Day 5"]
+        )
+
+    def test_past_events_latest_first(self):
+        """Past events page backwards from now."""
+        self.assertEqual(self._walk("events:event-past"), ["Day -1", "Day -3"])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Event page with guest speakers
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class EventGuestSpeakersTests(TestCase):
+    """The event page's speakers and talks cost a fixed number of queries."""
+
+    def setUp(self):
+        """Create an event with a location and tags."""
+        self.client = APIClient()
+        self.event = Event.objects.create(
+            title="Guest Conf",
+            is_active=True,
+            location=Location.objects.create(
+                venue="Hall", country=Country.objects.create(name="Ghana")
+            ),
+        )
+        self.event.tags.set([Tag.objects.create(name="python")])
+        self.url = reverse(
+            "events:event-guest-speakers", kwargs={"slug": self.event.slug}
+        )
+
+    def _add_speakers(self, count):
+        """Add ``count`` speakers, each with a public talk with a session."""
+        from speakers.models import SpeakerProfile, SpeakerSocialLinks
+        from talks.models import Session, Talks
+
+        start = self.event.speakers.count()
+        for i in range(start, start + count):
+            user = User.objects.create(
+                username=f"guest{i}", email=f"guest{i}@mail.com", first_name="Guest"
+            )
+            speaker = SpeakerProfile.objects.get(user_account=user)
+            SpeakerSocialLinks.objects.create(
+                speaker=speaker, name="x", link=f"https://x.com/guest{i}"
+            )
+            speaker.events_spoken.add(self.event)
+            talk = Talks.objects.create(
+                title=f"Talk {i}",
+                description="d",
+                speaker=speaker,
+                duration=30,
+                category="ai and ml",
+                event=self.event,
+                is_public=True,
+            )
+            Session.objects.create(type="Keynote", duration=30, talk=talk)
+
+    def test_query_count_does_not_grow_with_speakers(self):
+        """3 or 60 speakers are served with the same five queries."""
+        for count in (3, 57):
+            self._add_speakers(count)
+            with self.assertNumQueries(5):
+                response = self.client.get(self.url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(len(response.data["speaker_profiles"]), 60)
+        self.assertEqual(len(response.data["event_sessions"]), 60)
+        card = response.data["speaker_profiles"][0]
+        self.assertEqual(card["speaker_name"].split()[0], "Guest")
+        self.assertNotIn("social_links", card)
+        talk = response.data["event_sessions"][0]
+        self.assertEqual(talk["sessions"][0]["type"], "Keynote")
+
+    def test_cards_show_follow_state_and_hide_private_talks(self):
+        """Viewers see whom they follow; private talks stay off the page."""
+        from speakers.models import SpeakerFollow
+
+        self._add_speakers(2)
+        followed = self.event.speakers.order_by("user_account__username").first()
+        self.event.talk_event.filter(speaker=followed).update(is_public=False)
+        viewer = User.objects.create(username="viewer", email="viewer@mail.com")
+        SpeakerFollow.objects.create(follower=viewer, speaker=followed)
+
+        self.client.force_authenticate(viewer)
+        response = self.client.get(self.url)
+        following = {
+            card["slug"]: card["is_following"]
+            for card in response.data["speaker_profiles"]
+        }
+        self.assertEqual(sum(following.values()), 1)
+        self.assertTrue(following[followed.slug])
+        self.assertEqual(
+            [talk["speaker"] for talk in response.data["event_sessions"]],
+            [slug for slug in following if slug != followed.slug],
+        )
@@ -8,6 +8,30 @@ app_name = "events"
 
 urlpatterns = [
     path("events/tags/", views.TagListView.as_view(), name="tag-list"),
+    path(
+        "events/calendar.ics",
+        views.EventCalendarView.as_view(),
+        name="event-calendar",
+    ),
+    path(
+        "organizations/<slug:slug>/calendar.ics",
+        views.OrganizationEventCalendarView.as_view(),
+        name="organization-event-calendar",
+    ),
+    path(
+        "speakers/<slug:slug>/calendar.ics",
+        views.SpeakerTalkCalendarView.as_view(),
+        name="speaker-talk-calendar",
+    ),
+    path("events/upcoming/", views.EventUpcomingView.as_view(), name="event-upcoming"),
+    path("events/past/", views.EventPastView.as_view(), name="event-past"),
+    path("events/import/", views.EventImportView.as_view(), name="event-import"),
+    path("events/nearby/", views.EventNearbyView.as_view(), name="event-nearby"),
     path("events/", views.EventListView.as_view(), name="event-list-create"),
     path("events/<str:slug>/", views.EventDetailView.as_view(), name="event-detail"),
+    path(
+        "events/<str:slug>/speakers/",
+        views.EventGuestSpeakersView.as_view(),
+        name="event-guest-speakers",
+    ),
 ]
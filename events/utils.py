@@ -5,20 +5,22 @@ from django.http import Http404
 from organizations.models import Organization, OrganizationMembership
 
 
-def create_event_payload(request):
-    """Create event payload."""
+def get_event_organization(user):
+    """Return the organization ``user`` may create events for."""
     try:
-        user = request.user
         membership = OrganizationMembership.objects.get(user=user)
         if membership.is_admins() or membership.is_organizers():
-            organization = membership.organization
-        else:
-            raise Http404("User does not have permission to create an event.")
+            return membership.organization
+        raise Http404("User does not have permission to create an event.")
     except Organization.DoesNotExist as err:
         raise Http404("User does not belong to any organization.") from err
     except OrganizationMembership.DoesNotExist as err:
         raise Http404("User is not a member of the organization.") from err
 
+
+def create_event_payload(request):
+    """Create event payload."""
+    organization = get_event_organization(request.user)
     payload = request.data.copy()
     payload["organizer"] = organization.id
     return payload
@@ -1,34 +1,79 @@
 """Events views."""
 
+from django.conf import settings
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema
-from rest_framework import status
-from rest_framework.permissions import AllowAny
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, parse_etags
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from base.pagination import CursorPaginationMixin, cursor_paginated
 from base.permissions import IsOrganizationAdminOrOrganizer
+from events.cache import (
+    feed_cache_key,
+    feed_entry,
+    get_cached_feed,
+    set_cached_feed,
+)
+from events.calendar import (
+    ICS_CONTENT_TYPE,
+    ICalendarRenderer,
+    feed_validators,
+    stream_events,
+    stream_talks,
+)
+from events.filters import EventFilter
+from events.geo import nearest
+from events.importer import detect_format, import_events
 from events.models import Event, Tag
-from events.serializers import EventSerializer, TagSerializer
-from events.utils import create_event_payload
-from organizations.models import OrganizationMembership
+from events.serializers import (
+    EventDistanceSerializer,
+    EventImportFileSerializer,
+    EventNearbyQuerySerializer,
+    EventSerializer,
+    EventWithGuestSpeakersSerializer,
+    TagSerializer,
+)
+from events.utils import create_event_payload, get_event_organization
+from organizations.models import Organization, OrganizationMembership
+from speakers.models import SpeakerProfile
+from talks.models import Talks
 
+# query parameters that select a page of the cached public feed; any other
+# parameter is left out of its cache key
+FEED_CACHE_PARAMS = ("cursor", "page_size", *EventFilter.Meta.fields)
 
-class TagListView(APIView):
+
+class TagListView(CursorPaginationMixin, APIView):
     """List and create event tags."""
 
+    cursor_ordering = ("name", "id")
+
     def get_permissions(self):
         """GET is public; POST requires organizer/admin."""
         if self.request.method == "GET":
             return [AllowAny()]
         return [IsOrganizationAdminOrOrganizer()]
 
-    @extend_schema(tags=["Tags"], responses={200: TagSerializer(many=True)})
+    @extend_schema(tags=["Tags"], responses={200: cursor_paginated(TagSerializer)})
     def get(self, request, *args, **kwargs):
-        """List all tags."""
-        tags = Tag.objects.all().order_by("name")
+        """List tags in name order."""
+        tags = self.paginate_queryset(Tag.objects.all())
         serializer = TagSerializer(tags, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.get_paginated_response(serializer.data)
 
     @extend_schema(tags=["Tags"], request=TagSerializer, responses={201: TagSerializer})
     def post(self, request, *args, **kwargs):
@@ -40,7 +85,7 @@ class TagListView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class EventListView(APIView):
+class EventListView(CursorPaginationMixin, APIView):
     """event list view."""
 
     def get_permissions(self):
@@ -49,21 +94,69 @@ class EventListView(APIView):
             return [AllowAny()]
         return [IsOrganizationAdminOrOrganizer()]
 
-    @extend_schema(tags=["Events"], responses={200: EventSerializer(many=True)})
+    @extend_schema(
+        tags=["Events"],
+        parameters=[
+            OpenApiParameter(name, str, description=f"Case-insensitive {name} match.")
+            for name in EventFilter.Meta.fields
+        ],
+        responses={200: cursor_paginated(EventSerializer)},
+    )
     def get(self, request, *args, **kwargs):
         """List events."""
-        events = Event.objects.all()
-        if request.user.is_authenticated:
-            try:
-                membership = OrganizationMembership.objects.get(user=request.user)
-                events = events.filter(organizer=membership.organization)
-            except OrganizationMembership.DoesNotExist:
-                events = events.filter(is_active=True)
-        else:
+        if not request.user.is_authenticated:
+            return self.get_public_feed(request)
+
+        events = self.filter_events(Event.objects.for_listing())
+        try:
+            membership = OrganizationMembership.objects.get(user=request.user)
+            events = events.filter(organizer=membership.organization)
+        except OrganizationMembership.DoesNotExist:
             events = events.filter(is_active=True)
 
-        serializer = EventSerializer(events, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = EventSerializer(self.paginate_queryset(events), many=True)
+        return self.get_paginated_response(serializer.data)
+
+    def filter_events(self, events):
+        """Apply the ``EventFilter`` query parameters."""
+        return EventFilter(self.request.query_params, queryset=events).qs
+
+    def get_public_feed(self, request):
+        """Serve a page of active events from the rendered-JSON cache.
+
+        Hits skip the database and the serializer; a matching
+        ``If-None-Match`` gets a 304.
+        """
+        query = request.query_params
+        params = {name: query[name] for name in FEED_CACHE_PARAMS if query.get(name)}
+        params["page_size"] = self.paginator.get_page_size(request)
+        key = feed_cache_key(f"{request.scheme}://{request.get_host()}", params)
+        entry = get_cached_feed(key)
+        if entry is None:
+            events = self.filter_events(Event.objects.for_listing()).filter(
+                is_active=True
+            )
+            serializer = EventSerializer(self.paginate_queryset(events), many=True)
+            page = self.get_paginated_response(serializer.data).data
+            body = JSONRenderer().render(page)
+            # the page's links repeat the request's query string, so pages
+            # rendered for unknown or repeated parameters are not stored
+            if all(
+                name in FEED_CACHE_PARAMS and len(query.getlist(name)) == 1
+                for name in query
+            ):
+                entry = set_cached_feed(key, body)
+            else:
+                entry = feed_entry(body)
+
+        etag, body = entry
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(body, content_type="application/json")
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Authorization"])
+        return response
 
     @extend_schema(
         tags=["Events"], request=EventSerializer, responses={201: EventSerializer}
@@ -78,6 +171,132 @@ class EventListView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class EventTimelineView(CursorPaginationMixin, APIView):
+    """Base view paging active events by start date around "now".
+
+    Subclasses set ``cursor_ordering`` and ``filter_timeline``; the partial
+    ``events_active_start_idx`` index makes each page an index range scan.
+    """
+
+    permission_classes = [AllowAny]
+
+    def filter_timeline(self, events, now):
+        """Keep the events on this side of ``now``."""
+        raise NotImplementedError
+
+    @extend_schema(tags=["Events"], responses={200: cursor_paginated(EventSerializer)})
+    def get(self, request, *args, **kwargs):
+        """List one page of events."""
+        events = self.filter_timeline(
+            Event.objects.for_listing().filter(is_active=True), timezone.now()
+        )
+        serializer = EventSerializer(self.paginate_queryset(events), many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+class EventUpcomingView(EventTimelineView):
+    """Active events that haven't started yet, soonest first."""
+
+    cursor_ordering = ("start_date_time", "id")
+
+    def filter_timeline(self, events, now):
+        """Keep events starting from now on."""
+        return events.filter(start_date_time__gte=now)
+
+
+class EventPastView(EventTimelineView):
+    """Active events that have already started, most recent first."""
+
+    cursor_ordering = ("-start_date_time", "-id")
+
+    def filter_timeline(self, events, now):
+        """Keep events that started before now."""
+        return events.filter(start_date_time__lt=now)
+
+
+class EventImportView(APIView):
+    """Bulk import of events from a JSON Lines or CSV file."""
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    @extend_schema(
+        tags=["Events"],
+        request=EventImportFileSerializer,
+        responses={
+            200: inline_serializer(
+                name="EventImportReport",
+                fields={
+                    "created": serializers.IntegerField(),
+                    "errors": serializers.ListField(child=serializers.DictField()),
+                },
+            )
+        },
+    )
+    def post(self, request, *args, **kwargs):
+        """Import the uploaded events for the user's organization.
+
+        Invalid rows are listed in ``errors`` by row number; the other rows
+        are still imported.
+        """
+        organization = get_event_organization(request.user)
+        upload = EventImportFileSerializer(data=request.data)
+        upload.is_valid(raise_exception=True)
+        file = upload.validated_data["file"]
+        fmt = upload.validated_data.get("format") or detect_format(file.name)
+        if fmt is None:
+            raise ValidationError(
+                {"format": "Use a .jsonl or .csv file or give the format."}
+            )
+        report = import_events(file, fmt, organization)
+        return Response(report, status=status.HTTP_200_OK)
+
+
+class EventNearbyView(APIView):
+    """Active events within a radius of a point, closest first."""
+
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        tags=["Events"],
+        parameters=[EventNearbyQuerySerializer],
+        responses={
+            200: inline_serializer(
+                name="EventNearbyList",
+                fields={"results": EventDistanceSerializer(many=True)},
+            )
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        """List active events within ``radius_km`` of ``lat``/``lng``."""
+        query = EventNearbyQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        ranked = nearest(
+            Event.objects.filter(is_active=True),
+            params["lat"],
+            params["lng"],
+            params["radius_km"],
+            params["limit"],
+        )
+        # rows deleted or deactivated since the ranking query are skipped
+        events = (
+            Event.objects.for_listing()
+            .filter(is_active=True)
+            .in_bulk([pk for pk, _ in ranked])
+        )
+        results = []
+        for pk, distance in ranked:
+            event = events.get(pk)
+            if event is None:
+                continue
+            event.distance_km = round(distance, 3)
+            results.append(event)
+        serializer = EventDistanceSerializer(results, many=True)
+        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+
+
 class EventDetailView(APIView):
     """get event detail view."""
 
@@ -90,7 +309,7 @@ class EventDetailView(APIView):
     @extend_schema(tags=["Events"], responses={200: EventSerializer})
     def get(self, request, slug, *args, **kwargs):
         """Retrieve event detail."""
-        event = get_object_or_404(Event, slug=slug)
+        event = get_object_or_404(Event.objects.for_listing(), slug=slug)
         serializer = EventSerializer(event)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -114,3 +333,123 @@ class EventDetailView(APIView):
         self.check_object_permissions(request, event)
         event.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class EventGuestSpeakersView(APIView):
+    """An event with its speaker cards and public talks."""
+
+    permission_classes = [AllowAny]
+
+    @extend_schema(tags=["Events"], responses={200: EventWithGuestSpeakersSerializer})
+    def get(self, request, slug, *args, **kwargs):
+        """Retrieve an event page with its speakers and sessions."""
+        event = get_object_or_404(
+            Event.objects.with_guest_speakers(request.user), slug=slug
+        )
+        serializer = EventWithGuestSpeakersSerializer(event)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class CalendarFeedView(APIView):
+    """Base view streaming an iCalendar feed with conditional GET support.
+
+    Subclasses return the feed rows from ``get_queryset`` and stream them
+    with ``stream``. Unchanged feeds are answered with a 304 after a single
+    aggregate query.
+    """
+
+    permission_classes = [AllowAny]
+    renderer_classes = [JSONRenderer, ICalendarRenderer]
+    timestamp_fields = ("updated_at",)
+
+    def get_queryset(self, **kwargs):
+        """Return the rows of the feed."""
+        raise NotImplementedError
+
+    def owner_exists(self, **kwargs) -> bool:
+        """Return whether the feed's speaker or organization exists."""
+        return True
+
+    def get_calendar_name(self, **kwargs) -> str:
+        """Return the calendar display name."""
+        return f"{settings.SITE_NAME} events"
+
+    def stream(self, name, queryset):
+        """Return the iterator of calendar chunks."""
+        return stream_events(name, queryset)
+
+    @extend_schema(
+        tags=["Events"],
+        responses={(200, "text/calendar"): {"type": "string"}},
+    )
+    def get(self, request, *args, **kwargs):
+        """Stream the calendar, or answer 304 when the client's copy is current."""
+        queryset = self.get_queryset(**kwargs)
+        etag, last_modified, count = feed_validators(queryset, *self.timestamp_fields)
+        # an empty feed may be an unknown slug
+        if not count and not self.owner_exists(**kwargs):
+            raise Http404
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if response is None:
+            response = StreamingHttpResponse(
+                self.stream(self.get_calendar_name(**kwargs), queryset),
+                content_type=ICS_CONTENT_TYPE,
+            )
+        response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+
+class EventCalendarView(CalendarFeedView):
+    """iCalendar feed of all active events."""
+
+    def get_queryset(self, **kwargs):
+        """Return the active events, soonest first."""
+        return Event.objects.filter(is_active=True).order_by("start_date_time", "id")
+
+
+class OrganizationEventCalendarView(CalendarFeedView):
+    """iCalendar feed of an organization's active events."""
+
+    def get_queryset(self, slug, **kwargs):
+        """Return the organization's active events, soonest first."""
+        return Event.objects.filter(is_active=True, organizer__slug=slug).order_by(
+            "start_date_time", "id"
+        )
+
+    def owner_exists(self, slug, **kwargs) -> bool:
+        """Return whether the organization exists."""
+        return Organization.objects.filter(slug=slug).exists()
+
+    def get_calendar_name(self, slug, **kwargs) -> str:
+        """Name the calendar after the organization slug."""
+        return f"{settings.SITE_NAME}: {slug}"
+
+
+class SpeakerTalkCalendarView(CalendarFeedView):
+    """iCalendar feed of a speaker's public talks, timed by their events."""
+
+    timestamp_fields = ("updated_at", "event__updated_at")
+
+    def get_queryset(self, slug, **kwargs):
+        """Return the speaker's public talks at an event, soonest first."""
+        return Talks.objects.filter(
+            speaker__slug=slug, is_public=True, event__isnull=False
+        ).order_by("event__start_date_time", "id")
+
+    def owner_exists(self, slug, **kwargs) -> bool:
+        """Return whether the speaker exists."""
+        return SpeakerProfile.objects.filter(slug=slug).exists()
+
+    def get_calendar_name(self, slug, **kwargs) -> str:
+        """Name the calendar after the speaker slug."""
+        return f"{settings.SITE_NAME}: {slug}"
+
+    def stream(self, name, queryset):
+        """Stream talks instead of events."""
+        return stream_talks(name, queryset)
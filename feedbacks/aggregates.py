@@ -0,0 +1,197 @@
+"""feedbacks aggregates.
+
+Per-speaker rating statistics are kept as running moments (count, sum and
+sum of squares per rating dimension) plus a histogram of the 1-10 values, so
+means, standard deviations and distributions come from a single row whatever
+the number of feedback rows behind it.
+"""
+
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from feedbacks.models import Feedback, FeedbackArchive, SpeakerFeedbackAggregate
+
+RATING_FIELDS = (
+    "overall_rating",
+    "engagement",
+    "clarity",
+    "content_depth",
+    "speaker_knowledge",
+    "practical_relevance",
+)
+
+RATING_VALUES = range(1, 11)
+
+MOMENT_FIELDS = ("count",) + tuple(
+    f"{field}_{suffix}" for field in RATING_FIELDS for suffix in ("sum", "sum_squares")
+)
+
+# set while feedback is moved to the archive, whose statistics it keeps
+_paused = ContextVar("feedback_aggregates_paused", default=False)
+
+
+def empty_histograms() -> dict:
+    """Return zeroed histograms for every rating dimension."""
+    return {field: [0] * len(RATING_VALUES) for field in RATING_FIELDS}
+
+
+@contextmanager
+def paused_aggregates():
+    """Leave the aggregates untouched by feedback deleted in this block."""
+    token = _paused.set(True)
+    try:
+        yield
+    finally:
+        _paused.reset(token)
+
+
+def moments(rows) -> dict:
+    """Return the count, sums, sums of squares and histograms of rating rows.
+
+    ``rows`` are mappings holding the rating fields; the result has the
+    layout of a ``SpeakerFeedbackAggregate``'s statistics.
+    """
+    stats = dict.fromkeys(MOMENT_FIELDS, 0)
+    stats["histograms"] = empty_histograms()
+    for row in rows:
+        stats["count"] += 1
+        for field in RATING_FIELDS:
+            value = row[field]
+            stats[f"{field}_sum"] += value
+            stats[f"{field}_sum_squares"] += value * value
+            if value in RATING_VALUES:
+                stats["histograms"][field][value - RATING_VALUES.start] += 1
+    return stats
+
+
+def _add_statistics(aggregate: SpeakerFeedbackAggregate, stats: dict) -> None:
+    """Add ``moments()`` output to an unsaved aggregate."""
+    for field in MOMENT_FIELDS:
+        setattr(aggregate, field, getattr(aggregate, field) + stats.get(field, 0))
+    for field, counts in stats.get("histograms", {}).items():
+        for i, count in enumerate(counts):
+            aggregate.histograms[field][i] += count
+
+
+def _apply_statistics(speaker_id, stats: dict, sign: int = 1) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) ``moments()`` output."""
+    with transaction.atomic():
+        SpeakerFeedbackAggregate.objects.get_or_create(speaker_id=speaker_id)
+        aggregate = SpeakerFeedbackAggregate.objects.select_for_update().get(
+            speaker_id=speaker_id
+        )
+        histograms = aggregate.histograms or empty_histograms()
+        changes = {field: F(field) + sign * stats[field] for field in MOMENT_FIELDS}
+        for field, counts in stats["histograms"].items():
+            for i, count in enumerate(counts):
+                histograms[field][i] += sign * count
+        changes["histograms"] = histograms
+        SpeakerFeedbackAggregate.objects.filter(pk=aggregate.pk).update(**changes)
+
+
+def _ratings(feedback: Feedback) -> dict:
+    """Return one feedback's ratings as a ``moments()`` row."""
+    return {field: getattr(feedback, field) for field in RATING_FIELDS}
+
+
+def apply_feedback(feedback: Feedback, sign: int = 1) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) one feedback's ratings."""
+    if feedback.speaker_id is None or _paused.get():
+        return
+    _apply_statistics(feedback.speaker_id, moments([_ratings(feedback)]), sign)
+
+
+def apply_feedback_batch(feedbacks) -> None:
+    """Add the ratings of feedback created without signals, e.g. by ``bulk_create``.
+
+    Each speaker's aggregate row is locked and updated once for the whole
+    batch, in a fixed order so concurrent batches can't deadlock.
+    """
+    groups = {}
+    for feedback in feedbacks:
+        if feedback.speaker_id is not None:
+            groups.setdefault(str(feedback.speaker_id), []).append(_ratings(feedback))
+    for speaker_id in sorted(groups):
+        _apply_statistics(speaker_id, moments(groups[speaker_id]))
+
+
+def rebuild_aggregates() -> int:
+    """Recompute every speaker's aggregate from the feedback rows.
+
+    Archived feedback is counted through the statistics stored with each
+    archive batch. Returns the number of speakers with feedback.
+    """
+    rows = Feedback.objects.filter(speaker__isnull=False).order_by()
+    totals = {"count": Count("pk")}
+    for field in RATING_FIELDS:
+        totals[f"{field}_sum"] = Sum(field)
+        totals[f"{field}_sum_squares"] = Sum(F(field) * F(field))
+    aggregates = {}
+    for row in rows.values("speaker").annotate(**totals):
+        speaker_id = row.pop("speaker")
+        aggregates[speaker_id] = SpeakerFeedbackAggregate(
+            speaker_id=speaker_id, histograms=empty_histograms(), **row
+        )
+    for field in RATING_FIELDS:
+        for speaker_id, value, count in rows.values_list("speaker", field).annotate(
+            count=Count("pk")
+        ):
+            if value in RATING_VALUES and speaker_id in aggregates:
+                aggregates[speaker_id].histograms[field][
+                    value - RATING_VALUES.start
+                ] = count
+
+    archived = FeedbackArchive.objects.filter(speaker__isnull=False).values_list(
+        "speaker_id", "statistics"
+    )
+    for speaker_id, stats in archived.iterator():
+        if speaker_id not in aggregates:
+            aggregates[speaker_id] = SpeakerFeedbackAggregate(
+                speaker_id=speaker_id, histograms=empty_histograms()
+            )
+        _add_statistics(aggregates[speaker_id], stats)
+
+    with transaction.atomic():
+        SpeakerFeedbackAggregate.objects.all().delete()
+        SpeakerFeedbackAggregate.objects.bulk_create(aggregates.values())
+    return len(aggregates)
+
+
+def summarize(aggregates) -> dict:
+    """Combine aggregate rows into means, standard deviations and histograms.
+
+    Moments add up, so a user with several speaker profiles gets one summary.
+    Standard deviations are population deviations; both are None without
+    feedback.
+    """
+    count = 0
+    totals = {field: [0, 0] for field in RATING_FIELDS}
+    histograms = empty_histograms()
+    for aggregate in aggregates:
+        count += aggregate.count
+        stored = aggregate.histograms or {}
+        for field in RATING_FIELDS:
+            totals[field][0] += getattr(aggregate, f"{field}_sum")
+            totals[field][1] += getattr(aggregate, f"{field}_sum_squares")
+            for i, value in enumerate(stored.get(field, ())):
+                histograms[field][i] += value
+
+    ratings = {}
+    for field, (total, squares) in totals.items():
+        mean = std = None
+        if count:
+            mean = total / count
+            # clamp rounding noise below zero for constant ratings
+            std = math.sqrt(max(squares / count - mean * mean, 0.0))
+        ratings[field] = {
+            "mean": mean,
+            "std": std,
+            "histogram": dict(
+                zip(map(str, RATING_VALUES), histograms[field], strict=True)
+            ),
+        }
+    return {"count": count, "ratings": ratings}
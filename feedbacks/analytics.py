@@ -0,0 +1,212 @@
+"""feedbacks analytics.
+
+Organizer and speaker dashboards get rating distributions, percentiles, a
+correlation matrix between the rating dimensions, daily and rolling trends,
+and per-event and per-talk breakdowns. The feedback columns are read with a
+single ``values_list`` query into NumPy arrays and every statistic is
+computed on whole arrays. Results are cached under the scope's feedback
+count, latest ``created_at`` and latest ``updated_at``, so new, deleted or
+edited feedback yields a fresh key.
+"""
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
+
+from feedbacks.aggregates import RATING_FIELDS, RATING_VALUES
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+# days covered by each point of the rolling trend
+TREND_WINDOW_DAYS = 7
+
+GROUP_COLUMNS = {
+    "events": ("event_id", "event__title"),
+    "talks": ("talk_id", "talk__title"),
+}
+
+
+def _rounded(values) -> list:
+    """Return a float array as a list, rounded and with NaN as None."""
+    values = np.round(np.asarray(values, dtype=float), 3)
+    return np.where(np.isnan(values), None, values).tolist()
+
+
+def _by_field(values) -> dict:
+    """Map a vector of per-dimension values to the dimension names."""
+    return dict(zip(RATING_FIELDS, _rounded(values), strict=True))
+
+
+def _histograms(ratings: np.ndarray) -> np.ndarray:
+    """Return a ``(dimensions, values)`` count matrix of an ``(n, d)`` array."""
+    width = len(RATING_VALUES)
+    # shift each dimension into its own block of bins so one bincount does all
+    bins = (ratings - RATING_VALUES.start) + width * np.arange(ratings.shape[1])
+    counts = np.bincount(bins.ravel(), minlength=width * ratings.shape[1])
+    return counts.reshape(ratings.shape[1], width)
+
+
+def _histogram_dict(counts) -> dict:
+    """Label one histogram row with its rating values."""
+    return dict(zip(map(str, RATING_VALUES), counts.tolist(), strict=True))
+
+
+def distributions(ratings: np.ndarray) -> dict:
+    """Return mean, deviation, percentiles and histogram of each dimension."""
+    means = ratings.mean(axis=0)
+    stds = ratings.std(axis=0)
+    percentiles = np.percentile(ratings, PERCENTILES, axis=0)
+    histograms = _histograms(ratings)
+    return {
+        field: {
+            "mean": _rounded(means[i]),
+            "std": _rounded(stds[i]),
+            "percentiles": dict(
+                zip(
+                    (f"p{p}" for p in PERCENTILES),
+                    _rounded(percentiles[:, i]),
+                    strict=True,
+                )
+            ),
+            "histogram": _histogram_dict(histograms[i]),
+        }
+        for i, field in enumerate(RATING_FIELDS)
+    }
+
+
+def correlations(ratings: np.ndarray) -> list:
+    """Return the Pearson correlation matrix of the dimensions.
+
+    Entries involving a dimension without variance are None.
+    """
+    if len(ratings) < 2:
+        return [[None] * len(RATING_FIELDS) for _ in RATING_FIELDS]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        matrix = np.corrcoef(ratings, rowvar=False)
+    return [_rounded(row) for row in matrix]
+
+
+def trends(days: np.ndarray, ratings: np.ndarray) -> list:
+    """Return daily means and trailing ``TREND_WINDOW_DAYS``-day means.
+
+    Only days with feedback are listed; the rolling window spans calendar
+    days, quiet ones included.
+    """
+    first = days.min()
+    offsets = (days - first).astype(np.int64)
+    span = int(offsets.max()) + 1
+    sums = np.zeros((span, ratings.shape[1]))
+    np.add.at(sums, offsets, ratings)
+    counts = np.bincount(offsets, minlength=span)
+
+    cumulative_sums = np.vstack([np.zeros(ratings.shape[1]), np.cumsum(sums, axis=0)])
+    cumulative_counts = np.concatenate([[0], np.cumsum(counts)])
+    end = np.arange(1, span + 1)
+    start = np.maximum(end - TREND_WINDOW_DAYS, 0)
+    window_counts = cumulative_counts[end] - cumulative_counts[start]
+    rolling = (cumulative_sums[end] - cumulative_sums[start]) / np.maximum(
+        window_counts, 1
+    )[:, None]
+    daily = sums / np.maximum(counts, 1)[:, None]
+
+    active = np.flatnonzero(counts)
+    dates = (first + active.astype("timedelta64[D]")).astype(str)
+    return [
+        {
+            "date": date,
+            "count": int(counts[day]),
+            "means": _by_field(daily[day]),
+            "rolling_means": _by_field(rolling[day]),
+        }
+        for date, day in zip(dates.tolist(), active.tolist(), strict=True)
+    ]
+
+
+def breakdown(keys: np.ndarray, titles: np.ndarray, ratings: np.ndarray) -> list:
+    """Return count, means and overall-rating histogram per key.
+
+    Rows without a key are left out; groups are listed by descending count.
+    """
+    linked = np.not_equal(keys, None)
+    if not linked.any():
+        return []
+    keys = keys[linked].astype(str)
+    ratings = ratings[linked]
+    unique, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(unique))
+    sums = np.zeros((len(unique), ratings.shape[1]))
+    np.add.at(sums, inverse, ratings)
+    means = sums / counts[:, None]
+    histograms = np.zeros((len(unique), len(RATING_VALUES)), dtype=np.int64)
+    np.add.at(histograms, (inverse, ratings[:, 0] - RATING_VALUES.start), 1)
+
+    titles = titles[linked][first]
+    order = np.argsort(-counts, kind="stable")
+    return [
+        {
+            "id": str(unique[i]),
+            "title": titles[i],
+            "count": int(counts[i]),
+            "means": _by_field(means[i]),
+            "histogram": _histogram_dict(histograms[i]),
+        }
+        for i in order.tolist()
+    ]
+
+
+def compute_analytics(queryset) -> dict:
+    """Compute the analytics of a ``Feedback`` queryset in one query."""
+    group_columns = [column for pair in GROUP_COLUMNS.values() for column in pair]
+    rows = list(
+        queryset.order_by().values_list(
+            TruncDate("created_at"), *RATING_FIELDS, *group_columns
+        )
+    )
+    result = {
+        "count": len(rows),
+        "fields": list(RATING_FIELDS),
+        "ratings": {},
+        "correlation": correlations(np.empty((0, len(RATING_FIELDS)))),
+        "trend": [],
+        **{name: [] for name in GROUP_COLUMNS},
+    }
+    if not rows:
+        return result
+
+    columns = np.array(rows, dtype=object)
+    dimensions = len(RATING_FIELDS)
+    days = columns[:, 0].astype("datetime64[D]")
+    ratings = columns[:, 1 : 1 + dimensions].astype(np.int64)
+    result.update(
+        ratings=distributions(ratings),
+        correlation=correlations(ratings),
+        trend=trends(days, ratings),
+    )
+    offset = 1 + dimensions
+    for name in GROUP_COLUMNS:
+        result[name] = breakdown(columns[:, offset], columns[:, offset + 1], ratings)
+        offset += 2
+    return result
+
+
+def analytics_cache_key(scope: str, queryset) -> str:
+    """Return the cache key of ``queryset``'s analytics in its current state."""
+    state = queryset.order_by().aggregate(
+        count=Count("pk"), latest=Max("created_at"), updated=Max("updated_at")
+    )
+    latest, updated = (
+        state[name].isoformat() if state[name] else "" for name in ("latest", "updated")
+    )
+    return f"feedbacks:analytics:{scope}:{state['count']}:{latest}:{updated}"
+
+
+def feedback_analytics(scope: str, queryset) -> dict:
+    """Return the cached analytics of ``queryset``, computing them on a miss."""
+    key = analytics_cache_key(scope, queryset)
+    result = cache.get(key)
+    if result is None:
+        result = compute_analytics(queryset)
+        cache.set(key, result, timeout=settings.FEEDBACK_ANALYTICS_CACHE_TIMEOUT)
+    return result
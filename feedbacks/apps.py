@@ -10,3 +10,7 @@ class FeedbacksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "feedbacks"
     verbose_name = _("Feedbacks")
+
+    def ready(self):
+        """Connect the app's signal handlers."""
+        from feedbacks import signals  # noqa: F401
@@ -0,0 +1,80 @@
+"""feedbacks archive.
+
+Feedback older than ``FEEDBACK_ARCHIVE_AFTER_DAYS`` leaves the hot
+``feedbacks`` table for ``FeedbackArchive``: rows are grouped by speaker and
+month, written as zlib-compressed JSON lines and deleted, one batch per
+transaction. Each archive row carries the rating moments of its rows, so
+speaker statistics are unchanged by archiving.
+"""
+
+import json
+import zlib
+from datetime import date
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from feedbacks.aggregates import RATING_FIELDS, moments, paused_aggregates
+from feedbacks.models import Feedback, FeedbackArchive
+
+ARCHIVE_BATCH_SIZE = 5000
+
+ARCHIVE_FIELDS = (
+    "id",
+    "created_at",
+    "speaker_id",
+    "event_id",
+    "talk_id",
+    *RATING_FIELDS,
+    "comments",
+    "is_anonymous",
+    "is_attendee",
+)
+
+
+def _compress(rows) -> bytes:
+    """Encode rows as zlib-compressed JSON lines."""
+    text = "\n".join(json.dumps(row, cls=DjangoJSONEncoder) for row in rows)
+    return zlib.compress(text.encode(), level=9)
+
+
+def archive_batch(before, batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+    """Archive up to ``batch_size`` of the oldest feedback created before ``before``.
+
+    Returns the number of rows archived; 0 once nothing is left.
+    """
+    with transaction.atomic():
+        rows = list(
+            Feedback.objects.filter(created_at__lt=before)
+            .order_by("created_at", "id")
+            .select_for_update()
+            .values(*ARCHIVE_FIELDS)[:batch_size]
+        )
+        if not rows:
+            return 0
+
+        groups = {}
+        for row in rows:
+            month = date(row["created_at"].year, row["created_at"].month, 1)
+            groups.setdefault((row["speaker_id"], month), []).append(row)
+        FeedbackArchive.objects.bulk_create(
+            FeedbackArchive(
+                speaker_id=speaker_id,
+                month=month,
+                row_count=len(group),
+                statistics=moments(group),
+                payload=_compress(group),
+            )
+            for (speaker_id, month), group in groups.items()
+        )
+        with paused_aggregates():
+            Feedback.objects.filter(pk__in=[row["id"] for row in rows]).delete()
+    return len(rows)
+
+
+def archive_feedback(before, batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+    """Archive all feedback created before ``before``; return the row count."""
+    total = 0
+    while archived := archive_batch(before, batch_size):
+        total += archived
+    return total
@@ -0,0 +1,187 @@
+"""feedbacks exports.
+
+Organizer reports are streamed as CSV or XLSX. Rows are read with
+``values_list().iterator()`` and encoded as they arrive, so memory stays flat
+whatever the number of rows and the header goes out before the query has
+finished. XLSX files are written with the standard library: a minimal
+SpreadsheetML package whose worksheet is deflated straight into the response
+through a non-seekable zip stream.
+"""
+
+import csv
+import io
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from feedbacks.aggregates import RATING_FIELDS
+
+EXPORT_CHUNK_SIZE = 2000
+
+# rows encoded between two flushes to the response
+EXPORT_FLUSH_ROWS = 500
+
+EXPORT_COLUMNS = (
+    ("id", "id"),
+    ("created_at", "created_at"),
+    ("event", "event__title"),
+    ("talk", "talk__title"),
+    ("speaker", "speaker__slug"),
+    *((field, field) for field in RATING_FIELDS),
+    ("comments", "comments"),
+    ("is_attendee", "is_attendee"),
+    ("is_anonymous", "is_anonymous"),
+)
+
+# spreadsheet apps run cells starting with these as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# characters XML 1.0 can't carry at all
+ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def export_rows(queryset):
+    """Yield the export rows of a ``Feedback`` queryset.
+
+    Anonymous feedback keeps its ratings and comments but loses its id and
+    exact time (only the date is kept), which could otherwise be matched
+    against attendance records.
+    """
+    lookups = [lookup for _, lookup in EXPORT_COLUMNS]
+    anonymous = lookups.index("is_anonymous")
+    rows = queryset.order_by("created_at", "id").values_list(*lookups)
+    for row in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        if row[anonymous]:
+            yield (None, row[1].date().isoformat(), *row[2:])
+        else:
+            yield (str(row[0]), row[1].isoformat(), *row[2:])
+
+
+def _safe_text(value):
+    """Neutralise text a spreadsheet would evaluate as a formula."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(rows):
+    """Yield a CSV file of ``rows`` under the export header, chunk by chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    yield flush()
+    for number, row in enumerate(rows, start=1):
+        writer.writerow([_safe_text(value) for value in row])
+        if number % EXPORT_FLUSH_ROWS == 0:
+            yield flush()
+    yield flush()
+
+
+class _Sink(io.RawIOBase):
+    """Write-only, non-seekable stream collecting what ``zipfile`` writes."""
+
+    def __init__(self):
+        """Start empty."""
+        super().__init__()
+        self._chunks = []
+
+    def writable(self) -> bool:
+        """Accept writes."""
+        return True
+
+    def write(self, data) -> int:
+        """Keep a copy of ``data`` until the next drain."""
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and forget everything written so far."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+XLSX_PARTS = (
+    (
+        "[Content_Types].xml",
+        _XML_DECL
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>",
+    ),
+    (
+        "_rels/.rels",
+        _XML_DECL + f'<Relationships xmlns="{_PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" '
+        'Target="xl/workbook.xml"/></Relationships>',
+    ),
+    (
+        "xl/workbook.xml",
+        _XML_DECL + f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>'
+        '<sheet name="Feedback" sheetId="1" r:id="rId1"/></sheets></workbook>',
+    ),
+    (
+        "xl/_rels/workbook.xml.rels",
+        _XML_DECL + f'<Relationships xmlns="{_PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" '
+        'Target="worksheets/sheet1.xml"/></Relationships>',
+    ),
+)
+
+XLSX_SHEET = "xl/worksheets/sheet1.xml"
+
+
+def _xlsx_cell(value) -> str:
+    """Render one inline cell."""
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, int | float):
+        return f"<c><v>{value}</v></c>"
+    text = escape(ILLEGAL_XML_CHARS.sub("", _safe_text(str(value))))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(values) -> bytes:
+    """Render one worksheet row."""
+    return ("<row>" + "".join(map(_xlsx_cell, values)) + "</row>").encode()
+
+
+def stream_xlsx(rows):
+    """Yield an XLSX workbook of ``rows`` under the export header."""
+    sink = _Sink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in XLSX_PARTS:
+            archive.writestr(name, content)
+        # the size is unknown up front, so allow the sheet to pass 4 GiB
+        with archive.open(XLSX_SHEET, "w", force_zip64=True) as sheet:
+            sheet.write(
+                f'{_XML_DECL}<worksheet xmlns="{_MAIN_NS}"><sheetData>'.encode()
+            )
+            sheet.write(_xlsx_row(name for name, _ in EXPORT_COLUMNS))
+            yield sink.drain()
+            for number, row in enumerate(rows, start=1):
+                sheet.write(_xlsx_row(row))
+                if number % EXPORT_FLUSH_ROWS == 0:
+                    yield sink.drain()
+            sheet.write(b"</sheetData></worksheet>")
+    yield sink.drain()
@@ -0,0 +1,175 @@
+"""feedbacks ingestion.
+
+At the end of a session most of its attendees submit feedback within a
+couple of minutes, nearly all of it for the same speaker. Written one at a
+time, every submission queues on that speaker's aggregate row lock and runs
+its own attendance update. With ``FEEDBACK_INGEST_BUFFERED`` on, the request
+only validates the submission and stores it as ``PendingFeedback``, one
+insert into a table without secondary indexes. A worker thread in each
+process then writes the pending rows in batches: one ``bulk_create`` of the
+feedback, one aggregate update per speaker and one attendance update.
+
+The worker flushes ``FEEDBACK_INGEST_FLUSH_MS`` after the first submission
+it is told about, or as soon as ``FEEDBACK_INGEST_BATCH_SIZE`` are waiting.
+Pending rows are committed before the response is sent, so a dying worker
+loses nothing: every flush takes whatever is pending, whichever process
+stored it, a dead thread is restarted by the next submission, and the
+``flush_pending_feedback`` command drains the table from cron or on deploy.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from attendees.models import Attendance
+from feedbacks.aggregates import apply_feedback_batch
+from feedbacks.models import Feedback, PendingFeedback
+
+logger = logging.getLogger(__name__)
+
+# columns set when the feedback is written rather than taken from the payload
+_WRITE_TIME_FIELDS = ("id", "created_at", "updated_at")
+
+
+def buffer_feedback(validated_data: dict, attendee_email=None) -> Feedback:
+    """Store a validated submission for the next flush.
+
+    Returns the unsaved feedback, carrying the id and creation time it will
+    be written with.
+    """
+    feedback = Feedback(**validated_data)
+    payload = {
+        field.attname: getattr(feedback, field.attname)
+        for field in Feedback._meta.concrete_fields
+        if field.name not in _WRITE_TIME_FIELDS
+    }
+    PendingFeedback.objects.create(
+        id=feedback.id,
+        payload=payload,
+        attendee_email=attendee_email,
+        created_at=feedback.created_at,
+    )
+    transaction.on_commit(ingestor.notify)
+    return feedback
+
+
+def _drop_missing_references(feedbacks) -> None:
+    """Unlink feedback from rows deleted since it was submitted.
+
+    This is what ``SET_NULL`` would have done had the feedback been written
+    straight away, and keeps one stale reference from failing its batch.
+    """
+    for field in Feedback._meta.concrete_fields:
+        if not field.is_relation:
+            continue
+        ids = {getattr(feedback, field.attname) for feedback in feedbacks} - {None}
+        if not ids:
+            continue
+        existing = {
+            str(pk)
+            for pk in field.related_model._default_manager.filter(
+                pk__in=ids
+            ).values_list("pk", flat=True)
+        }
+        for feedback in feedbacks:
+            value = getattr(feedback, field.attname)
+            if value is not None and str(value) not in existing:
+                setattr(feedback, field.attname, None)
+
+
+def flush_pending(batch_size: int | None = None) -> int:
+    """Write up to ``batch_size`` of the oldest pending submissions.
+
+    Rows locked by a concurrent flush are skipped. Returns the number of
+    feedback written; 0 once nothing is pending.
+    """
+    batch_size = batch_size or settings.FEEDBACK_INGEST_BATCH_SIZE
+    with transaction.atomic():
+        pending = list(
+            PendingFeedback.objects.select_for_update(skip_locked=True).order_by(
+                "created_at"
+            )[:batch_size]
+        )
+        if not pending:
+            return 0
+
+        feedbacks = [
+            Feedback(id=item.id, created_at=item.created_at, **item.payload)
+            for item in pending
+        ]
+        _drop_missing_references(feedbacks)
+        # bulk_create sends no post_save, so the aggregates are updated here
+        Feedback.objects.bulk_create(feedbacks)
+        apply_feedback_batch(feedbacks)
+
+        emails = {item.attendee_email for item in pending} - {None}
+        if emails:
+            Attendance.objects.filter(email__in=emails, is_given_feedback=False).update(
+                is_given_feedback=True
+            )
+        PendingFeedback.objects.filter(pk__in=[item.pk for item in pending]).delete()
+    return len(pending)
+
+
+def flush_all(batch_size: int | None = None) -> int:
+    """Write every pending submission, batch by batch; return the count."""
+    total = 0
+    while flushed := flush_pending(batch_size):
+        total += flushed
+    return total
+
+
+class FeedbackIngestor:
+    """Worker thread running ``flush`` after bursts of submissions."""
+
+    def __init__(self, flush, interval_ms: int, batch_size: int):
+        """Flush ``interval_ms`` after a first submission or at ``batch_size``."""
+        self._flush = flush
+        self._interval = interval_ms / 1000
+        self._batch_size = batch_size
+        self._waiting = 0
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def notify(self) -> None:
+        """Count one stored submission, (re)starting the worker if needed."""
+        with self._condition:
+            self._waiting += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="feedback-ingest", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _wait_for_batch(self) -> None:
+        """Block until a batch is full or the first submission is old enough."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._waiting)
+            deadline = time.monotonic() + self._interval
+            while self._waiting < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            self._waiting = 0
+
+    def _run(self) -> None:
+        """Flush batch after batch for the life of the process."""
+        while True:
+            self._wait_for_batch()
+            try:
+                self._flush()
+            except Exception:
+                # the rows stay pending for the next flush or the command
+                logger.exception("Flushing pending feedback failed")
+            finally:
+                close_old_connections()
+
+
+ingestor = FeedbackIngestor(
+    flush_all, settings.FEEDBACK_INGEST_FLUSH_MS, settings.FEEDBACK_INGEST_BATCH_SIZE
+)
@@ -0,0 +1 @@
+"""feedbacks management."""
@@ -0,0 +1,54 @@
+"""Move old feedback into the compressed archive table."""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from feedbacks.archive import ARCHIVE_BATCH_SIZE, archive_feedback
+from feedbacks.models import Feedback
+
+
+class Command(BaseCommand):
+    """Archive feedback older than the configured horizon."""
+
+    help = "Archive feedback older than FEEDBACK_ARCHIVE_AFTER_DAYS into feedbacks_archive."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.FEEDBACK_ARCHIVE_AFTER_DAYS,
+            help="Archive feedback older than this many days.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=ARCHIVE_BATCH_SIZE,
+            help="Rows archived per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the feedback that would be archived.",
+        )
+
+    def handle(self, *args, **options):
+        """Archive old feedback batch by batch."""
+        if options["days"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--days and --batch-size must be positive.")
+        before = timezone.now() - timedelta(days=options["days"])
+        if options["dry_run"]:
+            count = Feedback.objects.filter(created_at__lt=before).count()
+            self.stdout.write(
+                self.style.SUCCESS(f"{count} feedback row(s) would be archived.")
+            )
+            return
+        archived = archive_feedback(before, batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {archived} feedback row(s) before {before:%Y-%m-%d}."
+            )
+        )
@@ -0,0 +1,27 @@
+"""Write buffered feedback submissions that are still pending."""
+
+from django.core.management.base import BaseCommand
+
+from feedbacks.ingest import flush_all
+
+
+class Command(BaseCommand):
+    """Drain ``PendingFeedback`` into the feedback table."""
+
+    help = "Write every pending feedback submission, e.g. after a worker died."
+
+    def add_arguments(self, parser):
+        """Add the batch size option."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Submissions written per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        """Flush the pending submissions batch by batch."""
+        written = flush_all(options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {written} pending feedback submission(s).")
+        )
@@ -0,0 +1,82 @@
+"""Partition the feedback table by month on PostgreSQL."""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from feedbacks import partitioning
+from feedbacks.models import Feedback
+
+
+class Command(BaseCommand):
+    """Convert ``feedbacks`` to monthly partitions or create upcoming ones."""
+
+    help = (
+        "Create the monthly partitions of the coming months; with --convert, "
+        "first turn the feedback table into a partitioned table (PostgreSQL only)."
+    )
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Convert the existing table; takes an exclusive lock while copying.",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="Create partitions up to this many months from now.",
+        )
+        parser.add_argument(
+            "--sql",
+            action="store_true",
+            help="Print the statements instead of running them.",
+        )
+
+    def handle(self, *args, **options):
+        """Build the statements and print or run them."""
+        if options["months_ahead"] < 0:
+            raise CommandError("--months-ahead must not be negative.")
+        if connection.vendor != "postgresql" and not options["sql"]:
+            raise CommandError("Partitioning needs PostgreSQL; use --sql to review it.")
+
+        this_month = partitioning.month_start(timezone.localdate())
+        last_month = partitioning.add_months(this_month, options["months_ahead"])
+        if options["convert"]:
+            if connection.vendor == "postgresql" and partitioning.is_partitioned():
+                raise CommandError("The feedback table is already partitioned.")
+            oldest = Feedback.objects.aggregate(oldest=Min("created_at"))["oldest"]
+            first_month = (
+                partitioning.month_start(oldest.date()) if oldest else this_month
+            )
+            statements = partitioning.convert_sql(first_month, last_month)
+        else:
+            months = partitioning.months_between(this_month, last_month)
+            has_default = True
+            if connection.vendor == "postgresql":
+                if not partitioning.is_partitioned():
+                    raise CommandError(
+                        "The feedback table isn't partitioned; run --convert."
+                    )
+                existing = partitioning.partitions()
+                months = [
+                    month
+                    for month in months
+                    if partitioning.partition_name(month) not in existing
+                ]
+                has_default = partitioning.DEFAULT_PARTITION in existing
+            statements = partitioning.create_partitions_sql(months, has_default)
+
+        if options["sql"]:
+            for statement in statements:
+                self.stdout.write(f"{statement};")
+            return
+        with transaction.atomic(), connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+        self.stdout.write(
+            self.style.SUCCESS(f"Ran {len(statements)} partitioning statement(s).")
+        )
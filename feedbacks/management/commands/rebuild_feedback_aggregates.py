@@ -0,0 +1,20 @@
+"""Recompute the per-speaker feedback statistics."""
+
+from django.core.management.base import BaseCommand
+
+from feedbacks.aggregates import rebuild_aggregates
+
+
+class Command(BaseCommand):
+    """Rebuild ``SpeakerFeedbackAggregate`` rows from the feedback table."""
+
+    help = "Recompute every speaker's feedback rating statistics."
+
+    def handle(self, *args, **options):
+        """Replace the stored aggregates with freshly computed ones."""
+        speakers = rebuild_aggregates()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt feedback statistics for {speakers} speaker(s)."
+            )
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feedbacks", "0004_convert_ids_to_uuid"),
+        ("speakers", "0014_add_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="feedback",
+            index=models.Index(
+                fields=["speaker", "created_at", "id"],
+                name="feedbacks_speaker_created_idx",
+            ),
+        ),
+    ]
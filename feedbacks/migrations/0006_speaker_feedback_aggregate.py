@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feedbacks", "0005_add_pagination_indexes"),
+        ("speakers", "0016_speaker_suggestions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SpeakerFeedbackAggregate",
+            fields=[
+                (
+                    "speaker",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="feedback_aggregate",
+                        serialize=False,
+                        to="speakers.speakerprofile",
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                ("overall_rating_sum", models.BigIntegerField(default=0)),
+                ("overall_rating_sum_squares", models.BigIntegerField(default=0)),
+                ("engagement_sum", models.BigIntegerField(default=0)),
+                ("engagement_sum_squares", models.BigIntegerField(default=0)),
+                ("clarity_sum", models.BigIntegerField(default=0)),
+                ("clarity_sum_squares", models.BigIntegerField(default=0)),
+                ("content_depth_sum", models.BigIntegerField(default=0)),
+                ("content_depth_sum_squares", models.BigIntegerField(default=0)),
+                ("speaker_knowledge_sum", models.BigIntegerField(default=0)),
+                ("speaker_knowledge_sum_squares", models.BigIntegerField(default=0)),
+                ("practical_relevance_sum", models.BigIntegerField(default=0)),
+                ("practical_relevance_sum_squares", models.BigIntegerField(default=0)),
+                ("histograms", models.JSONField(blank=True, default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "speaker_feedback_aggregates",
+            },
+        ),
+    ]
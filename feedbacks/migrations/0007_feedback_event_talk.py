@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0012_event_start_indexes"),
+        ("feedbacks", "0006_speaker_feedback_aggregate"),
+        ("talks", "0006_convert_ids_to_uuid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="feedback",
+            name="event",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="feedback",
+                to="events.event",
+            ),
+        ),
+        migrations.AddField(
+            model_name="feedback",
+            name="talk",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="feedback",
+                to="talks.talks",
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:07
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0012_event_start_indexes"),
+        ("feedbacks", "0007_feedback_event_talk"),
+        ("speakers", "0016_speaker_suggestions"),
+        ("talks", "0006_convert_ids_to_uuid"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FeedbackArchive",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "month",
+                    models.DateField(
+                        help_text="First day of the month the feedback is from."
+                    ),
+                ),
+                ("row_count", models.PositiveIntegerField()),
+                ("statistics", models.JSONField(blank=True, default=dict)),
+                ("payload", models.BinaryField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "feedbacks_archive",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="feedback",
+            index=models.Index(
+                fields=["event", "created_at", "id"], name="feedbacks_event_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedback",
+            index=models.Index(
+                fields=["created_at", "id"], name="feedbacks_created_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="feedbackarchive",
+            name="speaker",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="archived_feedback",
+                to="speakers.speakerprofile",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedbackarchive",
+            index=models.Index(
+                fields=["speaker", "month"], name="feedbacks_archive_speaker_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:11
+
+import django.core.serializers.json
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("feedbacks", "0008_feedback_archive_and_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingFeedback",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder
+                    ),
+                ),
+                (
+                    "attendee_email",
+                    models.EmailField(blank=True, max_length=254, null=True),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "db_table": "feedbacks_pending",
+            },
+        ),
+    ]
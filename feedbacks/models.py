@@ -1,10 +1,14 @@
 """Models for the feedback app."""
 
 # Create your models here.
+import json
 import uuid
+import zlib
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.utils import timezone
 
 from base.models import TimeStampedModel
 from speakers.models import SpeakerProfile
@@ -22,6 +26,20 @@ class Feedback(TimeStampedModel):
         null=True,
         related_name="speaker_feedback",
     )
+    event = models.ForeignKey(
+        "events.Event",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="feedback",
+    )
+    talk = models.ForeignKey(
+        "talks.Talks",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="feedback",
+    )
     overall_rating = models.IntegerField(
         validators=RATING_VALIDATORS,
         error_messages={"error": "value should be an integer of value 1-10"},
@@ -57,7 +75,129 @@ class Feedback(TimeStampedModel):
         verbose_name = "Feedback"
         verbose_name_plural = "Feedbacks"
         ordering = ["-created_at"]
+        indexes = [
+            # keyset pagination of a speaker's feedback list
+            models.Index(
+                fields=["speaker", "created_at", "id"],
+                name="feedbacks_speaker_created_idx",
+            ),
+            # organizer exports and analytics of one event
+            models.Index(
+                fields=["event", "created_at", "id"],
+                name="feedbacks_event_created_idx",
+            ),
+            # date-range exports and archiving scans
+            models.Index(fields=["created_at", "id"], name="feedbacks_created_idx"),
+        ]
 
     def __str__(self):
         """Return string representation."""
         return f"Feedback for {self.speaker} with overall rating {self.overall_rating}"
+
+
+class SpeakerFeedbackAggregate(models.Model):
+    """Running rating statistics of a speaker's feedback.
+
+    Kept up to date by ``feedbacks.signals`` as feedback is added or removed,
+    so summaries never scan the feedback rows; ``rebuild_feedback_aggregates``
+    recomputes them from scratch. Each rating dimension stores the sum and
+    sum of squares of its values, and ``histograms`` maps each dimension to
+    the number of ratings of each value.
+    """
+
+    speaker = models.OneToOneField(
+        SpeakerProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="feedback_aggregate",
+    )
+    count = models.PositiveIntegerField(default=0)
+    overall_rating_sum = models.BigIntegerField(default=0)
+    overall_rating_sum_squares = models.BigIntegerField(default=0)
+    engagement_sum = models.BigIntegerField(default=0)
+    engagement_sum_squares = models.BigIntegerField(default=0)
+    clarity_sum = models.BigIntegerField(default=0)
+    clarity_sum_squares = models.BigIntegerField(default=0)
+    content_depth_sum = models.BigIntegerField(default=0)
+    content_depth_sum_squares = models.BigIntegerField(default=0)
+    speaker_knowledge_sum = models.BigIntegerField(default=0)
+    speaker_knowledge_sum_squares = models.BigIntegerField(default=0)
+    practical_relevance_sum = models.BigIntegerField(default=0)
+    practical_relevance_sum_squares = models.BigIntegerField(default=0)
+    histograms = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta options for SpeakerFeedbackAggregate model."""
+
+        db_table = "speaker_feedback_aggregates"
+
+    def __str__(self):
+        """Return string representation."""
+        return f"Feedback statistics for {self.speaker_id} ({self.count})"
+
+
+class FeedbackArchive(models.Model):
+    """A compressed batch of archived feedback of one speaker and month.
+
+    ``archive_feedback`` moves old feedback here: ``payload`` holds
+    the rows as zlib-compressed JSON lines and ``statistics`` their rating
+    moments, which ``rebuild_feedback_aggregates`` folds back into the
+    speaker's statistics.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    speaker = models.ForeignKey(
+        SpeakerProfile,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="archived_feedback",
+    )
+    month = models.DateField(help_text="First day of the month the feedback is from.")
+    row_count = models.PositiveIntegerField()
+    statistics = models.JSONField(default=dict, blank=True)
+    payload = models.BinaryField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta options for FeedbackArchive model."""
+
+        db_table = "feedbacks_archive"
+        indexes = [
+            models.Index(
+                fields=["speaker", "month"], name="feedbacks_archive_speaker_idx"
+            ),
+        ]
+
+    def __str__(self):
+        """Return string representation."""
+        return f"{self.row_count} archived feedback of {self.speaker_id} ({self.month})"
+
+    def rows(self) -> list[dict]:
+        """Return the archived rows, with ids and dates as strings."""
+        text = zlib.decompress(bytes(self.payload)).decode()
+        return [json.loads(line) for line in text.splitlines()]
+
+
+class PendingFeedback(models.Model):
+    """A validated feedback submission waiting to be written.
+
+    With ``FEEDBACK_INGEST_BUFFERED`` on, submissions land here first and
+    ``feedbacks.ingest`` moves them to ``Feedback`` in batches. ``payload``
+    holds the feedback fields by column name; the row's id becomes the
+    feedback's id.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    attendee_email = models.EmailField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        """Meta options for PendingFeedback model."""
+
+        db_table = "feedbacks_pending"
+
+    def __str__(self):
+        """Return string representation."""
+        return f"Pending feedback {self.id} ({self.created_at})"
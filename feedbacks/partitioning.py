@@ -0,0 +1,161 @@
+"""feedbacks partitioning.
+
+Optional, PostgreSQL-only monthly range partitioning of the ``feedbacks``
+table on ``created_at``. Queries for recent feedback then only touch recent
+partitions, and archived months can be dropped whole.
+
+Django keeps treating ``id`` as the primary key; the database key becomes
+``(id, created_at)`` because a partitioned table's unique constraints must
+include the partition key. Migrations that later alter ``feedbacks`` should
+be checked against the partitioned layout. ``partition_feedbacks --convert``
+performs the one-off conversion; running the command without it (monthly,
+e.g. from cron) creates the partitions of the coming months. Rows of a month
+without a partition land in the default partition; creating that month's
+partition later first moves them out of it, as PostgreSQL refuses a new
+partition whose range the default partition holds rows for.
+"""
+
+from datetime import date
+
+from django.db import connection
+
+from feedbacks.models import Feedback
+
+TABLE = Feedback._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+
+def month_start(day: date) -> date:
+    """Return the first day of ``day``'s month."""
+    return date(day.year, day.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Return the first day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def months_between(first: date, last: date) -> list[date]:
+    """Return the first days of the months from ``first`` to ``last``, inclusive."""
+    months, month = [], month_start(first)
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def partition_name(month: date) -> str:
+    """Return the table name of the partition of ``month``."""
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def partition_sql(month: date) -> str:
+    """Return the statement creating the partition of ``month``."""
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(month)}" PARTITION OF "{TABLE}" '
+        f"FOR VALUES FROM ('{month.isoformat()}') "
+        f"TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def create_partitions_sql(months, has_default: bool = True) -> list[str]:
+    """Return the statements adding the partitions of ``months``.
+
+    With a default partition, it is detached while the new partitions are
+    created, their months' rows are moved out of it, and it is attached
+    again; run the statements in one transaction.
+    """
+    if not months:
+        return []
+    if not has_default:
+        return [partition_sql(month) for month in months]
+    statements = [f'ALTER TABLE "{TABLE}" DETACH PARTITION "{DEFAULT_PARTITION}"']
+    for month in months:
+        in_month = (
+            f"created_at >= '{month.isoformat()}' "
+            f"AND created_at < '{add_months(month, 1).isoformat()}'"
+        )
+        statements += [
+            partition_sql(month),
+            f'INSERT INTO "{partition_name(month)}" '
+            f'SELECT * FROM "{DEFAULT_PARTITION}" WHERE {in_month}',
+            f'DELETE FROM "{DEFAULT_PARTITION}" WHERE {in_month}',
+        ]
+    statements.append(
+        f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT'
+    )
+    return statements
+
+
+def is_partitioned() -> bool:
+    """Return True if the feedback table already is partitioned."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def partitions() -> set[str]:
+    """Return the names of the feedback table's partitions."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)",
+            [TABLE],
+        )
+        return {row[0] for row in cursor}
+
+
+def _index_sql() -> list[str]:
+    """Return the statements recreating the model's indexes and foreign keys."""
+    statements = []
+    for index in Feedback._meta.indexes:
+        columns = ", ".join(
+            f'"{Feedback._meta.get_field(name).column}"' for name in index.fields
+        )
+        statements.append(f'CREATE INDEX "{index.name}" ON "{TABLE}" ({columns})')
+    # composite indexes leading with a foreign key already serve its lookups
+    covered = {index.fields[0] for index in Feedback._meta.indexes}
+    for field in Feedback._meta.concrete_fields:
+        if not field.is_relation:
+            continue
+        if field.name not in covered:
+            statements.append(
+                f'CREATE INDEX "{TABLE}_{field.column}_idx" '
+                f'ON "{TABLE}" ("{field.column}")'
+            )
+        target = field.target_field
+        statements += [
+            f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{TABLE}_{field.column}_fk" '
+            f'FOREIGN KEY ("{field.column}") '
+            f'REFERENCES "{target.model._meta.db_table}" ("{target.column}") '
+            "DEFERRABLE INITIALLY DEFERRED",
+        ]
+    return statements
+
+
+def convert_sql(first_month: date, last_month: date) -> list[str]:
+    """Return the statements turning ``feedbacks`` into a partitioned table.
+
+    The existing rows are copied into monthly partitions from ``first_month``
+    to ``last_month``; anything outside lands in a default partition.
+    """
+    old = f"{TABLE}_unpartitioned"
+    return [
+        f'ALTER TABLE "{TABLE}" RENAME TO "{old}"',
+        f'CREATE TABLE "{TABLE}" (LIKE "{old}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        "PARTITION BY RANGE (created_at)",
+        *(partition_sql(month) for month in months_between(first_month, last_month)),
+        f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT',
+        f'INSERT INTO "{TABLE}" SELECT * FROM "{old}"',
+        f'DROP TABLE "{old}"',
+        f'ALTER TABLE "{TABLE}" ADD PRIMARY KEY (id, created_at)',
+        *_index_sql(),
+    ]
@@ -2,10 +2,11 @@
 
 from rest_framework import serializers
 
+from base.middleware import TimedSerializerMixin
 from feedbacks.models import Feedback
 
 
-class FeedbackSerializer(serializers.ModelSerializer):
+class FeedbackSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for feedback with support for anonymous feedback."""
 
     class Meta:
@@ -13,3 +14,90 @@ class FeedbackSerializer(serializers.ModelSerializer):
 
         model = Feedback
         exclude = ["created_at", "updated_at"]
+
+    def validate(self, attrs):
+        """Fill the speaker and event in from the talk, and keep them consistent."""
+        talk = attrs.get("talk")
+        if talk is None:
+            return attrs
+        for field in ("speaker", "event"):
+            expected = getattr(talk, field)
+            given = attrs.get(field)
+            if given is None:
+                attrs[field] = expected
+            elif expected is not None and given != expected:
+                raise serializers.ValidationError(
+                    {field: f"Does not match the talk's {field}."}
+                )
+        return attrs
+
+
+class RatingSummarySerializer(TimedSerializerMixin, serializers.Serializer):
+    """Statistics of one rating dimension."""
+
+    mean = serializers.FloatField(allow_null=True)
+    std = serializers.FloatField(allow_null=True)
+    histogram = serializers.DictField(child=serializers.IntegerField())
+
+
+class FeedbackSummarySerializer(TimedSerializerMixin, serializers.Serializer):
+    """A speaker's feedback count and per-dimension rating statistics."""
+
+    count = serializers.IntegerField()
+    ratings = serializers.DictField(child=RatingSummarySerializer())
+
+
+class RatingDistributionSerializer(RatingSummarySerializer):
+    """Distribution of one rating dimension with its percentiles."""
+
+    percentiles = serializers.DictField(child=serializers.FloatField())
+
+
+class FeedbackTrendSerializer(TimedSerializerMixin, serializers.Serializer):
+    """Daily and trailing mean ratings of one day with feedback."""
+
+    date = serializers.DateField()
+    count = serializers.IntegerField()
+    means = serializers.DictField(child=serializers.FloatField())
+    rolling_means = serializers.DictField(child=serializers.FloatField())
+
+
+class FeedbackGroupSerializer(TimedSerializerMixin, serializers.Serializer):
+    """Feedback statistics of one event or talk."""
+
+    id = serializers.UUIDField()
+    title = serializers.CharField(allow_null=True)
+    count = serializers.IntegerField()
+    means = serializers.DictField(child=serializers.FloatField())
+    histogram = serializers.DictField(child=serializers.IntegerField())
+
+
+class FeedbackAnalyticsSerializer(TimedSerializerMixin, serializers.Serializer):
+    """Feedback analytics (see ``feedbacks.analytics``)."""
+
+    count = serializers.IntegerField()
+    fields = serializers.ListField(child=serializers.CharField())
+    ratings = serializers.DictField(child=RatingDistributionSerializer())
+    correlation = serializers.ListField(
+        child=serializers.ListField(child=serializers.FloatField(allow_null=True)),
+        help_text="Correlation matrix of the rating dimensions, in `fields` order.",
+    )
+    trend = FeedbackTrendSerializer(many=True)
+    events = FeedbackGroupSerializer(many=True)
+    talks = FeedbackGroupSerializer(many=True)
+
+
+class FeedbackExportQuerySerializer(TimedSerializerMixin, serializers.Serializer):
+    """Filters of a feedback export."""
+
+    event = serializers.SlugField(required=False)
+    speaker = serializers.SlugField(required=False)
+    start = serializers.DateField(required=False, help_text="First day, inclusive.")
+    end = serializers.DateField(required=False, help_text="Last day, inclusive.")
+    file_format = serializers.ChoiceField(choices=["csv", "xlsx"], default="csv")
+
+    def validate(self, attrs):
+        """Reject a date range that ends before it starts."""
+        if attrs.get("start") and attrs.get("end") and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError({"end": "Must not be before start."})
+        return attrs
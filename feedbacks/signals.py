@@ -0,0 +1,49 @@
+"""feedbacks signals."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from feedbacks.aggregates import RATING_FIELDS, apply_feedback
+from feedbacks.models import Feedback
+
+
+@receiver(pre_save, sender=Feedback)
+def remember_stored_ratings(sender, instance, raw=False, **kwargs):
+    """Keep the stored speaker and ratings of feedback about to be updated."""
+    if raw or instance._state.adding:
+        return
+    instance._stored_ratings = (
+        Feedback.objects.filter(pk=instance.pk)
+        .values("speaker_id", *RATING_FIELDS)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Feedback)
+def add_feedback_to_aggregate(sender, instance, created, raw=False, **kwargs):
+    """Count new feedback in its speaker's rating statistics.
+
+    Updated feedback has its stored ratings taken out of the statistics of
+    its previous speaker and its new ratings added, in one transaction.
+    Querysets' ``update()`` sends no signals and is left to
+    ``rebuild_feedback_aggregates``.
+    """
+    if raw:
+        return
+    if created:
+        apply_feedback(instance)
+        return
+    stored = instance.__dict__.pop("_stored_ratings", None)
+    current = {field: getattr(instance, field) for field in stored or {}}
+    if stored is None or current == stored:
+        return
+    with transaction.atomic():
+        apply_feedback(Feedback(**stored), sign=-1)
+        apply_feedback(instance)
+
+
+@receiver(post_delete, sender=Feedback)
+def remove_feedback_from_aggregate(sender, instance, **kwargs):
+    """Drop deleted feedback from its speaker's rating statistics."""
+    apply_feedback(instance, sign=-1)
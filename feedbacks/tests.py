@@ -1,9 +1,35 @@
 """Tests for the feedback app."""
 
+import csv
+import io
+import math
+import threading
+import zipfile
+from datetime import datetime, timedelta
+from unittest import skipUnless
+from xml.etree import ElementTree
+
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-from feedbacks.models import Feedback
+from feedbacks import partitioning
+from feedbacks.aggregates import RATING_FIELDS
+from feedbacks.ingest import FeedbackIngestor
+from feedbacks.models import (
+    Feedback,
+    FeedbackArchive,
+    PendingFeedback,
+    SpeakerFeedbackAggregate,
+)
+from feedbacks.serializers import FeedbackSerializer
+from speakers.models import SpeakerProfile
 
 
 class TestFeedback(TestCase):
@@ -47,3 +73,616 @@ class TestFeedback(TestCase):
         self.assertEqual(self.feedback.practical_relevance, 4)
         self.assertEqual(self.feedback.comments, "Great session, very informative!")
         self.assertFalse(self.feedback.is_anonymous)
+
+
+# ─── Speaker feedback statistics ──────────────────────────────────────────────
+
+
+class FeedbackSummaryTests(APITestCase):
+    """Incremental rating statistics and the summary endpoint."""
+
+    def setUp(self):
+        """Create a speaker with three pieces of feedback."""
+        self.user = get_user_model().objects.create(
+            username="summary_speaker", email="summary@mail.com"
+        )
+        self.speaker = SpeakerProfile.objects.get(user_account=self.user)
+        for rating in (4, 6, 8):
+            self._feedback(rating)
+
+    def _feedback(self, rating, **kwargs) -> Feedback:
+        """Create feedback with every dimension rated ``rating``."""
+        return Feedback.objects.create(
+            speaker=self.speaker,
+            **{field: rating for field in RATING_FIELDS},
+            **kwargs,
+        )
+
+    def test_summary_served_from_the_aggregate(self):
+        """The summary reads one aggregate row, not the feedback rows."""
+        self.client.force_authenticate(self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("feedbacks:feedbacks_summary"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        clarity = response.data["ratings"]["clarity"]
+        self.assertAlmostEqual(clarity["mean"], 6.0)
+        self.assertAlmostEqual(clarity["std"], math.sqrt(8 / 3))
+        self.assertEqual(clarity["histogram"]["4"], 1)
+        self.assertEqual(sum(clarity["histogram"].values()), 3)
+
+    def test_deleted_feedback_leaves_the_statistics(self):
+        """Deleting feedback subtracts its ratings."""
+        self._feedback(10).delete()
+        aggregate = SpeakerFeedbackAggregate.objects.get(speaker=self.speaker)
+        self.assertEqual(aggregate.count, 3)
+        self.assertEqual(aggregate.engagement_sum, 18)
+        self.assertEqual(aggregate.histograms["engagement"][9], 0)
+
+    def test_edited_feedback_updates_the_statistics(self):
+        """Changing ratings or the speaker moves the ratings along."""
+        feedback = self._feedback(10)
+        feedback.clarity = 2
+        feedback.save()
+        aggregate = SpeakerFeedbackAggregate.objects.get(speaker=self.speaker)
+        self.assertEqual(aggregate.count, 4)
+        self.assertEqual(aggregate.clarity_sum, 20)
+        self.assertEqual(aggregate.clarity_sum_squares, 16 + 36 + 64 + 4)
+        self.assertEqual(aggregate.histograms["clarity"][9], 0)
+        self.assertEqual(aggregate.histograms["clarity"][1], 1)
+
+        other = SpeakerProfile.objects.get(
+            user_account=get_user_model().objects.create(
+                username="other_speaker", email="other@mail.com"
+            )
+        )
+        feedback.speaker = other
+        feedback.save()
+        aggregate.refresh_from_db()
+        self.assertEqual(aggregate.count, 3)
+        self.assertEqual(aggregate.clarity_sum, 18)
+        moved = SpeakerFeedbackAggregate.objects.get(speaker=other)
+        self.assertEqual((moved.count, moved.clarity_sum), (1, 2))
+
+        # edits leave the statistics as a full rebuild computes them
+        incremental = list(SpeakerFeedbackAggregate.objects.order_by("pk").values())
+        call_command("rebuild_feedback_aggregates", stdout=io.StringIO())
+        rebuilt = list(SpeakerFeedbackAggregate.objects.order_by("pk").values())
+        for row in incremental + rebuilt:
+            row.pop("updated_at")
+        self.assertEqual(rebuilt, incremental)
+
+    def test_rebuild_matches_incremental_updates(self):
+        """The rebuild command reproduces the incrementally kept row."""
+        incremental = SpeakerFeedbackAggregate.objects.values().get()
+        SpeakerFeedbackAggregate.objects.all().delete()
+        out = io.StringIO()
+        call_command("rebuild_feedback_aggregates", stdout=out)
+        self.assertIn("1 speaker(s)", out.getvalue())
+        rebuilt = SpeakerFeedbackAggregate.objects.values().get()
+        incremental.pop("updated_at")
+        rebuilt.pop("updated_at")
+        self.assertEqual(rebuilt, incremental)
+
+    def test_summary_without_feedback(self):
+        """Speakers without feedback get empty statistics."""
+        other = get_user_model().objects.create(username="quiet", email="q@mail.com")
+        self.client.force_authenticate(other)
+        response = self.client.get(reverse("feedbacks:feedbacks_summary"))
+        self.assertEqual(response.data["count"], 0)
+        self.assertIsNone(response.data["ratings"]["overall_rating"]["mean"])
+
+
+# ─── Feedback analytics ───────────────────────────────────────────────────────
+
+
+class FeedbackAnalyticsTests(APITestCase):
+    """Vectorised analytics for speakers and organizers."""
+
+    def setUp(self):
+        """Create an organization's event with two talks and dated feedback."""
+        from events.models import Event
+        from organizations.models import Organization, OrganizationMembership
+        from talks.models import Talks
+
+        cache.clear()
+        self.user = get_user_model().objects.create(
+            username="analytics_speaker", email="analytics@mail.com"
+        )
+        self.speaker = SpeakerProfile.objects.get(user_account=self.user)
+        self.organization = Organization.objects.create(
+            name="Analytics Org", email="org@analytics.com", created_by=self.user
+        )
+        OrganizationMembership.objects.create(
+            organization=self.organization, user=self.user, role="ADMIN"
+        )
+        self.event = Event.objects.create(
+            title="Analytics Conf", organizer=self.organization
+        )
+        self.talks = [
+            Talks.objects.create(
+                title=title,
+                description="d",
+                speaker=self.speaker,
+                duration=30,
+                category="ai and ml",
+                event=self.event,
+            )
+            for title in ("Arrays", "Vectors")
+        ]
+        today = timezone.now()
+        # (days ago, talk, overall rating); other dimensions track overall
+        for days, talk, rating in ((10, 0, 4), (9, 1, 8), (0, 1, 6)):
+            feedback = Feedback.objects.create(
+                speaker=self.speaker,
+                talk=self.talks[talk],
+                event=self.event,
+                **{field: rating for field in RATING_FIELDS[:-1]},
+                practical_relevance=10 - rating,
+            )
+            Feedback.objects.filter(pk=feedback.pk).update(
+                created_at=today - timedelta(days=days)
+            )
+
+    def test_speaker_analytics(self):
+        """Distributions, correlations, trends and talks come back together."""
+        self.client.force_authenticate(self.user)
+        url = reverse("feedbacks:feedbacks_analytics")
+        with self.assertNumQueries(2):
+            data = self.client.get(url).data
+        self.assertEqual(data["count"], 3)
+
+        overall = data["ratings"]["overall_rating"]
+        self.assertEqual(overall["mean"], 6.0)
+        self.assertEqual(overall["percentiles"]["p50"], 6.0)
+        self.assertEqual(overall["histogram"]["8"], 1)
+
+        correlation = data["correlation"]
+        self.assertEqual(correlation[0][1], 1.0)
+        self.assertEqual(
+            correlation[0][RATING_FIELDS.index("practical_relevance")], -1.0
+        )
+
+        self.assertEqual([day["count"] for day in data["trend"]], [1, 1, 1])
+        rolling = [day["rolling_means"]["overall_rating"] for day in data["trend"]]
+        # the last day's window no longer reaches the first two
+        self.assertEqual(rolling, [4.0, 6.0, 6.0])
+
+        talks = {talk["title"]: talk for talk in data["talks"]}
+        self.assertEqual(talks["Vectors"]["count"], 2)
+        self.assertEqual(talks["Vectors"]["means"]["clarity"], 7.0)
+        self.assertEqual(talks["Arrays"]["histogram"]["4"], 1)
+
+        # the cached result costs only the freshness check
+        with self.assertNumQueries(1):
+            self.client.get(url)
+        Feedback.objects.create(
+            speaker=self.speaker, **{field: 9 for field in RATING_FIELDS}
+        )
+        self.assertEqual(self.client.get(url).data["count"], 4)
+
+    def test_edited_ratings_refresh_cached_analytics(self):
+        """Changing a rating gives the analytics a fresh cache key."""
+        self.client.force_authenticate(self.user)
+        url = reverse("feedbacks:feedbacks_analytics")
+        before = self.client.get(url).data["ratings"]["overall_rating"]["mean"]
+
+        feedback = Feedback.objects.filter(overall_rating=4).get()
+        feedback.overall_rating = 10
+        feedback.save()
+
+        after = self.client.get(url).data["ratings"]["overall_rating"]["mean"]
+        self.assertEqual(before, 6.0)
+        self.assertEqual(after, 8.0)
+
+    def test_organization_analytics_for_organizers_only(self):
+        """Organizers see per-event breakdowns; other users are refused."""
+        url = reverse(
+            "feedbacks:organization_feedbacks_analytics",
+            kwargs={"slug": self.organization.slug},
+        )
+        outsider = get_user_model().objects.create(
+            username="outsider", email="outsider@mail.com"
+        )
+        self.client.force_authenticate(outsider)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(self.user)
+        data = self.client.get(url).data
+        self.assertEqual(data["events"][0]["title"], "Analytics Conf")
+        self.assertEqual(data["events"][0]["count"], 3)
+
+    def test_talk_fills_in_speaker_and_event(self):
+        """Feedback naming only a talk is attributed to its speaker and event."""
+        serializer = FeedbackSerializer(
+            data={"talk": self.talks[0].pk, **{field: 7 for field in RATING_FIELDS}}
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        feedback = serializer.save()
+        self.assertEqual(feedback.speaker, self.speaker)
+        self.assertEqual(feedback.event, self.event)
+
+
+# ─── Feedback export ──────────────────────────────────────────────────────────
+
+
+class FeedbackExportTests(APITestCase):
+    """Streamed CSV and XLSX exports for organizers."""
+
+    def setUp(self):
+        """Create an organizer's event with named and anonymous feedback."""
+        from events.models import Event
+        from organizations.models import Organization, OrganizationMembership
+
+        self.organizer = get_user_model().objects.create(
+            username="export_organizer", email="export@mail.com"
+        )
+        self.speaker = SpeakerProfile.objects.get(user_account=self.organizer)
+        organization = Organization.objects.create(
+            name="Export Org", email="org@export.com", created_by=self.organizer
+        )
+        OrganizationMembership.objects.create(
+            organization=organization, user=self.organizer, role="ORGANIZER"
+        )
+        self.event = Event.objects.create(title="Export Conf", organizer=organization)
+        other = Event.objects.create(title="Other Conf")
+        self.named = self._feedback(self.event, comments="=HYPERLINK(1)")
+        self.anonymous = self._feedback(self.event, is_anonymous=True)
+        self._feedback(other)
+        self.url = reverse("feedbacks:feedbacks_export")
+
+    def _feedback(self, event, **kwargs) -> Feedback:
+        """Create feedback for ``event`` rated 7 throughout."""
+        return Feedback.objects.create(
+            speaker=self.speaker,
+            event=event,
+            **{field: 7 for field in RATING_FIELDS},
+            **kwargs,
+        )
+
+    def test_csv_export_streams_and_honours_anonymity(self):
+        """Only the organizer's events are exported; anonymous rows lose their id."""
+        self.client.force_authenticate(self.organizer)
+        response = self.client.get(self.url)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        chunks = iter(response.streaming_content)
+        # the header is sent before the feedback query runs
+        with self.assertNumQueries(0):
+            header = next(chunks)
+        rows = list(csv.DictReader(io.StringIO((header + b"".join(chunks)).decode())))
+
+        self.assertEqual(len(rows), 2)
+        by_id = {row["id"]: row for row in rows}
+        named = by_id[str(self.named.pk)]
+        self.assertEqual(named["event"], "Export Conf")
+        self.assertEqual(named["comments"], "'=HYPERLINK(1)")
+        anonymous = by_id[""]
+        self.assertEqual(anonymous["is_anonymous"], "True")
+        self.assertEqual(
+            anonymous["created_at"], self.anonymous.created_at.date().isoformat()
+        )
+
+    def test_export_filters(self):
+        """Event, speaker and date range narrow the export."""
+        self.client.force_authenticate(self.organizer)
+        yesterday = timezone.now() - timedelta(days=1)
+        Feedback.objects.filter(pk=self.named.pk).update(created_at=yesterday)
+
+        def count(**params):
+            response = self.client.get(self.url, params)
+            return b"".join(response.streaming_content).count(b"\n") - 1
+
+        self.assertEqual(count(event=self.event.slug), 2)
+        self.assertEqual(count(speaker="nobody"), 0)
+        self.assertEqual(count(start=timezone.localdate().isoformat()), 1)
+        self.assertEqual(count(end=yesterday.date().isoformat()), 1)
+        response = self.client.get(
+            self.url, {"start": "2026-02-02", "end": "2026-02-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_xlsx_export(self):
+        """The XLSX export is a readable workbook with one row per feedback."""
+        self.client.force_authenticate(self.organizer)
+        response = self.client.get(self.url, {"file_format": "xlsx"})
+        workbook = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+        self.assertIsNone(workbook.testzip())
+        sheet = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+        namespace = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+        rows = sheet.findall(f"{namespace}sheetData/{namespace}row")
+        self.assertEqual(len(rows), 3)
+        header = [cell.findtext(f"{namespace}is/{namespace}t") for cell in rows[0]]
+        self.assertEqual(header[:2], ["id", "created_at"])
+
+    def test_export_requires_an_organizer(self):
+        """Users without an organizer role are refused."""
+        attendee = get_user_model().objects.create(
+            username="export_attendee", email="attendee@export.com"
+        )
+        self.client.force_authenticate(attendee)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+# ─── Feedback archive and partitioning ────────────────────────────────────────
+
+
+class FeedbackArchiveTests(TestCase):
+    """Old feedback moves to the compressed archive without losing statistics."""
+
+    def setUp(self):
+        """Create recent feedback and feedback from two old months."""
+        user = get_user_model().objects.create(
+            username="archive_speaker", email="archive@mail.com"
+        )
+        self.speaker = SpeakerProfile.objects.get(user_account=user)
+        now = timezone.now()
+        for days, rating in ((0, 9), (400, 3), (440, 5)):
+            feedback = Feedback.objects.create(
+                speaker=self.speaker,
+                comments=f"rated {rating}",
+                **{field: rating for field in RATING_FIELDS},
+            )
+            Feedback.objects.filter(pk=feedback.pk).update(
+                created_at=now - timedelta(days=days)
+            )
+
+    def _statistics(self) -> dict:
+        """Return the speaker's stored aggregate without its timestamp."""
+        stats = SpeakerFeedbackAggregate.objects.values().get(speaker=self.speaker)
+        stats.pop("updated_at")
+        return stats
+
+    def test_archive_keeps_rows_and_statistics(self):
+        """Archived rows are readable and still counted after a rebuild."""
+        before = self._statistics()
+        out = io.StringIO()
+        call_command(
+            "archive_feedback", "--days", "365", "--batch-size", "1", stdout=out
+        )
+        self.assertIn("Archived 2 feedback row(s)", out.getvalue())
+
+        self.assertEqual(Feedback.objects.count(), 1)
+        archives = FeedbackArchive.objects.order_by("month")
+        self.assertEqual([archive.row_count for archive in archives], [1, 1])
+        self.assertEqual(archives[0].rows()[0]["comments"], "rated 5")
+        self.assertEqual(archives[1].statistics["clarity_sum"], 3)
+        self.assertEqual(self._statistics(), before)
+
+        call_command("rebuild_feedback_aggregates", stdout=io.StringIO())
+        self.assertEqual(self._statistics(), before)
+
+    def test_archive_dry_run(self):
+        """A dry run only counts."""
+        out = io.StringIO()
+        call_command("archive_feedback", "--days", "365", "--dry-run", stdout=out)
+        self.assertIn("2 feedback row(s) would be archived", out.getvalue())
+        self.assertEqual(Feedback.objects.count(), 3)
+
+    def test_partition_conversion_sql(self):
+        """The conversion covers every month of data plus the months ahead."""
+        out = io.StringIO()
+        call_command(
+            "partition_feedbacks",
+            "--convert",
+            "--sql",
+            "--months-ahead",
+            "2",
+            stdout=out,
+        )
+        sql = out.getvalue()
+        self.assertIn("PARTITION BY RANGE (created_at)", sql)
+        self.assertIn("ADD PRIMARY KEY (id, created_at)", sql)
+        self.assertIn('"feedbacks_event_created_idx"', sql)
+        # 440 days back through 2 months ahead, plus the default partition
+        self.assertGreaterEqual(sql.count("PARTITION OF"), 17)
+
+        with self.assertRaises(CommandError):
+            call_command("partition_feedbacks", stdout=io.StringIO())
+
+    def test_monthly_sql_moves_rows_out_of_the_default_partition(self):
+        """New partitions are created with the default partition detached."""
+        month = partitioning.month_start(timezone.localdate())
+        statements = partitioning.create_partitions_sql(
+            [month, partitioning.add_months(month, 1)]
+        )
+
+        self.assertEqual(len(statements), 2 + 3 * 2)
+        self.assertEqual(
+            statements[0],
+            'ALTER TABLE "feedbacks" DETACH PARTITION "feedbacks_default"',
+        )
+        self.assertIn(
+            f'INSERT INTO "{partitioning.partition_name(month)}" '
+            'SELECT * FROM "feedbacks_default"',
+            statements[2],
+        )
+        self.assertEqual(
+            statements[-1],
+            'ALTER TABLE "feedbacks" ATTACH PARTITION "feedbacks_default" DEFAULT',
+        )
+        self.assertEqual(partitioning.create_partitions_sql([]), [])
+
+    @skipUnless(connection.vendor == "postgresql", "partitioning needs PostgreSQL")
+    def test_monthly_run_on_a_partitioned_table(self):
+        """Rows that landed in the default partition move to their new month."""
+        call_command(
+            "partition_feedbacks",
+            "--convert",
+            "--months-ahead",
+            "0",
+            stdout=io.StringIO(),
+        )
+        month = partitioning.add_months(
+            partitioning.month_start(timezone.localdate()), 2
+        )
+        future = Feedback.objects.create(
+            speaker=self.speaker, **dict.fromkeys(RATING_FIELDS, 7)
+        )
+        Feedback.objects.filter(pk=future.pk).update(
+            created_at=timezone.make_aware(datetime.combine(month, datetime.min.time()))
+        )
+
+        out = io.StringIO()
+        call_command("partition_feedbacks", "--months-ahead", "2", stdout=out)
+        self.assertIn("Ran", out.getvalue())
+        self.assertIn(partitioning.partition_name(month), partitioning.partitions())
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT id FROM "{partitioning.partition_name(month)}"')
+            self.assertEqual([row[0] for row in cursor], [future.pk])
+        self.assertEqual(Feedback.objects.count(), 4)
+
+        # nothing is left to create on the next run
+        out = io.StringIO()
+        call_command("partition_feedbacks", "--months-ahead", "2", stdout=out)
+        self.assertIn("Ran 0 partitioning statement(s)", out.getvalue())
+
+
+# ─── Buffered feedback ingestion ──────────────────────────────────────────────
+
+
+class FeedbackIngestTests(APITestCase):
+    """Buffered submissions are validated up front and written in batches."""
+
+    def setUp(self):
+        """Create a talk and the attendance of a verified attendee."""
+        from attendees.models import Attendance
+        from events.models import Event
+        from talks.models import Talks
+
+        user = get_user_model().objects.create(
+            username="ingest_speaker", email="ingest@mail.com"
+        )
+        self.speaker = SpeakerProfile.objects.get(user_account=user)
+        self.event = Event.objects.create(title="Ingest Conf")
+        self.talk = Talks.objects.create(
+            title="Batching",
+            description="d",
+            speaker=self.speaker,
+            duration=30,
+            category="ai and ml",
+            event=self.event,
+        )
+        self.attendance = Attendance.objects.create(
+            event=self.event, email="attendee@ingest.com", is_verified=True
+        )
+
+    def _submit(self, rating: int = 8):
+        """Post feedback on the talk as a verified attendee."""
+        session = self.client.session
+        session["attendee_verified"] = True
+        session["attendee_email"] = self.attendance.email
+        session.save()
+        data = {"talk": str(self.talk.pk), **dict.fromkeys(RATING_FIELDS, rating)}
+        return self.client.post(
+            reverse("feedbacks:feedbacks_list_create"), data, format="json"
+        )
+
+    def test_direct_submission(self):
+        """Without buffering, feedback and attendance are written in the request."""
+        response = self._submit()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        feedback = Feedback.objects.get()
+        self.assertEqual(feedback.speaker, self.speaker)
+        self.attendance.refresh_from_db()
+        self.assertTrue(self.attendance.is_given_feedback)
+
+    @override_settings(FEEDBACK_INGEST_BUFFERED=True)
+    def test_buffered_submissions_are_written_in_one_batch(self):
+        """Submissions wait as pending rows until a flush writes them together."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            responses = [self._submit(rating) for rating in (6, 10)]
+        self.assertEqual(len(callbacks), 2)
+        for response in responses:
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertFalse(Feedback.objects.exists())
+        self.assertEqual(PendingFeedback.objects.count(), 2)
+
+        out = io.StringIO()
+        call_command("flush_pending_feedback", "--batch-size", "10", stdout=out)
+        self.assertIn("Wrote 2 pending feedback submission(s)", out.getvalue())
+        self.assertFalse(PendingFeedback.objects.exists())
+        self.assertEqual(
+            {str(pk) for pk in Feedback.objects.values_list("id", flat=True)},
+            {str(response.data["id"]) for response in responses},
+        )
+        self.assertEqual(
+            set(Feedback.objects.values_list("speaker", "event")),
+            {(self.speaker.pk, self.event.pk)},
+        )
+        aggregate = SpeakerFeedbackAggregate.objects.get(speaker=self.speaker)
+        self.assertEqual(aggregate.count, 2)
+        self.assertEqual(aggregate.clarity_sum, 16)
+        self.attendance.refresh_from_db()
+        self.assertTrue(self.attendance.is_given_feedback)
+
+    @override_settings(FEEDBACK_INGEST_BUFFERED=True)
+    def test_invalid_submission_is_rejected_up_front(self):
+        """Validation still happens in the request."""
+        session = self.client.session
+        session["attendee_verified"] = True
+        session.save()
+        response = self.client.post(
+            reverse("feedbacks:feedbacks_list_create"),
+            {"talk": str(self.talk.pk), "overall_rating": 11},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(PendingFeedback.objects.exists())
+
+    @override_settings(FEEDBACK_INGEST_BUFFERED=True)
+    def test_flush_unlinks_deleted_references(self):
+        """A talk deleted before the flush is dropped, as SET_NULL would."""
+        self._submit()
+        self.talk.delete()
+        call_command("flush_pending_feedback", stdout=io.StringIO())
+        feedback = Feedback.objects.get()
+        self.assertIsNone(feedback.talk)
+        self.assertEqual(feedback.speaker, self.speaker)
+
+
+class FeedbackIngestorTests(SimpleTestCase):
+    """The worker thread batches flushes by size and by time."""
+
+    def _ingestor(self, interval_ms: int, batch_size: int, fail: bool = False):
+        """Return an ingestor and the events set by good and failed flushes.
+
+        With ``fail``, the first flush raises.
+        """
+        flushed, failed = threading.Event(), threading.Event()
+
+        def flush():
+            if fail and not failed.is_set():
+                failed.set()
+                raise RuntimeError("database unavailable")
+            flushed.set()
+
+        return FeedbackIngestor(flush, interval_ms, batch_size), flushed, failed
+
+    def test_full_batch_flushes_before_the_interval(self):
+        """Reaching the batch size flushes without waiting."""
+        ingestor, flushed, _ = self._ingestor(interval_ms=60_000, batch_size=3)
+        ingestor.notify()
+        ingestor.notify()
+        self.assertFalse(flushed.wait(0.1))
+        ingestor.notify()
+        self.assertTrue(flushed.wait(5))
+
+    def test_interval_flushes_a_partial_batch(self):
+        """A lone submission is flushed once the interval has passed."""
+        ingestor, flushed, _ = self._ingestor(interval_ms=20, batch_size=100)
+        ingestor.notify()
+        self.assertTrue(flushed.wait(5))
+
+    def test_worker_survives_a_failed_flush(self):
+        """A failing flush is logged and the worker keeps serving."""
+        ingestor, flushed, failed = self._ingestor(
+            interval_ms=0, batch_size=1, fail=True
+        )
+        with self.assertLogs("feedbacks.ingest", level="ERROR"):
+            ingestor.notify()
+            self.assertTrue(failed.wait(5))
+            ingestor.notify()
+            self.assertTrue(flushed.wait(5))
+        self.assertTrue(ingestor._thread.is_alive())
@@ -11,5 +11,25 @@ urlpatterns = [
         "feedbacks/",
         views.FeedbackListCreateView.as_view(),
         name="feedbacks_list_create",
-    )
+    ),
+    path(
+        "feedbacks/summary/",
+        views.FeedbackSummaryView.as_view(),
+        name="feedbacks_summary",
+    ),
+    path(
+        "feedbacks/export/",
+        views.FeedbackExportView.as_view(),
+        name="feedbacks_export",
+    ),
+    path(
+        "feedbacks/analytics/",
+        views.SpeakerFeedbackAnalyticsView.as_view(),
+        name="feedbacks_analytics",
+    ),
+    path(
+        "feedbacks/analytics/organizations/<slug:slug>/",
+        views.OrganizationFeedbackAnalyticsView.as_view(),
+        name="organization_feedbacks_analytics",
+    ),
 ]
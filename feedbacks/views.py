@@ -1,19 +1,40 @@
 """Feedback views using Generic Views."""
 
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from attendees.models import Attendance
+from base.pagination import CursorPaginationMixin, cursor_paginated
+from base.permissions import IsOrganizationAdminOrOrganizer
+from organizations.choices import OrganizationRole
+from organizations.models import Organization, OrganizationMembership
 
-from .models import Feedback
-from .serializers import FeedbackSerializer
+from .aggregates import summarize
+from .analytics import feedback_analytics
+from .exports import export_rows, stream_csv, stream_xlsx
+from .ingest import buffer_feedback
+from .models import Feedback, SpeakerFeedbackAggregate
+from .serializers import (
+    FeedbackAnalyticsSerializer,
+    FeedbackExportQuerySerializer,
+    FeedbackSerializer,
+    FeedbackSummarySerializer,
+)
 
 
-class FeedbackListCreateView(APIView):
+class FeedbackListCreateView(CursorPaginationMixin, APIView):
     """List and create feedback."""
 
     serializer_class = FeedbackSerializer
@@ -24,19 +45,24 @@ class FeedbackListCreateView(APIView):
             return [IsAuthenticated()]
         return [AllowAny()]
 
-    @extend_schema(responses=FeedbackSerializer(many=True))
+    @extend_schema(responses=cursor_paginated(FeedbackSerializer))
     def get(self, request, *args, **kwargs):
         """List feedbacks for the authenticated speaker."""
         feedbacks = Feedback.objects.filter(speaker__user_account=request.user)
-        serializer = self.serializer_class(feedbacks, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = self.serializer_class(self.paginate_queryset(feedbacks), many=True)
+        return self.get_paginated_response(serializer.data)
 
-    @extend_schema(request=FeedbackSerializer, responses=FeedbackSerializer)
+    @extend_schema(
+        request=FeedbackSerializer,
+        responses={201: FeedbackSerializer, 202: FeedbackSerializer},
+    )
     def post(self, request, *args, **kwargs):
         """Create a new feedback.
 
         Requires prior attendee verification via the verify endpoint.
         If not verified, returns 403 with a link to the verification endpoint.
+        With ``FEEDBACK_INGEST_BUFFERED`` on, the validated feedback is queued
+        for a batched write (``feedbacks.ingest``) and 202 is returned.
         """
         if not request.session.get("attendee_verified"):
             verify_url = reverse("attendees:verify-attendee")
@@ -51,18 +77,131 @@ class FeedbackListCreateView(APIView):
 
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-
-        # Mark attendance as having given feedback based on verified email.
         email = request.session.get("attendee_email")
-        if email:
-            Attendance.objects.filter(email=email, is_given_feedback=False).update(
-                is_given_feedback=True
+
+        if settings.FEEDBACK_INGEST_BUFFERED:
+            feedback = buffer_feedback(serializer.validated_data, email)
+            response = Response(
+                self.serializer_class(feedback).data, status=status.HTTP_202_ACCEPTED
             )
+        else:
+            serializer.save()
+            # Mark attendance as having given feedback based on verified email.
+            if email:
+                Attendance.objects.filter(email=email, is_given_feedback=False).update(
+                    is_given_feedback=True
+                )
+            response = Response(serializer.data, status=status.HTTP_201_CREATED)
 
         # Clear verification flags after successful submission.
         request.session["attendee_verified"] = False
         request.session.pop("attendee_email", None)
         request.session.save()
 
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return response
+
+
+class FeedbackSummaryView(APIView):
+    """Rating statistics of the authenticated speaker's feedback."""
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(responses=FeedbackSummarySerializer)
+    def get(self, request, *args, **kwargs):
+        """Return means, standard deviations and histograms of each rating.
+
+        Served from the stored aggregates, without reading feedback rows.
+        """
+        aggregates = SpeakerFeedbackAggregate.objects.filter(
+            speaker__user_account=request.user
+        )
+        serializer = FeedbackSummarySerializer(summarize(aggregates))
+        return Response(serializer.data)
+
+
+class SpeakerFeedbackAnalyticsView(APIView):
+    """Feedback analytics of the authenticated speaker."""
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(responses=FeedbackAnalyticsSerializer)
+    def get(self, request, *args, **kwargs):
+        """Return distributions, correlations, trends and per-talk breakdowns."""
+        feedbacks = Feedback.objects.filter(speaker__user_account=request.user)
+        return Response(feedback_analytics(f"user:{request.user.pk}", feedbacks))
+
+
+class OrganizationFeedbackAnalyticsView(APIView):
+    """Feedback analytics of an organization's events, for its organizers."""
+
+    permission_classes = [IsAuthenticated, IsOrganizationAdminOrOrganizer]
+
+    @extend_schema(responses=FeedbackAnalyticsSerializer)
+    def get(self, request, slug, *args, **kwargs):
+        """Return distributions, correlations, trends and per-event breakdowns."""
+        organization = get_object_or_404(Organization, slug=slug)
+        self.check_object_permissions(request, organization)
+        feedbacks = Feedback.objects.filter(event__organizer=organization)
+        return Response(
+            feedback_analytics(f"organization:{organization.pk}", feedbacks)
+        )
+
+
+class FeedbackExportView(APIView):
+    """Stream the feedback of the caller's organizations' events as a file."""
+
+    permission_classes = [IsAuthenticated]
+
+    EXPORT_FORMATS = {
+        "csv": ("text/csv; charset=utf-8", stream_csv),
+        "xlsx": (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            stream_xlsx,
+        ),
+    }
+
+    @extend_schema(
+        parameters=[FeedbackExportQuerySerializer],
+        responses={(200, "text/csv"): OpenApiTypes.BINARY},
+    )
+    def get(self, request, *args, **kwargs):
+        """Export feedback filtered by event, speaker and date range.
+
+        Only admins and organizers of the events' organizations may export.
+        """
+        query = FeedbackExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        organizations = OrganizationMembership.objects.filter(
+            user=request.user,
+            role__in=[OrganizationRole.ADMIN, OrganizationRole.ORGANIZER],
+        ).values("organization")
+        if not organizations.exists():
+            raise PermissionDenied("Only organization organizers can export feedback.")
+
+        feedbacks = Feedback.objects.filter(event__organizer__in=organizations)
+        if "event" in params:
+            feedbacks = feedbacks.filter(event__slug=params["event"])
+        if "speaker" in params:
+            feedbacks = feedbacks.filter(speaker__slug=params["speaker"])
+        if "start" in params:
+            feedbacks = feedbacks.filter(
+                created_at__gte=timezone.make_aware(
+                    datetime.combine(params["start"], time.min)
+                )
+            )
+        if "end" in params:
+            feedbacks = feedbacks.filter(
+                created_at__lt=timezone.make_aware(
+                    datetime.combine(params["end"] + timedelta(days=1), time.min)
+                )
+            )
+
+        content_type, stream = self.EXPORT_FORMATS[params["file_format"]]
+        response = StreamingHttpResponse(
+            stream(export_rows(feedbacks)), content_type=content_type
+        )
+        filename = f"feedback-{timezone.localdate():%Y%m%d}.{params['file_format']}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
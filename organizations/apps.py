@@ -8,3 +8,7 @@ class OrganizationsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "organizations"
+
+    def ready(self):
+        """Connect the app's signal handlers."""
+        from organizations import signals  # noqa: F401
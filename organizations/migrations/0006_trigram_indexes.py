@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:53
+
+from django.db import migrations
+
+
+# icontains compiles to UPPER(col::text) LIKE UPPER(%s) on PostgreSQL, so
+# the trigram indexes are built on that expression for the planner to use.
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organizations", "0005_merge_20260509_1654"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE EXTENSION IF NOT EXISTS "pg_trgm";',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX organizations_name_trgm_idx ON organizations_organization "
+                "USING gin ((UPPER(name::text)) gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS organizations_name_trgm_idx;",
+        ),
+    ]
@@ -3,9 +3,8 @@
 import uuid
 
 from django.db import models
-from django.utils.text import slugify
 
-from base.models import TimeStampedModel
+from base.models import TimeStampedModel, UniqueSlugMixin
 from organizations.choices import OrganizationRole
 from users.models import User
 
@@ -14,7 +13,7 @@ from users.models import User
 ORGANIZATION_UPLOAD_DIR = "organizations/logos/"
 
 
-class Organization(TimeStampedModel):
+class Organization(UniqueSlugMixin, TimeStampedModel):
     """Model representing an organization."""
 
     STATUS_CHOICES = [
@@ -31,6 +30,12 @@ class Organization(TimeStampedModel):
     email = models.EmailField(unique=True)
     website = models.URLField(max_length=255, blank=True, null=True)
     logo = models.ImageField(upload_to=ORGANIZATION_UPLOAD_DIR, blank=True, null=True)
+    image_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Rendered thumbnails of the image, kept by base.renditions.",
+    )
     is_active = models.BooleanField(default=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
     created_by = models.ForeignKey(
@@ -38,6 +43,8 @@ class Organization(TimeStampedModel):
     )
     slug = models.SlugField(max_length=255, unique=True, null=True)
 
+    slug_fallback = "organization"
+
     class Meta:
         """Meta class for Organization model."""
 
@@ -48,11 +55,9 @@ class Organization(TimeStampedModel):
         """String representation of the organization."""
         return self.name
 
-    def save(self, *args, **kwargs):
-        """Save the organization."""
-        if not self.slug:
-            self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
+    def get_slug_source(self) -> str:
+        """Build the slug from the organization name."""
+        return self.name
 
 
 class OrganizationMembership(TimeStampedModel):
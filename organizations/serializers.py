@@ -2,11 +2,15 @@
 
 from rest_framework import serializers
 
+from base.middleware import TimedSerializerMixin
+from base.renditions import RenditionsField
 from organizations.choices import OrganizationRole
 from organizations.models import Organization, OrganizationMembership
 
 
-class OrganizationMembershipSerializer(serializers.ModelSerializer):
+class OrganizationMembershipSerializer(
+    TimedSerializerMixin, serializers.ModelSerializer
+):
     """Serializer for OrganizationMembership."""
 
     username = serializers.CharField(source="user.username", read_only=True)
@@ -26,14 +30,16 @@ class OrganizationMembershipSerializer(serializers.ModelSerializer):
         ]
 
 
-class OrganizationSerializer(serializers.ModelSerializer):
+class OrganizationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for the Organization model."""
 
+    logo_renditions = RenditionsField(source="logo")
+
     class Meta:
         """Meta class for OrganizationSerializer."""
 
         model = Organization
-        exclude = ["created_at", "updated_at"]
+        exclude = ["created_at", "updated_at", "image_renditions"]
         read_only_fields = ["id", "created_by", "slug", "status", "is_active"]
 
     def create(self, validated_data):
@@ -0,0 +1,6 @@
+"""organizations signals."""
+
+from base.renditions import track_renditions
+from organizations.models import Organization
+
+track_renditions(Organization, "logo")
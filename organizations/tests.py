@@ -46,6 +46,14 @@ class OrganizationModelTest(TestCase):
                 name="Test Organization", email="org@example.com", created_by=self.user
             )
 
+    def test_same_name_gets_a_distinct_slug(self):
+        """Organizations sharing a name get numbered slugs."""
+        other = Organization.objects.create(
+            name="Test Organization", email="other@example.com", created_by=self.user
+        )
+        self.assertEqual(self.organization.slug, "test-organization")
+        self.assertEqual(other.slug, "test-organization-2")
+
     def test_organization_str_representation(self):
         """Test string representation of organization."""
         self.assertEqual(str(self.organization), "Test Organization")
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0009_add_pagination_indexes"),
+        ("organizations", "0005_merge_20260509_1654"),
+        ("speakerrequests", "0008_fix_cascade_on_delete"),
+        ("speakers", "0014_add_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="speakeremailrequests",
+            index=models.Index(
+                fields=["created_at", "id"], name="emailreq_created_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="speakerrequest",
+            index=models.Index(
+                fields=["organizer", "created_at", "id"],
+                name="speakerreq_org_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="speakerrequest",
+            index=models.Index(
+                fields=["speaker", "created_at", "id"],
+                name="speakerreq_spk_created_idx",
+            ),
+        ),
+    ]
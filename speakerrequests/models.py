@@ -31,6 +31,17 @@ class SpeakerRequest(TimeStampedModel):
 
         unique_together = ("organizer", "speaker", "event")
         ordering = ["-created_at"]
+        indexes = [
+            # keyset pagination of the organizer and speaker request lists
+            models.Index(
+                fields=["organizer", "created_at", "id"],
+                name="speakerreq_org_created_idx",
+            ),
+            models.Index(
+                fields=["speaker", "created_at", "id"],
+                name="speakerreq_spk_created_idx",
+            ),
+        ]
 
     def __str__(self):
         """Str."""
@@ -64,6 +75,14 @@ class SpeakerEmailRequests(TimeStampedModel):
         default=RequestStatusChoices.PENDING,
     )
 
+    class Meta:
+        """Meta options for SpeakerEmailRequests."""
+
+        indexes = [
+            # keyset pagination of the email request list (base.pagination)
+            models.Index(fields=["created_at", "id"], name="emailreq_created_id_idx"),
+        ]
+
     def __str__(self):
         """Str."""
         return f"{self.request_from.username} requests {self.request_to.username}"
@@ -2,10 +2,11 @@
 
 from rest_framework import serializers
 
+from base.middleware import TimedSerializerMixin
 from speakerrequests.models import SpeakerEmailRequests, SpeakerRequest
 
 
-class SpeakerRequestSerializer(serializers.ModelSerializer):
+class SpeakerRequestSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """speaker request serializer."""
 
     class Meta:
@@ -15,7 +16,7 @@ class SpeakerRequestSerializer(serializers.ModelSerializer):
         exclude = ["created_at", "updated_at"]
 
 
-class EmailRequestsSerializer(serializers.ModelSerializer):
+class EmailRequestsSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Email request serializer."""
 
     class Meta:
@@ -11,6 +11,7 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from base.pagination import CursorPaginationMixin, cursor_paginated
 from organizations.models import OrganizationMembership
 from speakerrequests.choices import RequestStatusChoices
 from speakerrequests.filters import EmailRequestsFilter, SpeakerRequestFilter
@@ -27,7 +28,7 @@ from speakerrequests.utils import (
 )
 
 
-class SpeakerRequestListView(APIView):
+class SpeakerRequestListView(CursorPaginationMixin, APIView):
     """View to list and create speaker requests.
 
     This view allows organizers to list all their speaker requests and create new ones.
@@ -62,7 +63,7 @@ class SpeakerRequestListView(APIView):
         except Exception as err:
             raise Http404 from err
 
-    @extend_schema(responses=SpeakerRequestSerializer(many=True))
+    @extend_schema(responses=cursor_paginated(SpeakerRequestSerializer))
     def get(self, request):
         """Get all speaker requests for the authenticated organizer.
 
@@ -74,8 +75,10 @@ class SpeakerRequestListView(APIView):
         """
         organization_id = request.GET.get("organization")
         speaker_requests = self.get_objects(request.user, organization_id)
-        serializer = SpeakerRequestSerializer(speaker_requests, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = SpeakerRequestSerializer(
+            self.paginate_queryset(speaker_requests), many=True
+        )
+        return self.get_paginated_response(serializer.data)
 
     @extend_schema(request=SpeakerRequestSerializer)
     def post(self, request):
@@ -190,7 +193,7 @@ class SPeakerRequestDetailView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class SpeakerRequestsListView(APIView):
+class SpeakerRequestsListView(CursorPaginationMixin, APIView):
     """View to list incoming speaker requests for a speaker.
 
     This view allows speakers to see all requests sent to them.
@@ -205,7 +208,7 @@ class SpeakerRequestsListView(APIView):
         except SpeakerRequest.DoesNotExist as err:
             raise Http404 from err
 
-    @extend_schema(responses=SpeakerRequestSerializer(many=True))
+    @extend_schema(responses=cursor_paginated(SpeakerRequestSerializer))
     def get(self, request, pk=None):
         """Get all incoming speaker requests for the authenticated speaker.
 
@@ -220,8 +223,10 @@ class SpeakerRequestsListView(APIView):
         speaker_requests_filter = SpeakerRequestFilter(
             request.GET, queryset=speaker_requests
         )
-        serializer = SpeakerRequestSerializer(speaker_requests_filter.qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = SpeakerRequestSerializer(
+            self.paginate_queryset(speaker_requests_filter.qs), many=True
+        )
+        return self.get_paginated_response(serializer.data)
 
 
 class SpeakerRequestAcceptView(APIView):
@@ -307,7 +312,7 @@ class SpeakerRequestAcceptView(APIView):
     responses=EmailRequestsSerializer,
     tags=["speaker email-request"],
 )
-class SpeakerEmailRequestListView(APIView):
+class SpeakerEmailRequestListView(CursorPaginationMixin, APIView):
     """Speaker request sent via email."""
 
     permission_classes = [IsAuthenticated]
@@ -321,12 +326,15 @@ class SpeakerEmailRequestListView(APIView):
         except SpeakerEmailRequests.DoesNotExist:
             return NotFound
 
+    @extend_schema(responses=cursor_paginated(EmailRequestsSerializer))
     def get(self, request):
         """Return request sent or received by the authenticated user."""
         email_requests = self.get_object(request.user)
         email_request_filter = EmailRequestsFilter(request.GET, queryset=email_requests)
-        serializer = EmailRequestsSerializer(email_request_filter.qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = EmailRequestsSerializer(
+            self.paginate_queryset(email_request_filter.qs), many=True
+        )
+        return self.get_paginated_response(serializer.data)
 
     def post(self, request):
         """Create a new request sent via email."""
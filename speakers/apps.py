@@ -10,3 +10,7 @@ class SpeakersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "speakers"
     verbose_name = _("Speakers")
+
+    def ready(self):
+        """Connect the app's signal handlers."""
+        from speakers import signals  # noqa: F401
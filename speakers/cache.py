@@ -0,0 +1,39 @@
+"""speakers cache."""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# bump when the cached body's shape changes so old entries are ignored
+PROFILE_CACHE_VERSION = 1
+
+
+def profile_cache_key(slug: str) -> str:
+    """Return the cache key for a public speaker profile body."""
+    return f"speakers:profile:v{PROFILE_CACHE_VERSION}:{slug}"
+
+
+def get_cached_profile(slug: str):
+    """Return the cached profile body for ``slug``, or None on a miss."""
+    return cache.get(profile_cache_key(slug))
+
+
+def set_cached_profile(slug: str, data) -> None:
+    """Store the viewer-independent profile body for ``slug``."""
+    cache.set(
+        profile_cache_key(slug), data, timeout=settings.SPEAKER_PROFILE_CACHE_TIMEOUT
+    )
+
+
+def invalidate_profiles(*slugs) -> None:
+    """Drop the cached bodies for ``slugs``.
+
+    Entries are deleted straight away and again once the surrounding
+    transaction commits, so a read that raced the write and cached the old
+    rows doesn't outlive the change.
+    """
+    keys = [profile_cache_key(slug) for slug in slugs if slug]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1 @@
+"""speakers management commands."""
@@ -0,0 +1,35 @@
+"""Precompute the suggested speakers to follow."""
+
+from django.core.management.base import BaseCommand
+
+from speakers.suggestions import refresh_speaker_suggestions, refresh_suggestions
+
+
+class Command(BaseCommand):
+    """Refresh the stored speaker suggestions of users whose follows changed."""
+
+    help = "Recompute the suggested speakers to follow."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recompute every user instead of only those whose follows changed.",
+        )
+        parser.add_argument(
+            "--enqueue",
+            action="store_true",
+            help="Run the refresh as a background task instead of inline.",
+        )
+
+    def handle(self, *args, **options):
+        """Refresh suggestions inline or hand them to the task backend."""
+        if options["enqueue"]:
+            refresh_speaker_suggestions.enqueue(full=options["full"])
+            self.stdout.write(self.style.SUCCESS("Queued speaker suggestion refresh."))
+            return
+        refreshed = refresh_suggestions(full=options["full"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed suggestions for {refreshed} user(s).")
+        )
@@ -0,0 +1,29 @@
+"""Rebuild the speaker search index."""
+
+from django.core.management.base import BaseCommand
+
+from speakers.models import SpeakerProfile
+from speakers.search import index_speakers
+
+
+class Command(BaseCommand):
+    """Recompute the stored search document of every speaker profile."""
+
+    help = "Rebuild the speaker search documents and index."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of profiles indexed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        """Index every profile in batches."""
+        batch_size = options["batch_size"]
+        ids = list(SpeakerProfile.objects.order_by("pk").values_list("pk", flat=True))
+        for start in range(0, len(ids), batch_size):
+            index_speakers(ids[start : start + batch_size])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {len(ids)} speaker profile(s)."))
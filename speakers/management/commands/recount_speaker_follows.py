@@ -0,0 +1,49 @@
+"""Recompute the stored speaker follow counters."""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from speakers.cache import invalidate_profiles
+from speakers.models import SpeakerProfile
+
+
+class Command(BaseCommand):
+    """Repair ``followers_count``/``following_count`` from SpeakerFollow rows."""
+
+    help = "Recompute and repair the stored speaker follower/following counts."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the profiles whose counts have drifted.",
+        )
+
+    def handle(self, *args, **options):
+        """Find drifted profiles and write the recomputed counts back."""
+        repaired = 0
+        with transaction.atomic():
+            stale = (
+                SpeakerProfile.objects.with_stale_follow_counts()
+                .select_for_update(of=("self",))
+                .only("id", "slug", "followers_count", "following_count")
+            )
+            for profile in stale:
+                self.stdout.write(
+                    f"{profile.slug}: followers {profile.followers_count} -> "
+                    f"{profile.actual_followers_count}, following "
+                    f"{profile.following_count} -> {profile.actual_following_count}"
+                )
+                if not options["dry_run"]:
+                    SpeakerProfile.objects.filter(pk=profile.pk).update(
+                        followers_count=profile.actual_followers_count,
+                        following_count=profile.actual_following_count,
+                    )
+                    invalidate_profiles(profile.slug)
+                repaired += 1
+
+        verb = "Found" if options["dry_run"] else "Repaired"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {repaired} speaker profile(s) with drift.")
+        )
@@ -0,0 +1,60 @@
+"""speakers managers."""
+
+from django.db import models
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+class SpeakerProfileQuerySet(models.QuerySet):
+    """Query set for speaker profiles."""
+
+    def with_social_stats(self, viewer=None):
+        """Annotate whether ``viewer`` follows each speaker.
+
+        Follower and following counts are stored on the profile itself, so
+        the only per-viewer value, ``viewer_is_following``, is computed by an
+        EXISTS subquery inside the main query instead of once per row.
+        """
+        from speakers.models import SpeakerFollow
+
+        if viewer is not None and viewer.is_authenticated:
+            viewer_is_following = Exists(
+                SpeakerFollow.objects.filter(follower=viewer, speaker=OuterRef("pk"))
+            )
+        else:
+            viewer_is_following = Value(False, output_field=models.BooleanField())
+        return self.annotate(viewer_is_following=viewer_is_following)
+
+    def with_actual_follow_counts(self):
+        """Annotate follow counts computed from the ``SpeakerFollow`` rows.
+
+        Used to check and repair the stored ``followers_count`` and
+        ``following_count`` columns.
+        """
+        from speakers.models import SpeakerFollow
+
+        followers = (
+            SpeakerFollow.objects.filter(speaker=OuterRef("pk"))
+            .order_by()
+            .values("speaker")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        following = (
+            SpeakerFollow.objects.filter(follower=OuterRef("user_account"))
+            .order_by()
+            .values("follower")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return self.annotate(
+            actual_followers_count=Coalesce(Subquery(followers), 0),
+            actual_following_count=Coalesce(Subquery(following), 0),
+        )
+
+    def with_stale_follow_counts(self):
+        """Return profiles whose stored follow counts have drifted."""
+        return self.with_actual_follow_counts().filter(
+            ~Q(followers_count=F("actual_followers_count"))
+            | ~Q(following_count=F("actual_following_count"))
+        )
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:24
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_follow_counts(apps, schema_editor):
+    SpeakerProfile = apps.get_model("speakers", "SpeakerProfile")
+    SpeakerFollow = apps.get_model("speakers", "SpeakerFollow")
+
+    followers = (
+        SpeakerFollow.objects.filter(speaker=OuterRef("pk"))
+        .order_by()
+        .values("speaker")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    following = (
+        SpeakerFollow.objects.filter(follower=OuterRef("user_account"))
+        .order_by()
+        .values("follower")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    SpeakerProfile.objects.update(
+        followers_count=Coalesce(Subquery(followers), 0),
+        following_count=Coalesce(Subquery(following), 0),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("speakers", "0012_convert_ids_to_uuid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="speakerprofile",
+            name="followers_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Number of users following this speaker."
+            ),
+        ),
+        migrations.AddField(
+            model_name="speakerprofile",
+            name="following_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Number of speakers this speaker's user follows."
+            ),
+        ),
+        migrations.RunPython(backfill_follow_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_add_pagination_indexes'),
+        ('speakers', '0013_speakerprofile_follow_counts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='speakerprofile',
+            index=models.Index(fields=['created_at', 'id'], name='speakers_created_id_idx'),
+        ),
+    ]
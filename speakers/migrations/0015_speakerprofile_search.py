@@ -0,0 +1,92 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:36
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+BACKFILL_SEARCH_SQL = """
+UPDATE speakers_speakerprofile AS profile
+SET search_document = concat_ws(
+        ' ', src.name, src.skills, src.organization, src.short_bio,
+        src.country, src.long_bio
+    ),
+    search_vector =
+        setweight(to_tsvector('english', src.name), 'A')
+        || setweight(to_tsvector('english', src.skills), 'B')
+        || setweight(to_tsvector('english', src.organization), 'B')
+        || setweight(to_tsvector('english', src.short_bio), 'C')
+        || setweight(to_tsvector('english', src.country), 'C')
+        || setweight(to_tsvector('english', src.long_bio), 'D')
+FROM (
+    SELECT
+        p.id,
+        concat_ws(' ', u.first_name, u.last_name, u.username) AS name,
+        coalesce(
+            (
+                SELECT string_agg(t.name, ' ')
+                FROM speakers_speakerskilltag AS t
+                WHERE t.speaker_id = p.id
+            ),
+            ''
+        ) AS skills,
+        coalesce(p.organization, '') AS organization,
+        coalesce(p.short_bio, '') AS short_bio,
+        coalesce(p.country, '') AS country,
+        coalesce(p.long_bio, '') AS long_bio
+    FROM speakers_speakerprofile AS p
+    JOIN users_user AS u ON u.id = p.user_account_id
+) AS src
+WHERE src.id = profile.id;
+"""
+
+# the search indexes are PostgreSQL only; SQLite uses the FTS5 table of 0017
+SEARCH_INDEX_SQL = (
+    'CREATE EXTENSION IF NOT EXISTS "pg_trgm";',
+    "CREATE INDEX speakers_search_vector_idx "
+    "ON speakers_speakerprofile USING gin (search_vector);",
+    "CREATE INDEX speakers_search_trgm_idx "
+    "ON speakers_speakerprofile USING gin (search_document gin_trgm_ops);",
+    BACKFILL_SEARCH_SQL,
+)
+
+
+def create_search_indexes(apps, schema_editor):
+    """Create the search indexes and fill the documents on PostgreSQL."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for statement in SEARCH_INDEX_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_search_indexes(apps, schema_editor):
+    """Drop the search indexes on PostgreSQL."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS speakers_search_trgm_idx;")
+    schema_editor.execute("DROP INDEX IF EXISTS speakers_search_vector_idx;")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("speakers", "0014_add_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="speakerprofile",
+            name="search_document",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Searchable text of the profile, maintained by speakers.search.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="speakerprofile",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:39
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("speakers", "0015_speakerprofile_search"),
+        ("users", "0003_add_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SpeakerSuggestionState",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="speaker_suggestion_state",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "follows_changed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("computed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["follows_changed_at", "computed_at"],
+                        name="speakers_sugg_state_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SpeakerSuggestion",
+            fields=[
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "rank",
+                    models.PositiveSmallIntegerField(
+                        help_text="1 is the best suggestion."
+                    ),
+                ),
+                ("score", models.FloatField()),
+                (
+                    "speaker",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="suggested_to",
+                        to="speakers.speakerprofile",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="speaker_suggestions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "rank"], name="speakers_sugg_user_rank_idx"
+                    )
+                ],
+                "unique_together": {("user", "speaker")},
+            },
+        ),
+    ]
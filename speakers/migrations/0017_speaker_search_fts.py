@@ -0,0 +1,72 @@
+from django.db import migrations
+
+FTS_TABLE = "speakers_search_fts"
+FTS_VOCAB_TABLE = "speakers_search_fts_vocab"
+
+# document columns of speakers.search.SEARCH_COLUMNS, in order
+FTS_COLUMNS = ("name", "skills", "organization", "short_bio", "country", "long_bio")
+
+
+def create_fts_tables(apps, schema_editor):
+    """Create and fill the FTS5 search table used instead of tsvector on SQLite."""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    SpeakerProfile = apps.get_model("speakers", "SpeakerProfile")
+    names = ", ".join(FTS_COLUMNS)
+    placeholders = ", ".join(["%s"] * len(FTS_COLUMNS))
+    rows = []
+    profiles = SpeakerProfile.objects.select_related("user_account").prefetch_related(
+        "skill_tags"
+    )
+    for profile in profiles.iterator(chunk_size=500):
+        user = profile.user_account
+        rows.append(
+            (
+                str(profile.pk),
+                " ".join(
+                    part
+                    for part in (user.first_name, user.last_name, user.username)
+                    if part
+                ),
+                " ".join(tag.name for tag in profile.skill_tags.all() if tag.name),
+                profile.organization or "",
+                profile.short_bio or "",
+                profile.country or "",
+                profile.long_bio or "",
+            )
+        )
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            f"USING fts5(profile_id UNINDEXED, {names})"
+        )
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_VOCAB_TABLE} "
+            f"USING fts5vocab({FTS_TABLE}, 'row')"
+        )
+        # new connections create the table empty; refill it from scratch
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE} (profile_id, {names}) "
+            f"VALUES (%s, {placeholders})",
+            rows,
+        )
+
+
+def drop_fts_tables(apps, schema_editor):
+    """Drop the FTS5 search tables."""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_VOCAB_TABLE}")
+        cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("speakers", "0016_speaker_suggestions"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_tables, drop_fts_tables),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-16 23:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("speakers", "0017_speaker_search_fts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="speakerprofile",
+            name="image_renditions",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Rendered thumbnails of the image, kept by base.renditions.",
+            ),
+        ),
+    ]
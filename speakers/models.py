@@ -1,12 +1,14 @@
 """speakers models."""
 
 import uuid
-from itertools import count
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.utils import timezone
 from django.utils.text import slugify
 
-from base.models import SocialLinks, TimeStampedModel
+from base.models import SocialLinks, TimeStampedModel, UniqueSlugMixin
+from speakers.managers import SpeakerProfileQuerySet
 from users.models import User
 
 # Speakers file upload directory
@@ -68,7 +70,7 @@ class SpeakerExperiences(TimeStampedModel):
         return f"{self.event_name} - {self.topic}"
 
 
-class SpeakerProfile(TimeStampedModel):
+class SpeakerProfile(UniqueSlugMixin, TimeStampedModel):
     """speakers model."""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -85,13 +87,43 @@ class SpeakerProfile(TimeStampedModel):
     long_bio = models.TextField(blank=True, null=True)
     country = models.CharField(max_length=255, blank=True)
     avatar = models.ImageField(upload_to=SPEAKERS_UPLOAD_DIR, blank=True)
+    image_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Rendered thumbnails of the image, kept by base.renditions.",
+    )
     slug = models.SlugField(unique=True)
+    followers_count = models.PositiveIntegerField(
+        default=0, help_text="Number of users following this speaker."
+    )
+    following_count = models.PositiveIntegerField(
+        default=0, help_text="Number of speakers this speaker's user follows."
+    )
+    search_document = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Searchable text of the profile, maintained by speakers.search.",
+    )
+    # weighted tsvector of search_document on PostgreSQL; GIN-indexed in 0015
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = SpeakerProfileQuerySet.as_manager()
+
+    class Meta:
+        """meta options."""
+
+        indexes = [
+            # keyset pagination of the speaker list (base.pagination)
+            models.Index(fields=["created_at", "id"], name="speakers_created_id_idx"),
+        ]
 
     def __str__(self):
         """String representation of the speaker profile."""
         return self.user_account.username
 
-    def _base_slug(self) -> str:
+    def get_slug_source(self) -> str:
         """Build a base slug from available user info with sensible fallbacks."""
         first = (self.user_account.first_name or "").strip()
         last = (self.user_account.last_name or "").strip()
@@ -102,25 +134,13 @@ class SpeakerProfile(TimeStampedModel):
             return s
         return str(self.user_account.id)
 
-    def _generate_unique_slug(self) -> str:
-        """Generate a unique slug, appending numeric suffix when needed."""
-        base = self._base_slug()
-        candidate = base
-        for i in count(2):
-            exists = (
-                SpeakerProfile.objects.filter(slug=candidate)
-                .exclude(pk=self.pk)
-                .exists()
-            )
-            if not exists:
-                return candidate
-            candidate = f"{base}-{i}"
-        return "default-slug"
-
     def save(self, *args, **kwargs):
         """Set slug once when empty and keep it stable across updates."""
-        if not self.slug:
-            self.slug = self._generate_unique_slug()
+        if self._state.adding and self.user_account_id:
+            # the user may already follow speakers through another profile
+            self.following_count = SpeakerFollow.objects.filter(
+                follower_id=self.user_account_id
+            ).count()
         super().save(*args, **kwargs)
 
     @property
@@ -130,11 +150,6 @@ class SpeakerProfile(TimeStampedModel):
         """
         return self.skill_tags
 
-    @property
-    def followers_count(self) -> int:
-        """Return the number of users following this speaker."""
-        return self.followers.count()
-
 
 class SpeakerSocialLinks(SocialLinks):
     """speaker social link model."""
@@ -179,3 +194,65 @@ class SpeakerFollow(TimeStampedModel):
     def __str__(self):
         """String representation of a follow relationship."""
         return f"{self.follower.username} → {self.speaker}"
+
+
+class SpeakerSuggestion(TimeStampedModel):
+    """Precomputed "speakers you may like" entry for a user.
+
+    Rows are written by ``speakers.suggestions.refresh_suggestions``; the
+    suggestions endpoint only reads them.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="speaker_suggestions"
+    )
+    speaker = models.ForeignKey(
+        SpeakerProfile, on_delete=models.CASCADE, related_name="suggested_to"
+    )
+    rank = models.PositiveSmallIntegerField(help_text="1 is the best suggestion.")
+    score = models.FloatField()
+
+    class Meta:
+        """meta options."""
+
+        unique_together = ("user", "speaker")
+        indexes = [
+            models.Index(fields=["user", "rank"], name="speakers_sugg_user_rank_idx")
+        ]
+
+    def __str__(self):
+        """String representation of a suggestion."""
+        return f"{self.speaker} for {self.user.username} (#{self.rank})"
+
+
+class SpeakerSuggestionState(models.Model):
+    """Tracks whose suggestions are out of date.
+
+    ``follows_changed_at`` is bumped whenever the user follows or unfollows
+    someone; users whose follows changed after ``computed_at`` are recomputed
+    on the next run.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="speaker_suggestion_state",
+    )
+    follows_changed_at = models.DateTimeField(default=timezone.now)
+    computed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        """meta options."""
+
+        indexes = [
+            models.Index(
+                fields=["follows_changed_at", "computed_at"],
+                name="speakers_sugg_state_idx",
+            )
+        ]
+
+    def __str__(self):
+        """String representation of the suggestion state."""
+        return f"suggestions for {self.user.username}"
@@ -0,0 +1,215 @@
+"""speakers search.
+
+Speakers are searched through a stored document per profile. On PostgreSQL
+the document is a weighted ``tsvector`` (``SpeakerProfile.search_vector``)
+behind a GIN index, with a pg_trgm index on ``search_document`` for typo
+tolerant matches. On SQLite (local and test databases) an FTS5 table takes
+their place. Migration 0017 fills it, and it is created when missing on
+every new SQLite connection, since test databases built without migrations
+never run 0017.
+"""
+
+import difflib
+import re
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import F, Value
+
+from speakers.models import SpeakerProfile
+
+SEARCH_CONFIG = "english"
+TRIGRAM_THRESHOLD = 0.3
+
+# document columns with their tsvector weight and FTS5 bm25 weight
+SEARCH_COLUMNS = {
+    "name": ("A", 10.0),
+    "skills": ("B", 5.0),
+    "organization": ("B", 4.0),
+    "short_bio": ("C", 3.0),
+    "country": ("C", 2.0),
+    "long_bio": ("D", 1.0),
+}
+
+# SpeakerProfile fields that feed the document
+PROFILE_SEARCH_FIELDS = {"organization", "short_bio", "long_bio", "country"}
+USER_SEARCH_FIELDS = {"first_name", "last_name", "username"}
+
+FTS_TABLE = "speakers_search_fts"
+FTS_VOCAB_TABLE = "speakers_search_fts_vocab"
+
+
+def _is_postgres() -> bool:
+    """Return True when the default database is PostgreSQL."""
+    return connection.vendor == "postgresql"
+
+
+def ensure_fts_table(db_connection) -> None:
+    """Create the FTS5 table and its vocabulary view if missing."""
+    columns = ", ".join(SEARCH_COLUMNS)
+    with db_connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            f"USING fts5(profile_id UNINDEXED, {columns})"
+        )
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_VOCAB_TABLE} "
+            f"USING fts5vocab({FTS_TABLE}, 'row')"
+        )
+
+
+def _terms(query: str) -> list:
+    """Split a user query into lower-cased word terms."""
+    return re.findall(r"\w+", query.lower())
+
+
+def search_columns(profile: SpeakerProfile) -> dict:
+    """Return the searchable text of ``profile`` keyed by document column.
+
+    ``profile`` should come with ``user_account`` and ``skill_tags`` loaded.
+    """
+    user = profile.user_account
+    return {
+        "name": " ".join(
+            part for part in (user.first_name, user.last_name, user.username) if part
+        ),
+        "skills": " ".join(tag.name for tag in profile.skill_tags.all() if tag.name),
+        "organization": profile.organization or "",
+        "short_bio": profile.short_bio or "",
+        "country": profile.country or "",
+        "long_bio": profile.long_bio or "",
+    }
+
+
+def index_speakers(profile_ids) -> None:
+    """Rebuild the stored search document of the given speaker profiles."""
+    profiles = (
+        SpeakerProfile.objects.filter(pk__in=list(profile_ids))
+        .select_related("user_account")
+        .prefetch_related("skill_tags")
+    )
+    for profile in profiles:
+        columns = search_columns(profile)
+        document = " ".join(text for text in columns.values() if text)
+        updates = {"search_document": document}
+        if _is_postgres():
+            updates["search_vector"] = _weighted_vector(columns)
+        SpeakerProfile.objects.filter(pk=profile.pk).update(**updates)
+        if not _is_postgres():
+            _fts_upsert(profile.pk, columns)
+
+
+def unindex_speaker(profile_id) -> None:
+    """Drop a deleted profile from the search index."""
+    if not _is_postgres():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {FTS_TABLE} WHERE profile_id = %s",
+                [str(profile_id)],
+            )
+
+
+def search_speakers(query: str, limit: int) -> list:
+    """Return the ids of the profiles best matching ``query``, best first.
+
+    Full-text matches are preferred; when there are none the query is
+    retried against close spellings of its words.
+    """
+    if not _terms(query):
+        return []
+    if _is_postgres():
+        return _pg_search(query, limit) or _pg_trigram_search(query, limit)
+    return _fts_search(query, limit) or _fts_fuzzy_search(query, limit)
+
+
+# ── PostgreSQL ───────────────────────────────────────────────────────────────
+
+
+def _weighted_vector(columns: dict):
+    """Build the weighted tsvector expression for a document."""
+    vector = None
+    for column, (weight, _) in SEARCH_COLUMNS.items():
+        part = SearchVector(Value(columns[column]), weight=weight, config=SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def _pg_search(query: str, limit: int) -> list:
+    """Rank profiles by full-text relevance."""
+    search_query = SearchQuery(query, search_type="websearch", config=SEARCH_CONFIG)
+    return list(
+        SpeakerProfile.objects.filter(search_vector=search_query)
+        .annotate(rank=SearchRank(F("search_vector"), search_query))
+        .order_by("-rank", "pk")
+        .values_list("pk", flat=True)[:limit]
+    )
+
+
+def _pg_trigram_search(query: str, limit: int) -> list:
+    """Rank profiles by trigram word similarity, for misspelled queries."""
+    return list(
+        SpeakerProfile.objects.filter(search_document__trigram_word_similar=query)
+        .annotate(similarity=TrigramWordSimilarity(query, "search_document"))
+        .filter(similarity__gte=TRIGRAM_THRESHOLD)
+        .order_by("-similarity", "pk")
+        .values_list("pk", flat=True)[:limit]
+    )
+
+
+# ── SQLite FTS5 ──────────────────────────────────────────────────────────────
+
+
+def _fts_upsert(profile_id, columns: dict) -> None:
+    """Replace the FTS5 row of a profile."""
+    names = ", ".join(SEARCH_COLUMNS)
+    placeholders = ", ".join(["%s"] * len(SEARCH_COLUMNS))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {FTS_TABLE} WHERE profile_id = %s",
+            [str(profile_id)],
+        )
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (profile_id, {names}) "
+            f"VALUES (%s, {placeholders})",
+            [str(profile_id), *(columns[name] for name in SEARCH_COLUMNS)],
+        )
+
+
+def _fts_match(expression: str, limit: int) -> list:
+    """Run an FTS5 MATCH ranked by weighted bm25."""
+    # the first weight belongs to the unindexed profile_id column
+    weights = ", ".join(["0"] + [str(bm25) for _, bm25 in SEARCH_COLUMNS.values()])
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT profile_id FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s "
+            f"ORDER BY bm25({FTS_TABLE}, {weights}), profile_id LIMIT %s",
+            [expression, limit],
+        )
+        return [SpeakerProfile._meta.pk.to_python(row[0]) for row in cursor]
+
+
+def _fts_search(query: str, limit: int) -> list:
+    """Match every query word as a prefix."""
+    expression = " AND ".join(f'"{term}"*' for term in _terms(query))
+    return _fts_match(expression, limit)
+
+
+def _fts_fuzzy_search(query: str, limit: int) -> list:
+    """Match indexed words spelled closely to the query words."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT term FROM {FTS_VOCAB_TABLE}")
+        vocabulary = [row[0] for row in cursor]
+    candidates = {
+        match
+        for term in _terms(query)
+        for match in difflib.get_close_matches(term, vocabulary, n=3, cutoff=0.75)
+    }
+    if not candidates:
+        return []
+    return _fts_match(" OR ".join(f'"{term}"' for term in sorted(candidates)), limit)
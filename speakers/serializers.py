@@ -3,18 +3,27 @@
 from django.db import transaction
 from drf_writable_nested.serializers import WritableNestedModelSerializer
 from rest_framework.exceptions import ValidationError
-from rest_framework.serializers import ModelSerializer, SerializerMethodField
+from rest_framework.serializers import (
+    ListField,
+    ModelSerializer,
+    Serializer,
+    SerializerMethodField,
+    SlugField,
+)
 
+from base.middleware import TimedSerializerMixin
+from base.renditions import RenditionsField, rendition_urls
 from speakers.models import (
     SpeakerExperiences,
     SpeakerFollow,
     SpeakerProfile,
     SpeakerSkillTag,
     SpeakerSocialLinks,
+    SpeakerSuggestion,
 )
 
 
-class SpeakerSocialLinksSerializer(ModelSerializer):
+class SpeakerSocialLinksSerializer(TimedSerializerMixin, ModelSerializer):
     """speaker social links serializers."""
 
     class Meta:
@@ -24,7 +33,7 @@ class SpeakerSocialLinksSerializer(ModelSerializer):
         exclude = ["created_at", "updated_at", "speaker"]
 
 
-class SpeakerSkillTagSerializer(ModelSerializer):
+class SpeakerSkillTagSerializer(TimedSerializerMixin, ModelSerializer):
     """speaker skill tag serializers."""
 
     class Meta:
@@ -34,7 +43,7 @@ class SpeakerSkillTagSerializer(ModelSerializer):
         exclude = ["created_at", "updated_at", "speaker"]
 
 
-class SpeakerExperiencesSerializer(ModelSerializer):
+class SpeakerExperiencesSerializer(TimedSerializerMixin, ModelSerializer):
     """speaker experiences serializer."""
 
     class Meta:
@@ -53,7 +62,7 @@ class SpeakerExperiencesSerializer(ModelSerializer):
         return super().create(validated_data)
 
 
-class SpeakerFollowSerializer(ModelSerializer):
+class SpeakerFollowSerializer(TimedSerializerMixin, ModelSerializer):
     """Serializer for the SpeakerFollow model."""
 
     follower_username = SerializerMethodField()
@@ -70,12 +79,124 @@ class SpeakerFollowSerializer(ModelSerializer):
         return obj.follower.username
 
 
-class FollowerDetailSerializer(ModelSerializer):
-    """Rich serializer returning speaker profile info for followers/following lists."""
+class SpeakerFollowStatusQuerySerializer(TimedSerializerMixin, Serializer):
+    """Slugs of the speakers whose follow status is requested."""
+
+    MAX_SLUGS = 200
+
+    slugs = ListField(child=SlugField(), allow_empty=False, max_length=MAX_SLUGS)
+
+
+class SpeakerCardSerializer(TimedSerializerMixin, ModelSerializer):
+    """Slim speaker card for pages listing many speakers.
+
+    Querysets should join ``user_account`` in and come from
+    ``with_social_stats`` for ``is_following``; cards never query on their own.
+    """
+
+    speaker_name = SerializerMethodField()
+    avatar_renditions = RenditionsField(source="avatar")
+    is_following = SerializerMethodField()
+
+    class Meta:
+        """meta options."""
+
+        model = SpeakerProfile
+        fields = [
+            "id",
+            "slug",
+            "speaker_name",
+            "avatar",
+            "avatar_renditions",
+            "short_bio",
+            "organization",
+            "country",
+            "followers_count",
+            "is_following",
+        ]
+
+    def get_speaker_name(self, obj) -> str:
+        """Return the speaker's display name."""
+        user = obj.user_account
+        full = f"{(user.first_name or '').strip()} {(user.last_name or '').strip()}"
+        return full.strip() or user.username
+
+    def get_is_following(self, obj) -> bool:
+        """Return the ``with_social_stats`` answer for the viewer."""
+        return getattr(obj, "viewer_is_following", False)
+
+
+class SpeakerSuggestionSerializer(TimedSerializerMixin, ModelSerializer):
+    """A precomputed speaker suggestion with the speaker's card fields."""
+
+    slug = SerializerMethodField()
+    full_name = SerializerMethodField()
+    avatar = SerializerMethodField()
+    avatar_renditions = RenditionsField(source="speaker.avatar")
+    short_bio = SerializerMethodField()
+    organization = SerializerMethodField()
+    followers_count = SerializerMethodField()
+
+    class Meta:
+        """meta options."""
+
+        model = SpeakerSuggestion
+        fields = [
+            "slug",
+            "full_name",
+            "avatar",
+            "avatar_renditions",
+            "short_bio",
+            "organization",
+            "followers_count",
+            "rank",
+            "score",
+        ]
+
+    def get_slug(self, obj) -> str:
+        """Return the suggested speaker's slug."""
+        return obj.speaker.slug
+
+    def get_full_name(self, obj) -> str:
+        """Return the suggested speaker's display name."""
+        user = obj.speaker.user_account
+        full = f"{(user.first_name or '').strip()} {(user.last_name or '').strip()}"
+        return full.strip() or user.username
+
+    def get_avatar(self, obj):
+        """Return the avatar URL."""
+        avatar = obj.speaker.avatar
+        if not avatar:
+            return None
+        request = self.context.get("request")
+        return request.build_absolute_uri(avatar.url) if request else avatar.url
+
+    def get_short_bio(self, obj) -> str:
+        """Return the short bio."""
+        return obj.speaker.short_bio or ""
+
+    def get_organization(self, obj) -> str:
+        """Return the organization."""
+        return obj.speaker.organization or ""
+
+    def get_followers_count(self, obj) -> int:
+        """Return the stored follower count."""
+        return obj.speaker.followers_count
+
+
+class FollowerDetailSerializer(TimedSerializerMixin, ModelSerializer):
+    """Rich serializer returning speaker profile info for followers/following lists.
+
+    Views should prefetch the user's speaker profiles into ``PROFILES_ATTR``
+    so the profile fields are served without a query per row.
+    """
+
+    PROFILES_ATTR = "prefetched_speaker_profiles"
 
     username = SerializerMethodField()
     full_name = SerializerMethodField()
     avatar = SerializerMethodField()
+    avatar_renditions = SerializerMethodField()
     slug = SerializerMethodField()
     short_bio = SerializerMethodField()
     country = SerializerMethodField()
@@ -90,6 +211,7 @@ class FollowerDetailSerializer(ModelSerializer):
             "username",
             "full_name",
             "avatar",
+            "avatar_renditions",
             "slug",
             "short_bio",
             "country",
@@ -99,7 +221,16 @@ class FollowerDetailSerializer(ModelSerializer):
 
     def _get_profile(self, user):
         """Get the SpeakerProfile for a user, if it exists."""
-        return SpeakerProfile.objects.filter(user_account=user).first()
+        cache = self.context.setdefault("_profiles", {})
+        if user.pk not in cache:
+            profiles = getattr(user, self.PROFILES_ATTR, None)
+            if profiles is not None:
+                cache[user.pk] = profiles[0] if profiles else None
+            else:
+                cache[user.pk] = SpeakerProfile.objects.filter(
+                    user_account=user
+                ).first()
+        return cache[user.pk]
 
     def _get_user(self, obj):
         """Get the relevant user depending on context (follower or following)."""
@@ -127,6 +258,11 @@ class FollowerDetailSerializer(ModelSerializer):
             return profile.avatar.url
         return None
 
+    def get_avatar_renditions(self, obj) -> dict | None:
+        """Return the avatar thumbnail URLs."""
+        profile = self._get_profile(self._get_user(obj))
+        return rendition_urls(profile.avatar) if profile else None
+
     def get_slug(self, obj):
         """Return the speaker profile slug."""
         profile = self._get_profile(self._get_user(obj))
@@ -148,7 +284,7 @@ class FollowerDetailSerializer(ModelSerializer):
         return profile.organization if profile else ""
 
 
-class SpeakerProfileSerializer(WritableNestedModelSerializer):
+class SpeakerProfileSerializer(TimedSerializerMixin, WritableNestedModelSerializer):
     """speaker profile serializers."""
 
     social_links = SpeakerSocialLinksSerializer(many=True, required=False)
@@ -157,16 +293,20 @@ class SpeakerProfileSerializer(WritableNestedModelSerializer):
     experiences = SpeakerExperiencesSerializer(
         many=True, read_only=True, required=False
     )
-    followers_count = SerializerMethodField()
-    following_count = SerializerMethodField()
     is_following = SerializerMethodField()
+    avatar_renditions = RenditionsField(source="avatar")
 
     class Meta:
         """meta options."""
 
         model = SpeakerProfile
-        exclude = ["created_at", "updated_at"]
-        read_only_fields = ("slug", "user_account")
+        exclude = ["created_at", "updated_at", "image_renditions"]
+        read_only_fields = (
+            "slug",
+            "user_account",
+            "followers_count",
+            "following_count",
+        )
 
     @transaction.atomic
     def create(self, validated_data):
@@ -192,18 +332,16 @@ class SpeakerProfileSerializer(WritableNestedModelSerializer):
         full = f"{first} {last}".strip()
         return full if full else obj.user_account.username
 
-    def get_followers_count(self, obj) -> int:
-        """Return total number of followers for this speaker."""
-        return obj.followers_count
-
-    def get_following_count(self, obj) -> int:
-        """Return how many speakers this speaker follows (their following count)."""
-        return SpeakerFollow.objects.filter(follower=obj.user_account).count()
-
     def get_is_following(self, obj) -> bool:
-        """Return True if the current authenticated user follows this speaker."""
+        """Return True if the current authenticated user follows this speaker.
+
+        Querysets built with ``with_social_stats`` carry the answer for the
+        viewer they were built for; anything else falls back to a query.
+        """
         request = self.context.get("request")
         if request and request.user.is_authenticated:
+            if hasattr(obj, "viewer_is_following"):
+                return obj.viewer_is_following
             return SpeakerFollow.objects.filter(
                 follower=request.user, speaker=obj
             ).exists()
@@ -0,0 +1,175 @@
+"""speakers signals."""
+
+from django.db.backends.signals import connection_created
+from django.db.models import F, Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from base.renditions import track_renditions
+from speakers import search
+from speakers.cache import invalidate_profiles
+from speakers.models import (
+    SpeakerExperiences,
+    SpeakerFollow,
+    SpeakerProfile,
+    SpeakerSkillTag,
+    SpeakerSocialLinks,
+    SpeakerSuggestionState,
+)
+from users.models import User
+
+
+@receiver(connection_created)
+def create_search_table(sender, connection, **kwargs):
+    """Make sure a new SQLite connection has the FTS5 search table."""
+    if connection.vendor == "sqlite":
+        search.ensure_fts_table(connection)
+
+
+@receiver(post_save, sender=SpeakerFollow)
+def increment_follow_counts(sender, instance, created, raw=False, **kwargs):
+    """Bump the stored follow counters when a follow is created."""
+    if not created or raw:
+        return
+    SpeakerProfile.objects.filter(pk=instance.speaker_id).update(
+        followers_count=F("followers_count") + 1
+    )
+    SpeakerProfile.objects.filter(user_account_id=instance.follower_id).update(
+        following_count=F("following_count") + 1
+    )
+
+
+@receiver(post_delete, sender=SpeakerFollow)
+def decrement_follow_counts(sender, instance, **kwargs):
+    """Drop the stored follow counters when a follow is removed."""
+    SpeakerProfile.objects.filter(pk=instance.speaker_id, followers_count__gt=0).update(
+        followers_count=F("followers_count") - 1
+    )
+    SpeakerProfile.objects.filter(
+        user_account_id=instance.follower_id, following_count__gt=0
+    ).update(following_count=F("following_count") - 1)
+
+
+@receiver(post_save, sender=SpeakerFollow)
+def mark_suggestions_stale(sender, instance, created, raw=False, **kwargs):
+    """Queue the follower's suggested speakers for the next refresh."""
+    if not created or raw:
+        return
+    SpeakerSuggestionState.objects.update_or_create(
+        user_id=instance.follower_id,
+        defaults={"follows_changed_at": timezone.now()},
+    )
+
+
+@receiver(post_delete, sender=SpeakerFollow)
+def mark_suggestions_stale_on_unfollow(sender, instance, **kwargs):
+    """Queue a refresh after an unfollow.
+
+    Only existing state rows are touched: following created the row, and the
+    follower may be the user whose deletion cascaded here.
+    """
+    SpeakerSuggestionState.objects.filter(user_id=instance.follower_id).update(
+        follows_changed_at=timezone.now()
+    )
+
+
+def _invalidate_matching_profiles(condition: Q) -> None:
+    """Invalidate the cached bodies of profiles matching ``condition``."""
+    slugs = SpeakerProfile.objects.filter(condition).values_list("slug", flat=True)
+    invalidate_profiles(*slugs)
+
+
+@receiver(post_save, sender=SpeakerProfile)
+@receiver(post_delete, sender=SpeakerProfile)
+def invalidate_profile_cache(sender, instance, **kwargs):
+    """Drop the cached body when a profile changes."""
+    invalidate_profiles(instance.slug)
+
+
+@receiver(post_save, sender=SpeakerSocialLinks)
+@receiver(post_delete, sender=SpeakerSocialLinks)
+@receiver(post_save, sender=SpeakerSkillTag)
+@receiver(post_delete, sender=SpeakerSkillTag)
+@receiver(post_save, sender=SpeakerExperiences)
+@receiver(post_delete, sender=SpeakerExperiences)
+def invalidate_nested_profile_cache(sender, instance, raw=False, **kwargs):
+    """Drop the owning profile's cached body when a nested row changes."""
+    if raw or instance.speaker_id is None:
+        return
+    _invalidate_matching_profiles(Q(pk=instance.speaker_id))
+
+
+@receiver(post_save, sender=SpeakerFollow)
+@receiver(post_delete, sender=SpeakerFollow)
+def invalidate_follow_profile_cache(sender, instance, raw=False, **kwargs):
+    """Drop the cached counts on both sides of a follow."""
+    if raw:
+        return
+    _invalidate_matching_profiles(
+        Q(pk=instance.speaker_id) | Q(user_account_id=instance.follower_id)
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_profile_cache(sender, instance, raw=False, **kwargs):
+    """Drop cached bodies showing the user's name."""
+    if raw:
+        return
+    _invalidate_matching_profiles(Q(user_account_id=instance.pk))
+
+
+@receiver(m2m_changed, sender=SpeakerProfile.events_spoken.through)
+def invalidate_events_spoken_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    """Drop cached bodies when a speaker's events change."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_profiles(instance.slug)
+    elif action == "pre_clear":
+        # a reverse clear doesn't report pk_set, so look the speakers up first
+        _invalidate_matching_profiles(Q(events_spoken=instance))
+    elif action in ("post_add", "post_remove") and pk_set:
+        _invalidate_matching_profiles(Q(pk__in=pk_set))
+
+
+def _touches(update_fields, searched_fields) -> bool:
+    """Return True unless a partial save skipped every searched field."""
+    return update_fields is None or bool(set(update_fields) & searched_fields)
+
+
+@receiver(post_save, sender=SpeakerProfile)
+def index_profile_search(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Refresh a profile's search document when its searched fields change."""
+    if raw or not _touches(update_fields, search.PROFILE_SEARCH_FIELDS):
+        return
+    search.index_speakers([instance.pk])
+
+
+@receiver(post_delete, sender=SpeakerProfile)
+def unindex_profile_search(sender, instance, **kwargs):
+    """Drop a deleted profile from the search index."""
+    search.unindex_speaker(instance.pk)
+
+
+@receiver(post_save, sender=SpeakerSkillTag)
+@receiver(post_delete, sender=SpeakerSkillTag)
+def index_skill_tag_search(sender, instance, raw=False, **kwargs):
+    """Refresh the owning profile's search document when a skill changes."""
+    if raw or instance.speaker_id is None:
+        return
+    search.index_speakers([instance.speaker_id])
+
+
+@receiver(post_save, sender=User)
+def index_user_search(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Refresh the search documents showing the user's name."""
+    if raw or not _touches(update_fields, search.USER_SEARCH_FIELDS):
+        return
+    search.index_speakers(
+        SpeakerProfile.objects.filter(user_account=instance).values_list(
+            "pk", flat=True
+        )
+    )
+
+
+track_renditions(SpeakerProfile, "avatar")
@@ -0,0 +1,196 @@
+"""speakers suggestions.
+
+Offline "speakers you may like" recommendations. Speaker-to-speaker
+similarity is built from three sparse co-occurrence tables (speakers followed
+by the same user, sharing a skill tag, or speaking at the same event), kept as
+``(speaker_a, speaker_b, weight)`` COO frames. A user's candidates are the
+speakers similar to the ones they follow, and the top ``TOP_K`` are stored in
+``SpeakerSuggestion``. Only users whose follows changed since their last run
+are recomputed unless a full refresh is requested.
+"""
+
+import numpy as np
+import pandas as pd
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django_tasks import task
+
+from speakers.models import (
+    SpeakerFollow,
+    SpeakerProfile,
+    SpeakerSkillTag,
+    SpeakerSuggestion,
+    SpeakerSuggestionState,
+)
+
+TOP_K = 20
+
+# relative weight of each similarity signal
+SIGNAL_WEIGHTS = {"follow": 1.0, "event": 0.75, "tag": 0.5}
+
+# groups larger than this (a user following thousands of speakers, a skill
+# everyone lists) say little about similarity and would explode the self-join
+MAX_GROUP_SIZE = 500
+
+USER_BATCH_SIZE = 500
+
+
+def co_occurrence(memberships: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Return cosine-normalised speaker pair weights for shared ``key`` values.
+
+    ``memberships`` has one row per ``(key, speaker)``; the result has one row
+    per ordered pair of distinct speakers sharing at least one key.
+    """
+    memberships = memberships.drop_duplicates()
+    group_sizes = memberships.groupby(key)["speaker"].transform("size")
+    memberships = memberships[group_sizes.between(2, MAX_GROUP_SIZE)]
+    if memberships.empty:
+        return pd.DataFrame(columns=["speaker_a", "speaker_b", "weight"])
+
+    pairs = memberships.merge(memberships, on=key, suffixes=("_a", "_b"))
+    pairs = pairs[pairs["speaker_a"] != pairs["speaker_b"]]
+    weights = pairs.groupby(["speaker_a", "speaker_b"]).size().rename("weight")
+    weights = weights.reset_index()
+
+    degree = memberships.groupby("speaker").size()
+    norm = np.sqrt(
+        degree.loc[weights["speaker_a"]].to_numpy()
+        * degree.loc[weights["speaker_b"]].to_numpy()
+    )
+    weights["weight"] = weights["weight"].to_numpy() / norm
+    return weights
+
+
+def speaker_similarity(follows: pd.DataFrame) -> pd.DataFrame:
+    """Combine the co-follow, co-event and co-tag tables into one."""
+    tags = pd.DataFrame(
+        SpeakerSkillTag.objects.exclude(Q(name=None) | Q(speaker=None)).values_list(
+            Lower("name"), "speaker_id"
+        ),
+        columns=["tag", "speaker"],
+    )
+    events = pd.DataFrame(
+        SpeakerProfile.events_spoken.through.objects.values_list(
+            "event_id", "speakerprofile_id"
+        ),
+        columns=["event", "speaker"],
+    )
+    tables = {
+        "follow": co_occurrence(follows[["user", "speaker"]], "user"),
+        "event": co_occurrence(events, "event"),
+        "tag": co_occurrence(tags, "tag"),
+    }
+    weighted = [
+        table.assign(weight=table["weight"] * SIGNAL_WEIGHTS[name])
+        for name, table in tables.items()
+        if not table.empty
+    ]
+    if not weighted:
+        return pd.DataFrame(columns=["speaker_a", "speaker_b", "weight"])
+    combined = pd.concat(weighted, ignore_index=True)
+    return combined.groupby(["speaker_a", "speaker_b"], as_index=False)["weight"].sum()
+
+
+def top_suggestions(
+    user_ids, follows: pd.DataFrame, similarity: pd.DataFrame, top_k: int = TOP_K
+) -> pd.DataFrame:
+    """Return the ranked ``(user, speaker, score, rank)`` rows for ``user_ids``."""
+    columns = ["user", "speaker", "score", "rank"]
+    seeds = follows[follows["user"].isin(user_ids)]
+    if seeds.empty or similarity.empty:
+        return pd.DataFrame(columns=columns)
+
+    candidates = seeds.merge(similarity, left_on="speaker", right_on="speaker_a")
+    scores = (
+        candidates.groupby(["user", "speaker_b"], as_index=False)["weight"]
+        .sum()
+        .rename(columns={"speaker_b": "speaker", "weight": "score"})
+    )
+
+    # drop speakers the user already follows and the user's own profiles
+    own = pd.DataFrame(
+        SpeakerProfile.objects.filter(user_account_id__in=user_ids).values_list(
+            "user_account_id", "id"
+        ),
+        columns=["user", "speaker"],
+    )
+    seen = pd.concat([seeds[["user", "speaker"]], own], ignore_index=True)
+    scores = scores.merge(seen, on=["user", "speaker"], how="left", indicator=True)
+    scores = scores[scores["_merge"] == "left_only"].drop(columns="_merge")
+
+    scores = scores.sort_values(
+        ["user", "score", "speaker"], ascending=[True, False, True]
+    )
+    scores = scores.groupby("user").head(top_k)
+    scores["rank"] = scores.groupby("user").cumcount() + 1
+    return scores[columns]
+
+
+def stale_user_ids(full: bool = False) -> list:
+    """Return the users whose suggestions must be recomputed.
+
+    Followers without a state row (follows made before suggestions existed)
+    have never been computed and are always included.
+    """
+    states = SpeakerSuggestionState.objects.all()
+    follows = SpeakerFollow.objects.all()
+    if not full:
+        states = states.filter(
+            Q(computed_at=None) | Q(follows_changed_at__gt=F("computed_at"))
+        )
+        follows = follows.filter(follower__speaker_suggestion_state=None)
+    user_ids = set(states.values_list("user_id", flat=True))
+    user_ids.update(follows.values_list("follower_id", flat=True))
+    return sorted(user_ids)
+
+
+def refresh_suggestions(full: bool = False, top_k: int = TOP_K) -> int:
+    """Recompute and store suggestions; return the number of users refreshed."""
+    started_at = timezone.now()
+    user_ids = stale_user_ids(full=full)
+    if not user_ids:
+        return 0
+
+    follows = pd.DataFrame(
+        SpeakerFollow.objects.values_list("follower_id", "speaker_id"),
+        columns=["user", "speaker"],
+    )
+    similarity = speaker_similarity(follows)
+
+    for start in range(0, len(user_ids), USER_BATCH_SIZE):
+        batch = user_ids[start : start + USER_BATCH_SIZE]
+        rows = top_suggestions(batch, follows, similarity, top_k=top_k)
+        with transaction.atomic():
+            SpeakerSuggestion.objects.filter(user_id__in=batch).delete()
+            SpeakerSuggestion.objects.bulk_create(
+                SpeakerSuggestion(
+                    user_id=row.user,
+                    speaker_id=row.speaker,
+                    score=float(row.score),
+                    rank=int(row.rank),
+                )
+                for row in rows.itertuples(index=False)
+            )
+            SpeakerSuggestionState.objects.filter(user_id__in=batch).update(
+                computed_at=started_at
+            )
+            SpeakerSuggestionState.objects.bulk_create(
+                [
+                    SpeakerSuggestionState(
+                        user_id=user_id,
+                        follows_changed_at=started_at,
+                        computed_at=started_at,
+                    )
+                    for user_id in batch
+                ],
+                ignore_conflicts=True,
+            )
+    return len(user_ids)
+
+
+@task()
+def refresh_speaker_suggestions(full: bool = False) -> int:
+    """Background task recomputing speaker suggestions."""
+    return refresh_suggestions(full=full)
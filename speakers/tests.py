@@ -1,7 +1,13 @@
 """speakers app tests."""
 
+import importlib
+from types import SimpleNamespace
+
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient, APITestCase
@@ -352,6 +358,7 @@ class SpeakerFollowModelTests(TestCase):
         self.assertEqual(self.profile.followers_count, 0)
 
         SpeakerFollow.objects.create(follower=self.follower_user, speaker=self.profile)
+        self.profile.refresh_from_db()
         self.assertEqual(self.profile.followers_count, 1)
 
     def test_unique_together_prevents_duplicate_follow(self):
@@ -425,6 +432,7 @@ class SpeakerProfileSerializerFollowFieldsTests(TestCase):
         from speakers.models import SpeakerFollow
 
         SpeakerFollow.objects.create(follower=self.follower_user, speaker=self.profile)
+        self.profile.refresh_from_db()
         serializer = SpeakerProfileSerializer(
             instance=self.profile, context={"request": None}
         )
@@ -697,6 +705,44 @@ class SpeakerFollowersListViewTests(APITestCase):
         res = self.client.get(url)
         self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
 
+    def _follow_list_queries(self, url):
+        """Return the number of queries used to serve ``url``."""
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries), res
+
+    def test_follow_lists_use_constant_queries(self):
+        """Followers and following lists don't query once per row."""
+        from speakers.models import SpeakerFollow
+
+        User = get_user_model()
+        following_url = reverse(
+            "speakers:speaker_following_list", kwargs={"slug": self.profile.slug}
+        )
+        SpeakerFollow.objects.create(follower=self.follower_a, speaker=self.profile)
+        target = self.follower_a.speakers_profile_user.first()
+        SpeakerFollow.objects.create(follower=self.speaker_user, speaker=target)
+        few_followers, _ = self._follow_list_queries(self.list_url)
+        few_following, _ = self._follow_list_queries(following_url)
+
+        for i in range(4):
+            user = User.objects.create(
+                username=f"extra_follower_{i}", email=f"extra_{i}@example.com"
+            )
+            SpeakerFollow.objects.create(follower=user, speaker=self.profile)
+            SpeakerFollow.objects.create(
+                follower=self.speaker_user,
+                speaker=user.speakers_profile_user.first(),
+            )
+        many_followers, res = self._follow_list_queries(self.list_url)
+        many_following, _ = self._follow_list_queries(following_url)
+
+        self.assertEqual(few_followers, many_followers)
+        self.assertEqual(few_following, many_following)
+        row = next(f for f in res.data["followers"] if f["username"] == "follower_a")
+        self.assertEqual(row["slug"], target.slug)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # following_count bug-fix tests
@@ -809,6 +855,7 @@ class FollowingCountFixTests(APITestCase):
         from speakers.models import SpeakerFollow
 
         SpeakerFollow.objects.create(follower=self.user_a, speaker=self.profile_b)
+        self.profile_a.refresh_from_db()
 
         serializer = SpeakerProfileSerializer(
             instance=self.profile_a, context={"request": None}
@@ -822,3 +869,629 @@ class FollowingCountFixTests(APITestCase):
             instance=self.profile_b, context={"request": None}
         )
         self.assertEqual(serializer.data["following_count"], 0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SpeakerProfile.objects.with_social_stats — annotated follow counts
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SpeakerSocialStatsTests(APITestCase):
+    """Tests for the with_social_stats annotation layer."""
+
+    def setUp(self):
+        """Create a viewer and a handful of speakers following each other."""
+        self.client = APIClient()
+        User = get_user_model()
+        self.viewer = User.objects.create(
+            username="stats_viewer", email="stats_viewer@example.com", password="pass"
+        )
+        self.profiles = []
+        for i in range(3):
+            user = User.objects.create(
+                username=f"stats_speaker_{i}",
+                email=f"stats_speaker_{i}@example.com",
+                password="pass",
+            )
+            self.profiles.append(user.speakers_profile_user.first())
+
+    def test_annotations_match_per_object_values(self):
+        """The viewer annotation matches the per-object follow lookup."""
+        from speakers.models import SpeakerFollow
+
+        first, second, _ = self.profiles
+        SpeakerFollow.objects.create(follower=self.viewer, speaker=first)
+        SpeakerFollow.objects.create(follower=second.user_account, speaker=first)
+
+        annotated = SpeakerProfile.objects.with_social_stats(self.viewer).get(
+            pk=first.pk
+        )
+        self.assertEqual(annotated.followers_count, 2)
+        self.assertEqual(annotated.following_count, 0)
+        self.assertTrue(annotated.viewer_is_following)
+
+        annotated = SpeakerProfile.objects.with_social_stats(self.viewer).get(
+            pk=second.pk
+        )
+        self.assertEqual(annotated.followers_count, 0)
+        self.assertEqual(annotated.following_count, 1)
+        self.assertFalse(annotated.viewer_is_following)
+
+    def test_anonymous_viewer_is_never_following(self):
+        """Anonymous viewers get a constant False annotation."""
+        from django.contrib.auth.models import AnonymousUser
+
+        annotated = SpeakerProfile.objects.with_social_stats(AnonymousUser()).first()
+        self.assertFalse(annotated.viewer_is_following)
+
+    def test_list_query_count_does_not_grow_with_speakers(self):
+        """Listing speakers costs the same number of queries for 3 or 6 rows."""
+        url = reverse("speakers:speakers_list_create")
+        self.client.force_authenticate(self.viewer)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(url)
+
+        User = get_user_model()
+        for i in range(3, 6):
+            User.objects.create(
+                username=f"stats_speaker_{i}",
+                email=f"stats_speaker_{i}@example.com",
+                password="pass",
+            )
+        with CaptureQueriesContext(connection) as large:
+            res = self.client.get(url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Stored follower/following counters
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SpeakerFollowCountersTests(APITestCase):
+    """Tests for the denormalized follow counters on SpeakerProfile."""
+
+    def setUp(self):
+        """Create a speaker and two would-be followers."""
+        self.client = APIClient()
+        User = get_user_model()
+        self.speaker_user = User.objects.create(
+            username="counter_speaker", email="counter_speaker@example.com"
+        )
+        self.fan_a = User.objects.create(
+            username="counter_fan_a", email="counter_fan_a@example.com"
+        )
+        self.fan_b = User.objects.create(
+            username="counter_fan_b", email="counter_fan_b@example.com"
+        )
+        self.profile = self.speaker_user.speakers_profile_user.first()
+        self.follow_url = reverse(
+            "speakers:speaker_follow", kwargs={"slug": self.profile.slug}
+        )
+
+    def test_follow_and_unfollow_keep_counters_in_sync(self):
+        """Following and unfollowing through the API updates both counters."""
+        self.client.force_authenticate(self.fan_a)
+        self.client.post(self.follow_url)
+        self.client.force_authenticate(self.fan_b)
+        self.client.post(self.follow_url)
+        self.client.delete(self.follow_url)
+
+        self.profile.refresh_from_db()
+        fan_a_profile = self.fan_a.speakers_profile_user.first()
+        fan_b_profile = self.fan_b.speakers_profile_user.first()
+        self.assertEqual(self.profile.followers_count, 1)
+        self.assertEqual(fan_a_profile.following_count, 1)
+        self.assertEqual(fan_b_profile.following_count, 0)
+
+    def test_deleting_a_follower_decrements_followers_count(self):
+        """Cascade deletes of follow rows keep the counter consistent."""
+        from speakers.models import SpeakerFollow
+
+        SpeakerFollow.objects.create(follower=self.fan_a, speaker=self.profile)
+        self.fan_a.delete()
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.followers_count, 0)
+
+    def test_follow_status_uses_stored_counters(self):
+        """GET /follow/ reads the counters without counting follow rows."""
+        from speakers.models import SpeakerFollow
+
+        SpeakerFollow.objects.create(follower=self.fan_a, speaker=self.profile)
+        self.client.force_authenticate(self.fan_b)
+        with self.assertNumQueries(1):
+            res = self.client.get(self.follow_url)
+        self.assertEqual(res.data["followers_count"], 1)
+
+    def test_recount_command_repairs_drift(self):
+        """recount_speaker_follows rewrites counters that drifted."""
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        from speakers.models import SpeakerFollow
+
+        SpeakerFollow.objects.create(follower=self.fan_a, speaker=self.profile)
+        SpeakerProfile.objects.filter(pk=self.profile.pk).update(followers_count=7)
+
+        out = StringIO()
+        call_command("recount_speaker_follows", stdout=out)
+
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.followers_count, 1)
+        self.assertIn("Repaired 1", out.getvalue())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Keyset pagination of the speaker list
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SpeakerListPaginationTests(APITestCase):
+    """Tests for cursor pagination on the speaker list."""
+
+    def setUp(self):
+        """Create five speakers."""
+        self.client = APIClient()
+        self.url = reverse("speakers:speakers_list_create")
+        User = get_user_model()
+        for i in range(5):
+            User.objects.create(
+                username=f"page_speaker_{i}", email=f"page_speaker_{i}@example.com"
+            )
+
+    def _walk(self, page_size):
+        """Follow ``next`` links and return the slugs seen, in order."""
+        slugs = []
+        res = self.client.get(self.url, {"page_size": page_size})
+        while True:
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(res.data["results"]), page_size)
+            slugs.extend(row["slug"] for row in res.data["results"])
+            if res.data["next"] is None:
+                return slugs
+            res = self.client.get(res.data["next"])
+
+    def test_pages_cover_every_speaker_once_newest_first(self):
+        """Walking the cursor visits each speaker exactly once."""
+        expected = list(
+            SpeakerProfile.objects.order_by("-created_at", "-id").values_list(
+                "slug", flat=True
+            )
+        )
+        self.assertEqual(self._walk(page_size=2), expected)
+
+    def test_ties_on_created_at_are_broken_by_id(self):
+        """Rows sharing a timestamp are neither skipped nor repeated."""
+        SpeakerProfile.objects.update(created_at=timezone.now())
+        slugs = self._walk(page_size=2)
+        self.assertEqual(len(slugs), 5)
+        self.assertEqual(len(set(slugs)), 5)
+
+    def test_default_page_is_bounded(self):
+        """Requests without a cursor get a bounded first page."""
+        with self.settings(CURSOR_PAGINATION_PAGE_SIZE=3):
+            res = self.client.get(self.url)
+        self.assertEqual(len(res.data["results"]), 3)
+        self.assertIsNotNone(res.data["next"])
+
+    def test_invalid_cursor_returns_404(self):
+        """A tampered cursor is rejected."""
+        res = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cached public speaker profile
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SpeakerProfileCacheTests(APITestCase):
+    """Tests for the slug-keyed speaker profile response cache."""
+
+    def setUp(self):
+        """Create a speaker with a skill tag and a viewer."""
+        from django.core.cache import cache
+
+        cache.clear()
+        self.client = APIClient()
+        User = get_user_model()
+        self.speaker_user = User.objects.create(
+            username="cached_speaker", email="cached_speaker@example.com"
+        )
+        self.viewer = User.objects.create(
+            username="cached_viewer", email="cached_viewer@example.com"
+        )
+        self.profile = self.speaker_user.speakers_profile_user.first()
+        self.tag = SpeakerSkillTag.objects.create(
+            speaker=self.profile, name="Django", duration=3
+        )
+        self.url = reverse(
+            "speakers:speakers_retrieve_update_delete",
+            kwargs={"slug": self.profile.slug},
+        )
+
+    def test_anonymous_hit_is_served_without_queries(self):
+        """A warm cache serves anonymous readers without touching the DB."""
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            res = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["skill_tags"][0]["name"], "Django")
+        self.assertFalse(res.data["is_following"])
+
+    def test_is_following_is_merged_per_viewer(self):
+        """Readers share the cached body but see their own is_following."""
+        from speakers.models import SpeakerFollow
+
+        self.client.get(self.url)
+        SpeakerFollow.objects.create(follower=self.viewer, speaker=self.profile)
+
+        self.client.force_authenticate(self.viewer)
+        self.assertTrue(self.client.get(self.url).data["is_following"])
+        self.client.force_authenticate(None)
+        self.assertFalse(self.client.get(self.url).data["is_following"])
+
+    def test_nested_changes_invalidate_the_body(self):
+        """Editing nested rows is visible on the next read."""
+        self.client.get(self.url)
+        self.tag.name = "Flask"
+        self.tag.save()
+        SpeakerSocialLinks.objects.create(
+            speaker=self.profile, name="GitHub", link="https://github.com/cached"
+        )
+
+        res = self.client.get(self.url)
+        self.assertEqual(res.data["skill_tags"][0]["name"], "Flask")
+        self.assertEqual(res.data["social_links"][0]["name"], "GitHub")
+
+    def test_follow_invalidates_both_profiles(self):
+        """Follower counts shown on either side are refreshed after a follow."""
+        from speakers.models import SpeakerFollow
+
+        viewer_url = reverse(
+            "speakers:speakers_retrieve_update_delete",
+            kwargs={"slug": self.viewer.speakers_profile_user.first().slug},
+        )
+        self.client.get(self.url)
+        self.client.get(viewer_url)
+        SpeakerFollow.objects.create(follower=self.viewer, speaker=self.profile)
+
+        self.assertEqual(self.client.get(self.url).data["followers_count"], 1)
+        self.assertEqual(self.client.get(viewer_url).data["following_count"], 1)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Speaker slug allocation
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SpeakerSlugAllocationTests(TestCase):
+    """Tests for allocating unique speaker slugs."""
+
+    def _create_user(self, username):
+        """Create a user called John Smith; signup creates their profile."""
+        return get_user_model().objects.create(
+            username=username,
+            email=f"{username}@example.com",
+            first_name="John",
+            last_name="Smith",
+        )
+
+    def test_common_names_get_increasing_suffixes(self):
+        """Repeated names are numbered after the highest suffix in use."""
+        slugs = [
+            self._create_user(f"john{i}").speakers_profile_user.first().slug
+            for i in range(3)
+        ]
+        self.assertEqual(slugs, ["john-smith", "john-smith-2", "john-smith-3"])
+
+    def test_allocation_is_a_single_query(self):
+        """The free slug is found in one query however many are taken."""
+        from base.slugs import allocate_unique_slug
+
+        for i in range(5):
+            self._create_user(f"john{i}")
+        with self.assertNumQueries(1):
+            slug = allocate_unique_slug(SpeakerProfile, "John Smith")
+        self.assertEqual(slug, "john-smith-6")
+
+    def test_slug_is_truncated_to_the_field_length(self):
+        """Long names still produce slugs that fit the column."""
+        slugs = {
+            get_user_model()
+            .objects.create(
+                username=f"longname{i}",
+                email=f"longname{i}@example.com",
+                first_name="a" * 80,
+            )
+            .speakers_profile_user.first()
+            .slug
+            for i in range(3)
+        }
+        self.assertEqual(len(slugs), 3)
+        for slug in slugs:
+            self.assertLessEqual(
+                len(slug), SpeakerProfile._meta.get_field("slug").max_length
+            )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Speaker search  —  GET /speakers/search/
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SpeakerSearchViewTests(APITestCase):
+    """Tests for the speaker search endpoint."""
+
+    def setUp(self):
+        """Create speakers with distinct names, bios and skills."""
+        self.client = APIClient()
+        self.url = reverse("speakers:speakers_search")
+        User = get_user_model()
+        ada = User.objects.create(
+            username="ada",
+            email="ada@example.com",
+            first_name="Ada",
+            last_name="Lovelace",
+        )
+        self.ada = ada.speakers_profile_user.first()
+        self.ada.short_bio = "Analytical engines and compilers"
+        self.ada.country = "United Kingdom"
+        self.ada.save()
+
+        grace = User.objects.create(
+            username="grace", email="grace@example.com", first_name="Grace"
+        )
+        self.grace = grace.speakers_profile_user.first()
+        self.grace.organization = "Navy"
+        self.grace.long_bio = "Wrote one of the first compilers."
+        self.grace.save()
+        SpeakerSkillTag.objects.create(speaker=self.grace, name="Kubernetes")
+
+    def _slugs(self, query):
+        """Return the slugs found for ``query``."""
+        res = self.client.get(self.url, {"q": query})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [row["slug"] for row in res.data["results"]]
+
+    def test_matches_name_bio_and_skills(self):
+        """Each searched column finds its speaker."""
+        self.assertEqual(self._slugs("lovelace"), [self.ada.slug])
+        self.assertEqual(self._slugs("navy"), [self.grace.slug])
+        self.assertEqual(self._slugs("kubernetes"), [self.grace.slug])
+
+    def test_results_are_ranked_by_relevance(self):
+        """A short bio match ranks above a long bio match."""
+        self.assertEqual(self._slugs("compilers"), [self.ada.slug, self.grace.slug])
+
+    def test_typos_fall_back_to_close_spellings(self):
+        """A misspelled query still finds the speaker."""
+        self.assertEqual(self._slugs("kubernets"), [self.grace.slug])
+
+    def test_index_follows_skill_and_name_changes(self):
+        """Edits to skills and user names are searchable straight away."""
+        SpeakerSkillTag.objects.filter(speaker=self.grace).delete()
+        user = self.ada.user_account
+        user.last_name = "Byron"
+        user.save()
+
+        self.assertEqual(self._slugs("kubernetes"), [])
+        self.assertEqual(self._slugs("byron"), [self.ada.slug])
+
+    def test_query_is_required(self):
+        """A blank query is rejected."""
+        res = self.client.get(self.url, {"q": "  "})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_migration_backfills_existing_profiles(self):
+        """The SQLite migration indexes the profiles already in the database."""
+        from django.apps import apps
+
+        migration = importlib.import_module(
+            "speakers.migrations.0017_speaker_search_fts"
+        )
+        schema_editor = SimpleNamespace(connection=connection)
+        migration.drop_fts_tables(apps, schema_editor)
+        migration.create_fts_tables(apps, schema_editor)
+
+        self.assertEqual(self._slugs("kubernetes"), [self.grace.slug])
+        self.assertEqual(self._slugs("lovelace"), [self.ada.slug])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Bulk follow status  —  POST /speakers/follow-status/
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SpeakerFollowStatusBulkViewTests(APITestCase):
+    """Tests for the bulk follow status endpoint."""
+
+    def setUp(self):
+        """Create a viewer and a grid of speakers, following some of them."""
+        from speakers.models import SpeakerFollow
+
+        self.client = APIClient()
+        self.url = reverse("speakers:speaker_follow_status_bulk")
+        User = get_user_model()
+        self.viewer = User.objects.create(
+            username="grid_viewer", email="grid_viewer@example.com"
+        )
+        self.profiles = [
+            User.objects.create(
+                username=f"grid_speaker_{i}", email=f"grid_speaker_{i}@example.com"
+            ).speakers_profile_user.first()
+            for i in range(4)
+        ]
+        for profile in self.profiles[:2]:
+            SpeakerFollow.objects.create(follower=self.viewer, speaker=profile)
+
+    def test_returns_status_for_every_slug_in_one_query(self):
+        """All requested speakers are answered by a single query."""
+        slugs = [profile.slug for profile in self.profiles]
+        self.client.force_authenticate(self.viewer)
+        with self.assertNumQueries(1):
+            res = self.client.post(self.url, {"slugs": slugs}, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(res.data), set(slugs))
+        self.assertTrue(res.data[slugs[0]]["is_following"])
+        self.assertEqual(res.data[slugs[0]]["followers_count"], 1)
+        self.assertFalse(res.data[slugs[3]]["is_following"])
+        self.assertEqual(res.data[slugs[3]]["followers_count"], 0)
+
+    def test_unknown_slugs_are_omitted(self):
+        """Slugs without a speaker are left out of the response."""
+        self.client.force_authenticate(self.viewer)
+        res = self.client.post(
+            self.url, {"slugs": [self.profiles[0].slug, "nobody"]}, format="json"
+        )
+        self.assertEqual(list(res.data), [self.profiles[0].slug])
+
+    def test_too_many_slugs_are_rejected(self):
+        """Requests above the slug limit are rejected."""
+        self.client.force_authenticate(self.viewer)
+        slugs = [f"speaker-{i}" for i in range(201)]
+        res = self.client.post(self.url, {"slugs": slugs}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_authentication(self):
+        """Anonymous users cannot query follow status."""
+        res = self.client.post(self.url, {"slugs": ["x"]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Suggested speakers  —  GET /speakers/suggestions/
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SpeakerSuggestionsTests(APITestCase):
+    """Tests for the precomputed speaker suggestions."""
+
+    def setUp(self):
+        """Create speakers linked to the viewer's follow by each signal."""
+        from events.models import Event
+        from speakers.models import SpeakerFollow
+
+        self.client = APIClient()
+        self.url = reverse("speakers:speaker_suggestions")
+        User = get_user_model()
+        self.viewer = User.objects.create(
+            username="sugg_viewer", email="sugg_viewer@example.com"
+        )
+        self.other = User.objects.create(
+            username="sugg_other", email="sugg_other@example.com"
+        )
+        self.speakers = {
+            name: User.objects.create(
+                username=f"sugg_{name}", email=f"sugg_{name}@example.com"
+            ).speakers_profile_user.first()
+            for name in ("followed", "co_follow", "co_tag", "co_event", "unrelated")
+        }
+        SpeakerFollow.objects.create(
+            follower=self.viewer, speaker=self.speakers["followed"]
+        )
+        # someone else who follows the same speaker also follows co_follow
+        SpeakerFollow.objects.create(
+            follower=self.other, speaker=self.speakers["followed"]
+        )
+        SpeakerFollow.objects.create(
+            follower=self.other, speaker=self.speakers["co_follow"]
+        )
+        for name in ("followed", "co_tag"):
+            SpeakerSkillTag.objects.create(name="Rust", speaker=self.speakers[name])
+        event = Event.objects.create(title="Suggestion Conf")
+        for name in ("followed", "co_event"):
+            self.speakers[name].events_spoken.add(event)
+
+    def _suggested(self, user):
+        """Return the names of the speakers suggested to ``user``, best first."""
+        from speakers.models import SpeakerSuggestion
+
+        names = {profile.pk: name for name, profile in self.speakers.items()}
+        return [
+            names.get(speaker_id)
+            for speaker_id in SpeakerSuggestion.objects.filter(user=user)
+            .order_by("rank")
+            .values_list("speaker_id", flat=True)
+        ]
+
+    def test_refresh_combines_follow_tag_and_event_signals(self):
+        """Co-followed, co-tagged and co-speaking speakers are suggested."""
+        from speakers.suggestions import refresh_suggestions
+
+        refresh_suggestions()
+
+        self.assertEqual(
+            self._suggested(self.viewer), ["co_follow", "co_event", "co_tag"]
+        )
+
+    def test_refresh_only_recomputes_users_whose_follows_changed(self):
+        """An incremental run skips users already up to date."""
+        from speakers.models import SpeakerFollow
+        from speakers.suggestions import refresh_suggestions
+
+        self.assertEqual(refresh_suggestions(), 2)
+        self.assertEqual(refresh_suggestions(), 0)
+
+        SpeakerFollow.objects.create(
+            follower=self.viewer, speaker=self.speakers["co_follow"]
+        )
+        self.assertEqual(refresh_suggestions(), 1)
+        self.assertNotIn("co_follow", self._suggested(self.viewer))
+        self.assertEqual(refresh_suggestions(full=True), 2)
+
+    def test_refresh_covers_followers_without_state(self):
+        """Follows made before suggestions existed are picked up."""
+        from speakers.models import SpeakerSuggestionState
+        from speakers.suggestions import refresh_suggestions
+
+        SpeakerSuggestionState.objects.all().delete()
+
+        self.assertEqual(refresh_suggestions(), 2)
+        self.assertEqual(
+            self._suggested(self.viewer), ["co_follow", "co_event", "co_tag"]
+        )
+        self.assertEqual(refresh_suggestions(), 0)
+
+    def test_endpoint_reads_stored_suggestions(self):
+        """The endpoint serves the stored rows in rank order."""
+        from speakers.suggestions import refresh_suggestions
+
+        refresh_suggestions()
+        self.client.force_authenticate(self.viewer)
+        with self.assertNumQueries(1):
+            res = self.client.get(self.url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["slug"] for row in res.data["results"]],
+            [self.speakers[name].slug for name in ("co_follow", "co_event", "co_tag")],
+        )
+        self.assertEqual(res.data["results"][0]["rank"], 1)
+
+    def test_endpoint_hides_speakers_followed_since_the_refresh(self):
+        """A speaker followed after the last refresh is not suggested again."""
+        from speakers.models import SpeakerFollow
+        from speakers.suggestions import refresh_suggestions
+
+        refresh_suggestions()
+        SpeakerFollow.objects.create(
+            follower=self.viewer, speaker=self.speakers["co_follow"]
+        )
+        self.client.force_authenticate(self.viewer)
+        res = self.client.get(self.url)
+
+        self.assertNotIn(
+            self.speakers["co_follow"].slug,
+            [row["slug"] for row in res.data["results"]],
+        )
+
+    def test_requires_authentication(self):
+        """Anonymous users have no suggestions."""
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
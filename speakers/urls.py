@@ -35,6 +35,24 @@ urlpatterns = [
         views.SpeakerSkillTagsDetailView.as_view(),
         name="skills_detail",
     ),
+    # Speaker search (must be declared BEFORE generic slug route)
+    path(
+        "speakers/search/",
+        views.SpeakerSearchView.as_view(),
+        name="speakers_search",
+    ),
+    # Follow status of many speakers at once (requires auth)
+    path(
+        "speakers/follow-status/",
+        views.SpeakerFollowStatusBulkView.as_view(),
+        name="speaker_follow_status_bulk",
+    ),
+    # Suggested speakers to follow (requires auth)
+    path(
+        "speakers/suggestions/",
+        views.SpeakerSuggestionsView.as_view(),
+        name="speaker_suggestions",
+    ),
     # Public experiences by speaker slug
     path(
         "speakers/<slug:slug>/experiences/",
@@ -1,9 +1,11 @@
 """speakers app views."""
 
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Prefetch
 from django.http import Http404
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
 from rest_framework import status
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.permissions import (
     AllowAny,
     IsAuthenticated,
@@ -12,22 +14,29 @@ from rest_framework.permissions import (
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from base.pagination import CursorPaginationMixin, cursor_paginated
+from base.renditions import absolute_rendition_urls
+from speakers.cache import get_cached_profile, set_cached_profile
 from speakers.models import (
     SpeakerExperiences,
     SpeakerFollow,
     SpeakerProfile,
     SpeakerSkillTag,
+    SpeakerSuggestion,
 )
+from speakers.search import search_speakers
 from speakers.serializers import (
     FollowerDetailSerializer,
     SpeakerExperiencesSerializer,
+    SpeakerFollowStatusQuerySerializer,
     SpeakerProfileSerializer,
     SpeakerSkillTagSerializer,
+    SpeakerSuggestionSerializer,
 )
 from users.models import User
 
 
-class SpeakerProfileListCreateView(APIView):
+class SpeakerProfileListCreateView(CursorPaginationMixin, APIView):
     """View to list and create speaker profiles."""
 
     def get_permissions(self):
@@ -36,14 +45,21 @@ class SpeakerProfileListCreateView(APIView):
             return [AllowAny()]
         return [IsAuthenticated()]
 
-    @extend_schema(responses=SpeakerProfileSerializer(many=True))
+    @extend_schema(responses=cursor_paginated(SpeakerProfileSerializer))
     def get(self, request):
-        """List all speaker profiles."""
-        speaker_profiles = SpeakerProfile.objects.all()
+        """List speaker profiles, newest first, one page at a time."""
+        speaker_profiles = (
+            SpeakerProfile.objects.select_related("user_account")
+            .prefetch_related(
+                "social_links", "skill_tags", "experiences", "events_spoken"
+            )
+            .with_social_stats(request.user)
+        )
+        page = self.paginate_queryset(speaker_profiles)
         serializer = SpeakerProfileSerializer(
-            speaker_profiles, many=True, context={"request": request}
+            page, many=True, context={"request": request}
         )
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.get_paginated_response(serializer.data)
 
     @extend_schema(request=SpeakerProfileSerializer, responses=SpeakerProfileSerializer)
     def post(self, request):
@@ -54,6 +70,53 @@ class SpeakerProfileListCreateView(APIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+class SpeakerSearchView(APIView):
+    """Search speakers by name, bio, organization, country and skills."""
+
+    permission_classes = [AllowAny]
+    default_limit = 20
+    max_limit = 50
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("q", str, required=True, description="Search text."),
+            OpenApiParameter(
+                "limit", int, description="Maximum number of results (up to 50)."
+            ),
+        ],
+        responses=inline_serializer(
+            name="SpeakerSearchResponse",
+            fields={"results": SpeakerProfileSerializer(many=True)},
+        ),
+    )
+    def get(self, request):
+        """Return the speakers best matching ``q``, most relevant first."""
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": "This query parameter is required."})
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError as err:
+            raise ValidationError({"limit": "A valid integer is required."}) from err
+        limit = min(max(limit, 1), self.max_limit)
+
+        ids = search_speakers(query, limit)
+        profiles = (
+            SpeakerProfile.objects.filter(pk__in=ids)
+            .select_related("user_account")
+            .prefetch_related(
+                "social_links", "skill_tags", "experiences", "events_spoken"
+            )
+            .with_social_stats(request.user)
+            .in_bulk()
+        )
+        ranked = [profiles[pk] for pk in ids if pk in profiles]
+        serializer = SpeakerProfileSerializer(
+            ranked, many=True, context={"request": request}
+        )
+        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+
+
 @extend_schema(request=SpeakerProfileSerializer, responses=SpeakerProfileSerializer)
 class SpeakerProfileRetrieveUpdateDestroyView(APIView):
     """View to retrieve, update, and delete a speaker profile.
@@ -70,20 +133,52 @@ class SpeakerProfileRetrieveUpdateDestroyView(APIView):
             return [AllowAny()]
         return [IsAuthenticated()]
 
-    def get_object(self, slug: str):
+    def get_object(self, slug: str, queryset=None):
         """Get speaker profile by ID."""
+        if queryset is None:
+            queryset = SpeakerProfile.objects.all()
         try:
-            return SpeakerProfile.objects.get(slug=slug)
+            return queryset.get(slug=slug)
         except SpeakerProfile.DoesNotExist as err:
             raise Http404 from err
 
     def get(self, request, slug: str):
-        """Retrieve a specific speaker profile by ID."""
-        speaker_profile = self.get_object(slug)
-        serializer = SpeakerProfileSerializer(
-            speaker_profile, context={"request": request}
+        """Retrieve a specific speaker profile by slug.
+
+        The viewer-independent body is cached per slug (see speakers.cache and
+        the invalidation handlers in speakers.signals); viewer-specific fields
+        are filled in on every request.
+        """
+        data = get_cached_profile(slug)
+        if data is None:
+            speaker_profile = self.get_object(
+                slug,
+                SpeakerProfile.objects.select_related("user_account").prefetch_related(
+                    "social_links", "skill_tags", "experiences", "events_spoken"
+                ),
+            )
+            serializer = SpeakerProfileSerializer(
+                speaker_profile, context={"request": None}
+            )
+            data = dict(serializer.data)
+            set_cached_profile(slug, data)
+        return Response(self.add_viewer_fields(request, data))
+
+    def add_viewer_fields(self, request, data: dict) -> dict:
+        """Return a copy of a cached profile body with the viewer's fields."""
+        data = dict(data)
+        if data.get("avatar"):
+            data["avatar"] = request.build_absolute_uri(data["avatar"])
+        data["avatar_renditions"] = absolute_rendition_urls(
+            request, data.get("avatar_renditions")
         )
-        return Response(serializer.data)
+        data["is_following"] = (
+            request.user.is_authenticated
+            and SpeakerFollow.objects.filter(
+                follower=request.user, speaker_id=data["id"]
+            ).exists()
+        )
+        return data
 
     def patch(self, request, slug: str):
         """Update a specific speaker profile by ID."""
@@ -378,19 +473,18 @@ class SpeakerFollowView(APIView):
     )
     def get(self, request, slug: str) -> Response:
         """Check if the authenticated user is following this speaker."""
-        speaker = self.get_speaker(slug)
-        is_following = SpeakerFollow.objects.filter(
-            follower=request.user, speaker=speaker
-        ).exists()
+        try:
+            speaker = SpeakerProfile.objects.with_social_stats(request.user).get(
+                slug=slug
+            )
+        except SpeakerProfile.DoesNotExist as err:
+            raise Http404 from err
         # following_count = how many speakers THIS speaker follows (not the logged-in user)
-        following_count = SpeakerFollow.objects.filter(
-            follower=speaker.user_account
-        ).count()
         return Response(
             {
-                "is_following": is_following,
+                "is_following": speaker.viewer_is_following,
                 "followers_count": speaker.followers_count,
-                "following_count": following_count,
+                "following_count": speaker.following_count,
             },
             status=status.HTTP_200_OK,
         )
@@ -415,23 +509,24 @@ class SpeakerFollowView(APIView):
                 {"detail": "You cannot follow yourself."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        _, created = SpeakerFollow.objects.get_or_create(
-            follower=request.user, speaker=speaker
-        )
+        # the stored counters are bumped with F() expressions by the
+        # SpeakerFollow signal handlers, inside this same transaction
+        with transaction.atomic():
+            _, created = SpeakerFollow.objects.get_or_create(
+                follower=request.user, speaker=speaker
+            )
         if not created:
             return Response(
                 {"detail": "You are already following this speaker."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        speaker.refresh_from_db(fields=["followers_count", "following_count"])
         # following_count = how many speakers THIS speaker follows (not the logged-in user)
-        following_count = SpeakerFollow.objects.filter(
-            follower=speaker.user_account
-        ).count()
         return Response(
             {
                 "detail": "Successfully followed speaker.",
                 "followers_count": speaker.followers_count,
-                "following_count": following_count,
+                "following_count": speaker.following_count,
             },
             status=status.HTTP_201_CREATED,
         )
@@ -451,28 +546,114 @@ class SpeakerFollowView(APIView):
     def delete(self, request, slug: str) -> Response:
         """Unfollow a speaker. Returns 200 on success, 400 if not following."""
         speaker = self.get_speaker(slug)
-        deleted_count, _ = SpeakerFollow.objects.filter(
-            follower=request.user, speaker=speaker
-        ).delete()
-        if deleted_count == 0:
+        with transaction.atomic():
+            # lock the row so concurrent unfollows decrement the counters once
+            follow = (
+                SpeakerFollow.objects.select_for_update()
+                .filter(follower=request.user, speaker=speaker)
+                .first()
+            )
+            if follow is not None:
+                follow.delete()
+        if follow is None:
             return Response(
                 {"detail": "You are not following this speaker."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        speaker.refresh_from_db(fields=["followers_count", "following_count"])
         # following_count = how many speakers THIS speaker follows (not the logged-in user)
-        following_count = SpeakerFollow.objects.filter(
-            follower=speaker.user_account
-        ).count()
         return Response(
             {
                 "detail": "Successfully unfollowed speaker.",
                 "followers_count": speaker.followers_count,
-                "following_count": following_count,
+                "following_count": speaker.following_count,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+@extend_schema(tags=["speaker follow"])
+class SpeakerFollowStatusBulkView(APIView):
+    """Follow status of many speakers at once, for speaker grids.
+
+    POST /speakers/follow-status/  {"slugs": [...]}
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=SpeakerFollowStatusQuerySerializer,
+        responses={
+            200: {
+                "type": "object",
+                "additionalProperties": {
+                    "type": "object",
+                    "properties": {
+                        "is_following": {"type": "boolean"},
+                        "followers_count": {"type": "integer"},
+                        "following_count": {"type": "integer"},
+                    },
+                },
+            }
+        },
+    )
+    def post(self, request) -> Response:
+        """Return follow state and counts keyed by slug; unknown slugs are left out."""
+        serializer = SpeakerFollowStatusQuerySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        rows = (
+            SpeakerProfile.objects.filter(
+                slug__in=set(serializer.validated_data["slugs"])
+            )
+            .with_social_stats(request.user)
+            .values("slug", "viewer_is_following", "followers_count", "following_count")
+        )
+        return Response(
+            {
+                row["slug"]: {
+                    "is_following": row["viewer_is_following"],
+                    "followers_count": row["followers_count"],
+                    "following_count": row["following_count"],
+                }
+                for row in rows
             },
             status=status.HTTP_200_OK,
         )
 
 
+@extend_schema(tags=["speaker follow"])
+class SpeakerSuggestionsView(APIView):
+    """Suggested speakers for the authenticated user to follow.
+
+    Suggestions are precomputed offline (see ``speakers.suggestions``); this
+    view only reads the stored rows.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        responses=inline_serializer(
+            name="SpeakerSuggestionList",
+            fields={"results": SpeakerSuggestionSerializer(many=True)},
+        )
+    )
+    def get(self, request) -> Response:
+        """Return the stored suggestions, best first."""
+        already_following = SpeakerFollow.objects.filter(
+            follower=request.user, speaker=OuterRef("speaker")
+        )
+        suggestions = (
+            SpeakerSuggestion.objects.filter(user=request.user)
+            .exclude(Exists(already_following))
+            .select_related("speaker__user_account")
+            .order_by("rank")
+        )
+        serializer = SpeakerSuggestionSerializer(
+            suggestions, many=True, context={"request": request}
+        )
+        return Response({"results": serializer.data}, status=status.HTTP_200_OK)
+
+
 @extend_schema(tags=["speaker follow"])
 class SpeakerFollowersListView(APIView):
     """List all followers for a given speaker (public)."""
@@ -490,8 +671,16 @@ class SpeakerFollowersListView(APIView):
     def get(self, request, slug: str) -> Response:
         """List all users following the given speaker."""
         speaker = self.get_speaker(slug)
-        follows = SpeakerFollow.objects.filter(speaker=speaker).select_related(
-            "follower"
+        follows = (
+            SpeakerFollow.objects.filter(speaker=speaker)
+            .select_related("follower")
+            .prefetch_related(
+                Prefetch(
+                    "follower__speakers_profile_user",
+                    queryset=SpeakerProfile.objects.order_by("pk"),
+                    to_attr=FollowerDetailSerializer.PROFILES_ATTR,
+                )
+            )
         )
         serializer = FollowerDetailSerializer(
             follows, many=True, context={"type": "followers"}
@@ -519,15 +708,23 @@ class SpeakerFollowingListView(APIView):
     def get(self, request, slug: str) -> Response:
         """List all speakers that the given speaker follows."""
         speaker = self.get_speaker(slug)
-        follows = SpeakerFollow.objects.filter(
-            follower=speaker.user_account
-        ).select_related("speaker", "speaker__user_account")
+        follows = (
+            SpeakerFollow.objects.filter(follower=speaker.user_account)
+            .select_related("speaker", "speaker__user_account")
+            .prefetch_related(
+                Prefetch(
+                    "speaker__user_account__speakers_profile_user",
+                    queryset=SpeakerProfile.objects.order_by("pk"),
+                    to_attr=FollowerDetailSerializer.PROFILES_ATTR,
+                )
+            )
+        )
         serializer = FollowerDetailSerializer(
             follows, many=True, context={"type": "following"}
         )
         return Response(
             {
-                "following_count": follows.count(),
+                "following_count": speaker.following_count,
                 "following": serializer.data,
             },
             status=status.HTTP_200_OK,
@@ -35,6 +35,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 ]
 
 # OWN APPS
@@ -68,6 +69,7 @@ LOCAL_APPS = [
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    "base.middleware.RequestPerfMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -168,8 +170,51 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ],
+    # the JSON renderer also times sampled requests (base.middleware)
+    "DEFAULT_RENDERER_CLASSES": [
+        "base.middleware.TimedJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
+# keyset pagination for list endpoints (base.pagination)
+CURSOR_PAGINATION_PAGE_SIZE = int(os.getenv("CURSOR_PAGINATION_PAGE_SIZE", "20"))
+CURSOR_PAGINATION_MAX_PAGE_SIZE = int(
+    os.getenv("CURSOR_PAGINATION_MAX_PAGE_SIZE", "100")
+)
+
+# seconds a public speaker profile body stays cached (speakers.cache)
+SPEAKER_PROFILE_CACHE_TIMEOUT = int(os.getenv("SPEAKER_PROFILE_CACHE_TIMEOUT", "600"))
+
+# seconds a rendered page of the public event feed stays cached (events.cache)
+EVENT_FEED_CACHE_TIMEOUT = int(os.getenv("EVENT_FEED_CACHE_TIMEOUT", "300"))
+
+# upper bound in seconds on how long feedback analytics stay cached; entries
+# are keyed on the latest created and updated feedback, so new or edited
+# feedback never hits a stale one (feedbacks.analytics)
+FEEDBACK_ANALYTICS_CACHE_TIMEOUT = int(
+    os.getenv("FEEDBACK_ANALYTICS_CACHE_TIMEOUT", "3600")
+)
+
+# feedback older than this many days is moved to the compressed archive by
+# the archive_feedback command (feedbacks.archive)
+FEEDBACK_ARCHIVE_AFTER_DAYS = int(os.getenv("FEEDBACK_ARCHIVE_AFTER_DAYS", "730"))
+
+# buffered feedback ingestion (feedbacks.ingest): submissions are stored as
+# pending and written in batches, at most this many milliseconds after the
+# first one or as soon as a batch is full
+FEEDBACK_INGEST_BUFFERED = (
+    os.getenv("FEEDBACK_INGEST_BUFFERED", "false").lower() == "true"
+)
+FEEDBACK_INGEST_FLUSH_MS = int(os.getenv("FEEDBACK_INGEST_FLUSH_MS", "500"))
+FEEDBACK_INGEST_BATCH_SIZE = int(os.getenv("FEEDBACK_INGEST_BATCH_SIZE", "200"))
+
+# request instrumentation (base.middleware): share of requests sampled, ring
+# buffer size per process, and whether to expose a Server-Timing header
+PERF_SAMPLE_RATE = float(os.getenv("PERF_SAMPLE_RATE", "0.05"))
+PERF_BUFFER_SIZE = int(os.getenv("PERF_BUFFER_SIZE", "5000"))
+PERF_SERVER_TIMING = os.getenv("PERF_SERVER_TIMING", "false").lower() == "true"
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=10),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
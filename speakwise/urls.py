@@ -10,6 +10,8 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from base.views import PerfReportView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
@@ -20,6 +22,7 @@ urlpatterns = [
     ),
     path("api/docs/redoc/", SpectacularRedocView.as_view(), name="redoc"),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    path("api/_debug/perf/", PerfReportView.as_view(), name="perf_report"),
     path("api/", include("speakers.urls", namespace="speakers")),
     path("api/", include("attendees.urls", namespace="attendees")),
     path("api/", include("talks.urls", namespace="talks")),
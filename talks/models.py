@@ -7,7 +7,7 @@ from django.db import models
 from django.utils.crypto import get_random_string
 from django.utils.text import slugify
 
-from base.models import TimeStampedModel
+from base.models import TimeStampedModel, UniqueSlugMixin
 from events.models import Event
 from speakers.models import SpeakerProfile
 from talks.choices import TalkCategoryChoices
@@ -32,7 +32,7 @@ class Session(TimeStampedModel):
         return self.talk.title
 
 
-class Talks(TimeStampedModel):
+class Talks(UniqueSlugMixin, TimeStampedModel):
     """Talks model."""
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -59,28 +59,22 @@ class Talks(TimeStampedModel):
         blank=True,
     )
 
+    slug_fallback = "talk"
+
     def __str__(self):
         """Str."""
         return self.title
 
-    def _generate_unique_slug(self) -> str:
-        """Generate a unique slug, appending random string for entropy."""
-        base_slug = slugify(self.title) if self.title else "talk"
-        random_suffix = get_random_string(length=12).lower()
-        candidate = f"{base_slug}-{random_suffix}"
-
-        # In the extremely rare case of a collision, try again
-        while Talks.objects.filter(slug=candidate).exclude(pk=self.pk).exists():
-            random_suffix = get_random_string(length=12).lower()
-            candidate = f"{base_slug}-{random_suffix}"
-
-        return candidate
+    def get_slug_source(self) -> str:
+        """Build the slug from the title plus a random string for entropy.
 
-    def save(self, *args, **kwargs):
-        """Set slug once when empty."""
-        if not self.slug:
-            self.slug = self._generate_unique_slug()
-        super().save(*args, **kwargs)
+        The title is cut first so the suffix survives truncation to the
+        column length.
+        """
+        suffix = get_random_string(length=12).lower()
+        max_length = self._meta.get_field("slug").max_length - len(suffix) - 1
+        base_slug = (slugify(self.title) or self.slug_fallback)[:max_length]
+        return f"{base_slug.rstrip('-')}-{suffix}"
 
 
 class TalkReviewComment(TimeStampedModel):
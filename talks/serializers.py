@@ -2,11 +2,12 @@
 
 from rest_framework import serializers
 
+from base.middleware import TimedSerializerMixin
 from events.models import Event
 from talks.models import Session, TalkReviewComment, Talks
 
 
-class SessionSerializer(serializers.ModelSerializer):
+class SessionSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Session serializer."""
 
     class Meta:
@@ -16,7 +17,7 @@ class SessionSerializer(serializers.ModelSerializer):
         exclude = ("created_at", "updated_at", "talk")
 
 
-class TalkSerializer(serializers.ModelSerializer):
+class TalkSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for Talk model."""
 
     speaker_name = serializers.SerializerMethodField()
@@ -61,7 +62,7 @@ class TalkSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class TalkReviewCommentSerializer(serializers.ModelSerializer):
+class TalkReviewCommentSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Talk review comment serializer."""
 
     class Meta:
@@ -96,6 +96,21 @@ class TestTalkSerializer(TestCase):
         assert not serializer.is_valid()
         assert "category" in serializer.errors
 
+    def test_long_title_keeps_random_suffix(self):
+        """Test that a title longer than the slug column keeps its suffix."""
+        talk = Talks.objects.create(
+            title="a" * 300,
+            description="Long title.",
+            speaker=self.speaker_profile,
+            duration=30,
+            category="frontend",
+        )
+
+        base, suffix = talk.slug.rsplit("-", 1)
+        assert len(talk.slug) == 255
+        assert len(suffix) == 12
+        assert base == "a" * 242
+
 
 class TestTalkReviewComment(TestCase):
     """test talk review comment model."""
@@ -8,3 +8,7 @@ class TeamsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "teams"
+
+    def ready(self):
+        """Connect the app's signal handlers."""
+        from teams import signals  # noqa: F401
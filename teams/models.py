@@ -58,6 +58,12 @@ class TeamMember(TimeStampedModel):
         null=True,
         help_text="Profile picture of the team member",
     )
+    image_renditions = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Rendered thumbnails of the image, kept by base.renditions.",
+    )
 
     # Display settings
     is_active = models.BooleanField(
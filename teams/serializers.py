@@ -2,10 +2,12 @@
 
 from rest_framework import serializers
 
+from base.middleware import TimedSerializerMixin
+from base.renditions import RenditionsField
 from teams.models import TeamMember, TeamSocial
 
 
-class TeamSocialSerializer(serializers.ModelSerializer):
+class TeamSocialSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for the TeamSocial model."""
 
     class Meta:
@@ -15,17 +17,18 @@ class TeamSocialSerializer(serializers.ModelSerializer):
         fields = ["name", "link"]
 
 
-class TeamMemberSerializer(serializers.ModelSerializer):
+class TeamMemberSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for the TeamMember model."""
 
     avatar_url = serializers.SerializerMethodField()
+    avatar_renditions = RenditionsField(source="avatar")
     social_links = TeamSocialSerializer(many=True, read_only=True)
 
     class Meta:
         """meta options."""
 
         model = TeamMember
-        exclude = ["is_active", "created_at", "updated_at"]
+        exclude = ["is_active", "created_at", "updated_at", "image_renditions"]
 
     def get_avatar_url(self, obj) -> str | None:
         """Get the full URL for the avatar image."""
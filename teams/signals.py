@@ -0,0 +1,6 @@
+"""teams signals."""
+
+from base.renditions import track_renditions
+from teams.models import TeamMember
+
+track_renditions(TeamMember, "avatar")
@@ -132,6 +132,7 @@ class TestTeamSerializers(TestCase):
             "short_bio",
             "avatar",
             "avatar_url",
+            "avatar_renditions",
             "display_order",
             "social_links",
         }
@@ -284,6 +285,7 @@ class TestTeamMemberListView(APITestCase):
             "short_bio",
             "avatar",
             "avatar_url",
+            "avatar_renditions",
             "display_order",
             "social_links",
         }
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-16 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0002_remove_user_fist_name_alter_user_first_name"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["date_joined", "id"], name="users_joined_id_idx"
+            ),
+        ),
+    ]
@@ -26,3 +26,11 @@ class User(AbstractUser):
     objects = UserManager()
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username", "password"]
+
+    class Meta(AbstractUser.Meta):
+        """meta options."""
+
+        indexes = [
+            # keyset pagination of the user list (base.pagination)
+            models.Index(fields=["date_joined", "id"], name="users_joined_id_idx"),
+        ]
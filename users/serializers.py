@@ -4,11 +4,12 @@ from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from drf_writable_nested.serializers import WritableNestedModelSerializer
 from rest_framework import serializers
 
+from base.middleware import TimedSerializerMixin
 from speakers.serializers import SpeakerProfileSerializer
 from users.models import User
 
 
-class UserSerializer(WritableNestedModelSerializer):
+class UserSerializer(TimedSerializerMixin, WritableNestedModelSerializer):
     """User model serializer."""
 
     class Meta:
@@ -27,14 +28,14 @@ class UserSerializer(WritableNestedModelSerializer):
         extra_kwargs = {"password": {"write_only": True}, "id": {"read_only": True}}
 
 
-class UserLoginSerializer(serializers.Serializer):
+class UserLoginSerializer(TimedSerializerMixin, serializers.Serializer):
     """User login serializer."""
 
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
 
 
-class PasswordResetRequestSerializer(serializers.Serializer):
+class PasswordResetRequestSerializer(TimedSerializerMixin, serializers.Serializer):
     """Serializer for requesting a password reset via email."""
 
     email = serializers.EmailField()
@@ -51,7 +52,7 @@ class PasswordResetRequestSerializer(serializers.Serializer):
         return value
 
 
-class PasswordResetConfirmSerializer(serializers.Serializer):
+class PasswordResetConfirmSerializer(TimedSerializerMixin, serializers.Serializer):
     """Serializer for confirming a password reset with email, token, and new password."""
 
     email = serializers.EmailField()
@@ -89,7 +90,7 @@ class UserProfileSerializer(UserSerializer):
         exclude = ["password"]
 
 
-class LogoutSerializer(serializers.Serializer):
+class LogoutSerializer(TimedSerializerMixin, serializers.Serializer):
     """Serializer for logging out a user by blacklisting a refresh token."""
 
     refresh = serializers.CharField(write_only=True)
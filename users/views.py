@@ -14,6 +14,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from base.pagination import CursorPaginationMixin, cursor_paginated
 from users.filters import UserFilter
 from users.models import User
 from users.serializers import (
@@ -200,15 +201,17 @@ class RetrieveUpdateAuthenticatedUserView(APIView):
         return Response(serializer.data)
 
 
-class UsersListView(APIView):
+class UsersListView(CursorPaginationMixin, APIView):
     """View to list all users."""
 
+    cursor_ordering = ("-date_joined", "-id")
+
     permission_classes = [IsAuthenticated]
 
-    @extend_schema(responses=UserSerializer(many=True))
+    @extend_schema(responses=cursor_paginated(UserSerializer))
     def get(self, request):
-        """List all users."""
+        """List users, newest first, one page at a time."""
         users = User.objects.all()
         user_filters = UserFilter(request.GET, queryset=users)
-        serializer = UserSerializer(user_filters.qs, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = UserSerializer(self.paginate_queryset(user_filters.qs), many=True)
+        return self.get_paginated_response(serializer.data)